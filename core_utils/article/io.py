@@ -2,9 +2,13 @@
 I/O operations for Article.
 """
 import json
+import os
 import pathlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Union
+from types import TracebackType
+from typing import Any, Optional, Union
 
 from core_utils.article.article import (Article, ArtifactType, date_from_meta,
                                         get_article_id_from_filepath)
@@ -91,6 +95,21 @@ def from_meta(path: Union[pathlib.Path, str],
         Article(url=meta.get('url', None), article_id=meta.get('id', 0))
 
     article.article_id = meta.get('id', 0)
+    _fill_meta(article, meta)
+
+    # intentionally leave it empty
+    article.text = ''
+    return article
+
+
+def _fill_meta(article: Article, meta: dict) -> None:
+    """
+    Set meta params of the Article abstraction.
+
+    Args:
+        article (Article): Article instance
+        meta (dict): Meta params loaded from meta.json file
+    """
     article.url = meta.get('url', None)
     article.title = meta.get('title', '')
     article.date = date_from_meta(meta.get('date', None))
@@ -98,6 +117,245 @@ def from_meta(path: Union[pathlib.Path, str],
     article.topics = meta.get('topics', None)
     article.pos_frequencies = meta.get('pos_frequencies', None)
 
-    # intentionally leave it empty
-    article.text = ''
-    return article
+
+class ArticleWriter:
+    """
+    Writer saving raw texts and meta information of articles in batches.
+
+    Every file is written to a temporary file and renamed, so a crash never
+    leaves a truncated file behind. Meta files are renamed after raw texts,
+    so an article with meta information always has its text saved.
+    """
+
+    def __init__(self, batch_size: int = 1, compact: bool = False, fsync: bool = False) -> None:
+        """
+        Initialize an instance of the ArticleWriter class.
+
+        Args:
+            batch_size (int): Number of articles kept in memory before they are written
+            compact (bool): Write meta information without indentation or not
+            fsync (bool): Force written files to disk before renaming them or not;
+                the folder is synced once per batch
+        """
+        self.batch_size = batch_size
+        self.compact = compact
+        self.fsync = fsync
+        self._buffer: list[Article] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'ArticleWriter':
+        """
+        Enter writer context.
+
+        Returns:
+            ArticleWriter: Writer
+        """
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        """
+        Write buffered articles on leaving writer context.
+
+        Args:
+            exc_type (Optional[type[BaseException]]): Exception type
+            exc_value (Optional[BaseException]): Exception raised in the block
+            traceback (Optional[TracebackType]): Traceback of the exception
+        """
+        self.flush()
+
+    def write(self, article: Article) -> None:
+        """
+        Add an article to the batch, writing the batch if it is full.
+
+        Args:
+            article (Article): Article instance
+        """
+        with self._lock:
+            self._buffer.append(article)
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._write_batch(batch)
+
+    def flush(self) -> None:
+        """
+        Write all buffered articles.
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list[Article]) -> None:
+        """
+        Write raw texts and meta information of articles through temporary files.
+
+        Args:
+            batch (list[Article]): Articles to write
+        """
+        separators = (',', ':') if self.compact else (',', ': ')
+        files = [(article.get_raw_text_path(), article.text) for article in batch]
+        files += [(article.get_meta_file_path(),
+                   json.dumps(article.get_meta(), indent=None if self.compact else 4,
+                              ensure_ascii=False, separators=separators))
+                  for article in batch]
+
+        for path, content in files:
+            with open(path.with_name(f'{path.name}.tmp'), 'w', encoding='utf-8') as file:
+                file.write(content)
+                if self.fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+        for path, _ in files:
+            path.with_name(f'{path.name}.tmp').replace(path)
+
+        if self.fsync and os.name == 'posix':
+            for folder in {path.parent for path, _ in files}:
+                folder_descriptor = os.open(folder, os.O_RDONLY)
+                try:
+                    os.fsync(folder_descriptor)
+                finally:
+                    os.close(folder_descriptor)
+
+
+def _read_text(path: Union[pathlib.Path, str]) -> str:
+    """
+    Read a text file.
+
+    Args:
+        path (Union[pathlib.Path, str]): Path to the file
+
+    Returns:
+        str: File content
+    """
+    with open(path, encoding='utf-8') as text_file:
+        return text_file.read()
+
+
+class ArticleTextCache:
+    """
+    Bounded cache of article texts that evicts the least recently used text.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize an instance of the ArticleTextCache class.
+
+        Args:
+            max_size (int): Number of texts kept in memory
+        """
+        self.max_size = max_size
+        self._texts: OrderedDict[Union[pathlib.Path, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Get number of cached texts.
+
+        Returns:
+            int: Number of cached texts
+        """
+        return len(self._texts)
+
+    def get(self, path: Union[pathlib.Path, str]) -> str:
+        """
+        Get text of a raw file, reading it if it is not cached.
+
+        Args:
+            path (Union[pathlib.Path, str]): Path to article raw text
+
+        Returns:
+            str: Article text
+        """
+        with self._lock:
+            if path in self._texts:
+                self._texts.move_to_end(path)
+                return self._texts[path]
+        text = _read_text(path)
+        with self._lock:
+            self._texts[path] = text
+            self._texts.move_to_end(path)
+            while len(self._texts) > self.max_size:
+                self._texts.popitem(last=False)
+        return text
+
+
+class LazyArticle(Article):
+    """
+    Article that reads its text and meta information on first access.
+
+    Without a cache, text stays in the article once it is read. With a cache,
+    the article keeps no text itself, so memory is bounded by the cache size
+    however many articles there are. A text set explicitly replaces the one on disk.
+    """
+
+    #: Meta params loaded from meta.json file on first access to any of them
+    _META_FIELDS = ('url', 'title', 'date', 'author', 'topics', 'pos_frequencies')
+
+    def __init__(self, article_id: int, raw_path: Union[pathlib.Path, str],
+                 meta_path: Optional[Union[pathlib.Path, str]] = None,
+                 cache: Optional[ArticleTextCache] = None) -> None:
+        """
+        Initialize an instance of LazyArticle.
+
+        Args:
+            article_id (int): Article id
+            raw_path (Union[pathlib.Path, str]): Path to article raw text
+            meta_path (Optional[Union[pathlib.Path, str]]): Path to meta info
+            cache (Optional[ArticleTextCache]): Cache shared by articles of a corpus
+        """
+        self._raw_path = raw_path
+        self._meta_path = meta_path
+        self._cache = cache
+        self._text: Optional[str] = None
+        super().__init__(url=None, article_id=article_id)
+        self._text = None
+        for field in self._META_FIELDS:
+            del self.__dict__[field]
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Load meta params on first access to any of them.
+
+        Args:
+            name (str): Attribute name
+
+        Returns:
+            Any: Attribute value
+        """
+        if name not in self._META_FIELDS:
+            raise AttributeError(name)
+        meta_article = Article(url=None, article_id=self.article_id)
+        for field in self._META_FIELDS:
+            setattr(self, field, getattr(meta_article, field))
+        if self._meta_path is not None and os.path.exists(self._meta_path):
+            with open(self._meta_path, encoding='utf-8') as meta_file:
+                _fill_meta(self, json.load(meta_file))
+        return self.__dict__[name]
+
+    @property  # type: ignore[override]
+    def text(self) -> str:
+        """
+        Get article text, reading it on first access.
+
+        Returns:
+            str: Article text
+        """
+        if self._text is not None:
+            return self._text
+        if self._cache is not None:
+            return self._cache.get(self._raw_path)
+        self._text = _read_text(self._raw_path)
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        """
+        Set article text instead of the one on disk.
+
+        Args:
+            text (str): Article text
+        """
+        self._text = text
@@ -1,4 +1,4 @@
-# pylint: disable=too-few-public-methods, disable=too-many-arguments
+# pylint: disable=too-few-public-methods, disable=too-many-arguments, too-many-instance-attributes, too-many-locals
 """
 ConfigDTO class implementation: stores the configuration information.
 """
@@ -29,6 +29,90 @@ class ConfigDTO:
     #: Require headless mode or not
     headless_mode: bool
 
+    #: Number of articles fetched and parsed concurrently
+    num_workers: int
+
+    #: Number of per-host connection pools to cache
+    pool_connections: int
+
+    #: Maximum number of connections kept open to a single host
+    pool_maxsize: int
+
+    #: Reuse connections between requests or not
+    keep_alive: bool
+
+    #: Number of retries for a failed request
+    max_retries: int
+
+    #: Sustained number of requests per second to a single host
+    requests_per_second: float
+
+    #: Number of requests to a single host allowed in a row without waiting
+    burst_size: int
+
+    #: Slow down to Crawl-delay from robots.txt or not
+    respect_crawl_delay: bool
+
+    #: Keep responses on disk and revalidate them with conditional requests or not
+    use_http_cache: bool
+
+    #: Maximum size of the response cache in megabytes
+    http_cache_size_mb: int
+
+    #: Keep already collected articles and only add new ones or not
+    incremental: bool
+
+    #: Maximum number of "next page" links followed from a seed url
+    max_depth: int
+
+    #: Maximum number of listing pages visited during a crawl
+    max_pages: int
+
+    #: Build HTML tree only for the parts of an article page that are parsed or not
+    partial_parsing: bool
+
+    #: Number of processes parsing downloaded pages, 0 to parse in downloading threads
+    parsing_processes: int
+
+    #: CSS selectors of text blocks that make up article text
+    text_selectors: list[str]
+
+    #: Save crawl progress to resume an interrupted crawl or not
+    use_checkpoints: bool
+
+    #: Delay bound before the first retry of a failed request in seconds
+    backoff_factor: float
+
+    #: Largest delay bound before a retry in seconds
+    max_backoff: float
+
+    #: Number of requests in a row failed after all retries that pauses a host
+    circuit_breaker_threshold: int
+
+    #: Number of seconds a failing host is paused for
+    circuit_breaker_timeout: float
+
+    #: Largest allowed size of a downloaded page in megabytes
+    max_page_size_mb: int
+
+    #: Sites crawled in one run, empty to crawl seed urls with common settings
+    sites: list['SiteProfile']
+
+    #: Record time of every crawl stage and report it at the end or not
+    collect_stats: bool
+
+    #: Folder to record downloaded pages to for offline replay, empty not to record them
+    fixtures_path: str
+
+    #: Number of collected articles kept in memory before they are written to disk
+    write_batch_size: int
+
+    #: Write meta information without indentation or not
+    compact_meta: bool
+
+    #: Force written articles to disk before considering them saved or not
+    fsync_writes: bool
+
     def __init__(self,
                  seed_urls: list[str],
                  total_articles_to_find_and_parse: int,
@@ -36,7 +120,35 @@ class ConfigDTO:
                  encoding: str,
                  timeout: int,
                  should_verify_certificate: bool,
-                 headless_mode: bool
+                 headless_mode: bool,
+                 num_workers: int = 1,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 max_retries: int = 0,
+                 requests_per_second: float = 1.0,
+                 burst_size: int = 1,
+                 respect_crawl_delay: bool = True,
+                 use_http_cache: bool = False,
+                 http_cache_size_mb: int = 100,
+                 incremental: bool = False,
+                 max_depth: int = 10,
+                 max_pages: int = 50,
+                 partial_parsing: bool = False,
+                 parsing_processes: int = 0,
+                 text_selectors: list[str] | None = None,
+                 use_checkpoints: bool = True,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0,
+                 circuit_breaker_threshold: int = 5,
+                 circuit_breaker_timeout: float = 60.0,
+                 max_page_size_mb: int = 10,
+                 sites: list[dict] | None = None,
+                 collect_stats: bool = True,
+                 fixtures_path: str = '',
+                 write_batch_size: int = 1,
+                 compact_meta: bool = False,
+                 fsync_writes: bool = False
                  ) -> None:
         """
         Initializes an instance of the ConfigDTO class.
@@ -49,6 +161,44 @@ class ConfigDTO:
             timeout (int): Number of seconds to wait for response
             should_verify_certificate (bool): Should verify certificate or not
             headless_mode (bool): Require headless mode or not
+            num_workers (int): Number of articles fetched and parsed concurrently
+            pool_connections (int): Number of per-host connection pools to cache
+            pool_maxsize (int): Maximum number of connections kept open to a single host
+            keep_alive (bool): Reuse connections between requests or not
+            max_retries (int): Number of retries for a failed request
+            requests_per_second (float): Sustained number of requests per second to a single host
+            burst_size (int): Number of requests to a single host allowed in a row without waiting
+            respect_crawl_delay (bool): Slow down to Crawl-delay from robots.txt or not
+            use_http_cache (bool): Keep responses on disk and revalidate them
+                with conditional requests or not
+            http_cache_size_mb (int): Maximum size of the response cache in megabytes
+            incremental (bool): Keep already collected articles and only add new ones or not
+            max_depth (int): Maximum number of "next page" links followed from a seed url
+            max_pages (int): Maximum number of listing pages visited during a crawl
+            partial_parsing (bool): Build HTML tree only for the parts of an article page
+                that are parsed or not
+            parsing_processes (int): Number of processes parsing downloaded pages,
+                0 to parse in downloading threads
+            text_selectors (list[str] | None): CSS selectors of text blocks
+                that make up article text
+            use_checkpoints (bool): Save crawl progress to resume an interrupted crawl or not
+            backoff_factor (float): Delay bound before the first retry of a failed request
+                in seconds
+            max_backoff (float): Largest delay bound before a retry in seconds
+            circuit_breaker_threshold (int): Number of requests in a row failed
+                after all retries that pauses a host
+            circuit_breaker_timeout (float): Number of seconds a failing host is paused for
+            max_page_size_mb (int): Largest allowed size of a downloaded page in megabytes
+            sites (list[dict] | None): Profiles of sites crawled in one run,
+                None to crawl seed urls with common settings
+            collect_stats (bool): Record time of every crawl stage and report it at the end or not
+            fixtures_path (str): Folder to record downloaded pages to for offline replay,
+                empty not to record them
+            write_batch_size (int): Number of collected articles kept in memory
+                before they are written to disk
+            compact_meta (bool): Write meta information without indentation or not
+            fsync_writes (bool): Force written articles to disk before considering them saved
+                or not
         """
         self.seed_urls = seed_urls
         self.total_articles = total_articles_to_find_and_parse
@@ -57,3 +207,119 @@ class ConfigDTO:
         self.timeout = timeout
         self.should_verify_certificate = should_verify_certificate
         self.headless_mode = headless_mode
+        self.num_workers = num_workers
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self.requests_per_second = requests_per_second
+        self.burst_size = burst_size
+        self.respect_crawl_delay = respect_crawl_delay
+        self.use_http_cache = use_http_cache
+        self.http_cache_size_mb = http_cache_size_mb
+        self.incremental = incremental
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.partial_parsing = partial_parsing
+        self.parsing_processes = parsing_processes
+        self.text_selectors = text_selectors or ['main p']
+        self.use_checkpoints = use_checkpoints
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_timeout = circuit_breaker_timeout
+        self.max_page_size_mb = max_page_size_mb
+        self.sites = [SiteProfile(**site) for site in sites or []]
+        self.collect_stats = collect_stats
+        self.fixtures_path = fixtures_path
+        self.write_batch_size = write_batch_size
+        self.compact_meta = compact_meta
+        self.fsync_writes = fsync_writes
+
+
+class SiteProfile:
+    """
+    Type annotations for a crawled site.
+    """
+    #: Name of the site
+    name: str
+
+    #: Url that relative links on the site are resolved against
+    base_url: str
+
+    #: List of seed urls
+    seed_urls: list[str]
+
+    #: Number of articles to collect from the site
+    total_articles: int
+
+    #: CSS selector of article links on a listing page
+    article_link_selector: str
+
+    #: CSS selector of the "next page" link on a listing page
+    next_page_selector: str
+
+    #: CSS selector of article title
+    title_selector: str
+
+    #: CSS selector of article author
+    author_selector: str
+
+    #: Text preceding the author name in the author element, e.g. "Автор:"
+    author_prefix: str
+
+    #: CSS selectors of text blocks that make up article text
+    text_selectors: list[str]
+
+    #: Sustained number of requests per second to the site, None to use the common one
+    requests_per_second: float | None
+
+    #: Number of requests to the site allowed in a row without waiting, None to use the common one
+    burst_size: int | None
+
+    def __init__(self,
+                 name: str,
+                 base_url: str,
+                 seed_urls: list[str],
+                 total_articles: int,
+                 article_link_selector: str = '.news-list article h2 a',
+                 next_page_selector: str = 'a[rel~=next], .modern-page-next, .pagination .next a',
+                 title_selector: str = 'h1',
+                 author_selector: str = '.author',
+                 author_prefix: str = '',
+                 text_selectors: list[str] | None = None,
+                 requests_per_second: float | None = None,
+                 burst_size: int | None = None
+                 ) -> None:
+        """
+        Initializes an instance of the SiteProfile class.
+
+        Args:
+            name (str): Name of the site
+            base_url (str): Url that relative links on the site are resolved against
+            seed_urls (list[str]): Seed urls
+            total_articles (int): Number of articles to collect from the site
+            article_link_selector (str): CSS selector of article links on a listing page
+            next_page_selector (str): CSS selector of the "next page" link on a listing page
+            title_selector (str): CSS selector of article title
+            author_selector (str): CSS selector of article author
+            author_prefix (str): Text preceding the author name in the author element
+            text_selectors (list[str] | None): CSS selectors of text blocks
+                that make up article text
+            requests_per_second (float | None): Sustained number of requests per second
+                to the site, None to use the common one
+            burst_size (int | None): Number of requests to the site allowed in a row
+                without waiting, None to use the common one
+        """
+        self.name = name
+        self.base_url = base_url
+        self.seed_urls = seed_urls
+        self.total_articles = total_articles
+        self.article_link_selector = article_link_selector
+        self.next_page_selector = next_page_selector
+        self.title_selector = title_selector
+        self.author_selector = author_selector
+        self.author_prefix = author_prefix
+        self.text_selectors = text_selectors or ['main p']
+        self.requests_per_second = requests_per_second
+        self.burst_size = burst_size
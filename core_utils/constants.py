@@ -6,6 +6,10 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSETS_PATH = PROJECT_ROOT / 'tmp' / 'articles'
+HTTP_CACHE_PATH = PROJECT_ROOT / 'tmp' / 'http_cache'
+CRAWL_CHECKPOINT_PATH = PROJECT_ROOT / 'tmp' / 'crawl_checkpoint.json'
+CRAWL_STATS_PATH = PROJECT_ROOT / 'tmp' / 'crawl_stats.json'
+CORPUS_MANIFESTS_PATH = PROJECT_ROOT / 'tmp' / 'manifests'
 CRAWLER_CONFIG_PATH = PROJECT_ROOT / 'lab_5_scrapper' / 'scrapper_config.json'
 PROJECT_CONFIG_PATH = PROJECT_ROOT / 'project_config.json'
 
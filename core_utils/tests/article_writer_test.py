@@ -0,0 +1,68 @@
+"""
+Tests for ArticleWriter.
+"""
+import json
+import shutil
+import unittest
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.article import article
+from core_utils.article.article import Article
+from core_utils.article.io import ArticleWriter, from_meta, from_raw
+
+
+class ArticleWriterTest(unittest.TestCase):
+    """
+    Class for testing batched article writing.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ArticleWriterTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.articles = []
+        for article_id in (1, 2, 3):
+            new_article = Article(f'https://www.nkj.ru/news/{article_id}/', article_id)
+            new_article.title = f'Статья {article_id}'
+            new_article.text = f'Текст статьи {article_id}.'
+            self.articles.append(new_article)
+
+    @pytest.mark.core_utils
+    def test_articles_are_written_in_full_batches_and_on_flush(self) -> None:
+        """
+        Ensure articles stay in memory until a batch is full or the writer is flushed.
+        """
+        with ArticleWriter(batch_size=2, fsync=True) as writer:
+            writer.write(self.articles[0])
+            self.assertEqual(list(TEST_PATH.iterdir()), [])
+            writer.write(self.articles[1])
+            writer.write(self.articles[2])
+            self.assertEqual(sorted(path.name for path in TEST_PATH.iterdir()),
+                             ['1_meta.json', '1_raw.txt', '2_meta.json', '2_raw.txt'])
+        self.assertEqual(len(list(TEST_PATH.glob('*_raw.txt'))), 3)
+        self.assertFalse(list(TEST_PATH.glob('*.tmp')))
+        self.assertEqual(from_raw(TEST_PATH / '3_raw.txt').text, 'Текст статьи 3.')
+        self.assertEqual(from_meta(TEST_PATH / '3_meta.json').title, 'Статья 3')
+
+    @pytest.mark.core_utils
+    def test_compact_meta_has_same_content(self) -> None:
+        """
+        Ensure compact meta information is a single line with the same content.
+        """
+        ArticleWriter().write(self.articles[0])
+        indented = (TEST_PATH / '1_meta.json').read_text(encoding='utf-8')
+        ArticleWriter(compact=True).write(self.articles[0])
+        compact = (TEST_PATH / '1_meta.json').read_text(encoding='utf-8')
+        self.assertNotIn('\n', compact)
+        self.assertLess(len(compact), len(indented))
+        self.assertEqual(json.loads(compact), json.loads(indented))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ArticleWriterTest class.
+        """
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,401 @@
+"""
+Asyncio implementation of the crawler.
+
+Requests are sent with aiohttp, so hundreds of connections are served
+by a single thread, while pages are parsed and articles are written
+in worker threads to keep the event loop free.
+"""
+# pylint: disable=invalid-overridden-method
+import asyncio
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, AsyncIterator, cast, Iterable, Optional, Union
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
+
+from core_utils import constants
+from core_utils.article.article import Article
+from core_utils.config_dto import SiteProfile
+from lab_5_scrapper.collection import (ArticleCollection, finish_crawl, is_collectable,
+                                       MultiSiteCrawler, prepare_collection, report_crawl_stats,
+                                       restore_crawl)
+from lab_5_scrapper.crawler_utils import (apply_encoding, CHUNK_SIZE, CrawlCheckpoint,
+                                          ResponseTooLargeError)
+from lab_5_scrapper.fetching import ensure_host_allowed, finish_attempt, respect_retry_after
+from lab_5_scrapper.scrapper import Config, Crawler, HTMLParser
+
+#: Errors after which a request is repeated
+TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+@asynccontextmanager
+async def open_client_session(config: Config) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Open HTTP client session for asynchronous requests.
+
+    Args:
+        config (Config): Configuration
+
+    Yields:
+        aiohttp.ClientSession: Session with a connection pool of num_workers connections
+    """
+    connector = aiohttp.TCPConnector(limit=config.get_num_workers())
+    async with aiohttp.ClientSession(headers=config.get_headers(),
+                                     connector=connector) as session:
+        yield session
+
+
+async def _send_async_request(url: str, config: Config,
+                              session: aiohttp.ClientSession) -> requests.models.Response:
+    """
+    Make a single request within the rate limit without blocking the event loop.
+
+    Args:
+        url (str): Site url
+        config (Config): Configuration
+        session (aiohttp.ClientSession): Session to send request with
+
+    Returns:
+        requests.models.Response: A response from a request
+
+    Raises:
+        CircuitOpenError: If the host is paused by the circuit breaker
+    """
+    host = urlparse(url).netloc
+    ensure_host_allowed(host, config)
+    rate_limiter = config.get_rate_limiter()
+    stats = config.get_crawl_stats()
+    with stats.measure('rate_limit'):
+        # the first request to a host reads its robots.txt, which must not block the loop
+        wait = (rate_limiter.reserve(host) if host in rate_limiter
+                else await asyncio.to_thread(rate_limiter.reserve, host))
+        await asyncio.sleep(wait)
+
+    start = perf_counter()
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=config.get_timeout()),
+                           ssl=config.get_verify_certificate()) as aio_response:
+        stats.record('ttfb', perf_counter() - start)
+        start = perf_counter()
+        response = requests.Response()
+        response.url = str(aio_response.url)
+        response.status_code = aio_response.status
+        response.headers = CaseInsensitiveDict(aio_response.headers)
+        body = bytearray()
+        async for chunk in aio_response.content.iter_chunked(CHUNK_SIZE):
+            body += chunk
+            if len(body) > config.get_max_page_size():
+                raise ResponseTooLargeError(f'{url} is larger than '
+                                            f'{config.get_max_page_size()} bytes')
+        response._content = bytes(body)  # pylint: disable=protected-access
+        stats.record('download', perf_counter() - start, len(body))
+    apply_encoding(response, config.get_encoding())
+    respect_retry_after(response, host, rate_limiter)
+    return response
+
+
+async def make_async_request(url: str, config: Config,
+                             session: aiohttp.ClientSession) -> requests.models.Response:
+    """
+    Deliver a response from an asynchronous request with given configuration.
+
+    Retries, backoff and the circuit breaker work as in make_request.
+    The HTTP cache is not used.
+
+    Args:
+        url (str): Site url
+        config (Config): Configuration
+        session (aiohttp.ClientSession): Session to send request with
+
+    Returns:
+        requests.models.Response: A response from a request
+
+    Raises:
+        requests.RequestException: If no response is received after all retries
+            or the host is paused by the circuit breaker
+    """
+    host = urlparse(url).netloc
+    attempt = 0
+    while True:
+        try:
+            response = await _send_async_request(url, config, session)
+        except TRANSIENT_ERRORS as error:
+            if finish_attempt(host, config, attempt):
+                raise requests.ConnectionError(str(error)) from error
+        else:
+            if finish_attempt(host, config, attempt, response):
+                return response
+        attempt += 1
+
+
+class AsyncCrawler(Crawler):
+    """
+    Crawler that downloads listing pages with asynchronous requests.
+    """
+
+    def __init__(self, config: Config, session: aiohttp.ClientSession, **kwargs: Any) -> None:
+        """
+        Initialize an instance of the AsyncCrawler class.
+
+        Args:
+            config (Config): Configuration
+            session (aiohttp.ClientSession): Session to send requests with
+            **kwargs (Any): Stored urls, seen urls and site to crawl as in Crawler
+        """
+        super().__init__(config, **kwargs)
+        self._session = session
+
+    async def find_articles(self) -> None:  # type: ignore[override]
+        """
+        Find articles.
+        """
+        async for _ in self.discover_urls():
+            pass
+
+    async def _fetch_page(self, page_url: str) -> Optional[requests.models.Response]:
+        """
+        Download a listing page.
+
+        Args:
+            page_url (str): Url of the listing page
+
+        Returns:
+            Optional[requests.models.Response]: A response, None if the page could not be requested
+        """
+        try:
+            return await make_async_request(page_url, self.config, self._session)
+        except requests.RequestException:
+            return None
+
+    async def discover_urls(self) -> AsyncIterator[str]:  # type: ignore[override]
+        """
+        Visit listing pages and yield article urls as soon as they are found.
+
+        Pages are visited in the same breadth-first order as in Crawler, but up
+        to num_workers pages from the head of the frontier are downloaded at once.
+
+        Yields:
+            str: Url of a newly found article
+        """
+        self._queue_seed_urls()
+        while self._should_continue():
+            batch = list(self._frontier)[:min(self.config.get_num_workers(),
+                                              self.config.get_max_pages() - self._pages_visited)]
+            responses = await asyncio.gather(*(self._fetch_page(page_url)
+                                               for page_url, _ in batch))
+            for (page_url, depth), response in zip(batch, responses):
+                if response is not None and response.ok:
+                    for url in self._process_listing_page(BeautifulSoup(response.text, 'lxml'),
+                                                          page_url, depth):
+                        yield url
+                else:
+                    self._failed_pages.append((page_url, depth))
+                self._frontier.popleft()
+                self._pages_visited += 1
+
+
+class AsyncMultiSiteCrawler(MultiSiteCrawler):
+    """
+    Crawler of all configured sites that downloads listing pages with asynchronous requests.
+
+    Unlike MultiSiteCrawler, article urls are handed out as soon as any site
+    finds them rather than in turn, as no site holds up a thread here.
+    """
+
+    def __init__(self, config: Config, session: aiohttp.ClientSession,
+                 stored_urls: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize an instance of the AsyncMultiSiteCrawler class.
+
+        Args:
+            config (Config): Configuration
+            session (aiohttp.ClientSession): Session to send requests with
+            stored_urls (Optional[Iterable[str]]): Urls of already collected articles to skip
+        """
+        self._session = session
+        super().__init__(config, stored_urls)
+
+    def _make_crawler(self, site: SiteProfile, stored_urls: list[str]) -> AsyncCrawler:
+        """
+        Create an asynchronous crawler of a site.
+
+        Args:
+            site (SiteProfile): Site to crawl
+            stored_urls (list[str]): Urls of already collected articles to skip
+
+        Returns:
+            AsyncCrawler: Crawler of the site
+        """
+        return AsyncCrawler(self.config, self._session, stored_urls=stored_urls, site=site)
+
+    async def discover_urls(self) -> AsyncIterator[str]:  # type: ignore[override]
+        """
+        Visit listing pages of all sites at once and yield article urls as soon as they are found.
+
+        Yields:
+            str: Url of a newly found article
+        """
+        self._states = {crawler.site.name: crawler.get_state() for crawler in self.crawlers}
+        found: asyncio.Queue = asyncio.Queue()
+
+        async def discover_site_urls(crawler: AsyncCrawler) -> None:
+            """
+            Put article urls of a site to the queue together with the crawler state after each.
+
+            Args:
+                crawler (AsyncCrawler): Crawler of the site
+            """
+            try:
+                async for url in crawler.discover_urls():
+                    found.put_nowait((crawler.site.name, url, crawler.get_state()))
+            finally:
+                found.put_nowait((crawler.site.name, None, crawler.get_state()))
+
+        site_tasks = [asyncio.create_task(discover_site_urls(cast(AsyncCrawler, crawler)))
+                      for crawler in self.crawlers]
+        try:
+            for _ in site_tasks:
+                while True:
+                    name, url, state = await found.get()
+                    self._states[name] = state
+                    if url is None:
+                        break
+                    if self._handed_out_urls.add(url):
+                        yield url
+            await asyncio.gather(*site_tasks)
+        finally:
+            for site_task in site_tasks:
+                site_task.cancel()
+
+
+class AsyncHTMLParser(HTMLParser):
+    """
+    HTMLParser that downloads an article page with an asynchronous request.
+    """
+
+    def __init__(self, full_url: str, article_id: int, config: Config,
+                 session: aiohttp.ClientSession) -> None:
+        """
+        Initialize an instance of the AsyncHTMLParser class.
+
+        Args:
+            full_url (str): Site url
+            article_id (int): Article id
+            config (Config): Configuration
+            session (aiohttp.ClientSession): Session to send request with
+        """
+        super().__init__(full_url=full_url, article_id=article_id, config=config)
+        self._session = session
+
+    async def parse(self) -> Union[Article, bool, list]:  # type: ignore[override]
+        """
+        Parse each article.
+
+        Returns:
+            Union[Article, bool, list]: Article instance, False if the page is not downloaded
+        """
+        response = await make_async_request(self.full_url, self.config, self._session)
+        if not response.ok:
+            return False
+        return await asyncio.to_thread(self.parse_html, response.text)
+
+
+async def collect_article(full_url: str, config: Config,
+                          session: aiohttp.ClientSession) -> Optional[Article]:
+    """
+    Download and parse a single article as collection.collect_article does.
+
+    The article gets its id only when it is saved, so it is parsed with id 0.
+
+    Args:
+        full_url (str): Article url
+        config (Config): Configuration
+        session (aiohttp.ClientSession): Session to send request with
+
+    Returns:
+        Optional[Article]: Parsed article, None if the page cannot be collected,
+            e.g. it is not found or is too large
+
+    Raises:
+        requests.RequestException: If the page is temporarily unavailable
+    """
+    try:
+        response = await make_async_request(full_url, config, session)
+        if not is_collectable(full_url, response):
+            return None
+    except ResponseTooLargeError:
+        return None
+    parser = HTMLParser(full_url=full_url, article_id=0, config=config)
+    return await asyncio.to_thread(parser.parse_html, response.text)
+
+
+async def save_in_crawl_order(collection: ArticleCollection, handed_out: asyncio.Queue) -> None:
+    """
+    Save articles once they are collected, in the order they were handed out.
+
+    Args:
+        collection (ArticleCollection): Collection to save articles with
+        handed_out (asyncio.Queue): Urls of handed out articles with the tasks
+            collecting them, ended by None
+    """
+    while True:
+        item = await handed_out.get()
+        if item is None:
+            return
+        full_url, task = item
+        await asyncio.wait([task])
+        await asyncio.to_thread(collection.save, full_url, task)
+
+
+async def crawl(crawler: AsyncMultiSiteCrawler, config: Config, first_article_id: int,
+                session: aiohttp.ClientSession,
+                checkpoint: Optional[CrawlCheckpoint] = None) -> None:
+    """
+    Collect articles found by the crawler concurrently as collection.crawl does.
+
+    Args:
+        crawler (AsyncMultiSiteCrawler): Crawler, possibly restored from the checkpoint
+        config (Config): Configuration
+        first_article_id (int): Id of the first newly saved article
+        session (aiohttp.ClientSession): Session to send requests with
+        checkpoint (Optional[CrawlCheckpoint]): Checkpoint to keep crawl progress in
+    """
+    collection = ArticleCollection(config, first_article_id, checkpoint)
+    handed_out: asyncio.Queue = asyncio.Queue()
+    saving = asyncio.create_task(save_in_crawl_order(collection, handed_out))
+    for full_url in checkpoint.get_pending() if checkpoint else []:
+        handed_out.put_nowait((full_url, asyncio.create_task(
+            collect_article(full_url, config, session))))
+    async for full_url in crawler.discover_urls():
+        if checkpoint:
+            checkpoint.start(full_url)
+            await asyncio.to_thread(checkpoint.save, crawler.get_state())
+        handed_out.put_nowait((full_url, asyncio.create_task(
+            collect_article(full_url, config, session))))
+    handed_out.put_nowait(None)
+    await saving
+    await asyncio.to_thread(finish_crawl, crawler, config, collection, checkpoint)
+
+
+async def main() -> None:
+    """
+    Entrypoint for asynchronous scrapper.
+    """
+    configuration = Config(path_to_config=constants.CRAWLER_CONFIG_PATH)
+    configuration.get_crawl_stats()
+    checkpoint, stored_urls, last_id = prepare_collection(configuration)
+    try:
+        async with open_client_session(configuration) as session:
+            crawler = AsyncMultiSiteCrawler(configuration, session, stored_urls=stored_urls)
+            restore_crawl(crawler, checkpoint, stored_urls)
+            await crawl(crawler, configuration, last_id + 1, session, checkpoint)
+    finally:
+        configuration.get_article_writer().flush()
+        report_crawl_stats(configuration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
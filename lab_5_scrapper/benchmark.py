@@ -0,0 +1,294 @@
+"""
+Benchmarks for the scrapper hot spots.
+"""
+import argparse
+import json
+import pathlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, process_time
+from typing import Any, Callable, Optional
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.replay import FixtureStore, ReplayServer
+from lab_5_scrapper.scrapper import Config, Crawler, HTMLParser
+
+#: Site the synthetic fixtures imitate
+SYNTHETIC_ORIGIN = 'https://www.nkj.ru'
+
+
+def make_config(directory: pathlib.Path, **overrides: Any) -> Config:
+    """
+    Create configuration that differs from the scrapper one in given parameters.
+
+    Args:
+        directory (pathlib.Path): Folder to write configuration file to
+        **overrides (Any): Configuration parameters to replace
+
+    Returns:
+        Config: Configuration
+    """
+    with open(CRAWLER_CONFIG_PATH, 'r', encoding='utf-8') as config_file:
+        content = json.load(config_file)
+    content.update(overrides)
+
+    path = directory / f'scrapper_config_{len(list(directory.iterdir()))}.json'
+    with open(path, 'w', encoding='utf-8') as config_file:
+        json.dump(content, config_file)
+    return Config(path)
+
+
+def generate_article_page(paragraphs: int = 30, noise_blocks: int = 300) -> str:
+    """
+    Generate article page shaped like a real one: a small article inside heavy page layout.
+
+    Args:
+        paragraphs (int): Number of paragraphs in article text
+        noise_blocks (int): Number of navigation, sidebar and footer blocks around the article
+
+    Returns:
+        str: Article page
+    """
+    noise = ''.join(f'<li class="menu-item"><a href="/section/{i}/">Раздел {i}</a>'
+                    f'<div class="teaser"><img src="/img/{i}.jpg"><span>Анонс {i}</span></div></li>'
+                    for i in range(noise_blocks))
+    text = ''.join(f'<p>Абзац {i} текста статьи о науке и жизни, '
+                   f'в котором достаточно много слов для реалистичной длины.</p>'
+                   for i in range(paragraphs))
+    return ('<!DOCTYPE html><html><head><title>Статья</title>'
+            f'<script>var data = {json.dumps(list(range(noise_blocks)))};</script></head>'
+            f'<body><header><nav><ul>{noise}</ul></nav></header>'
+            '<main><h1>Заголовок статьи</h1>'
+            '<div class="author">Автор: Иван Иванов     </div>'
+            f'{text}</main>'
+            f'<aside><ul>{noise}</ul></aside><footer><ul>{noise}</ul></footer></body></html>')
+
+
+def generate_fixtures(path: pathlib.Path, listing_pages: int = 10,
+                      articles_per_page: int = 15) -> list[str]:
+    """
+    Record a synthetic site: listing pages chained with "next page" links and article pages.
+
+    Args:
+        path (pathlib.Path): Fixture directory
+        listing_pages (int): Number of listing pages
+        articles_per_page (int): Number of article links on a listing page
+
+    Returns:
+        list[str]: Seed urls of the synthetic site
+    """
+    store = FixtureStore(path)
+    article_page = generate_article_page().encode('utf-8')
+    for page in range(1, listing_pages + 1):
+        links = ''.join(f'<article><h2><a href="/news/{page * 1000 + i}/">Статья</a></h2></article>'
+                        for i in range(articles_per_page))
+        next_link = (f'<a class="modern-page-next" href="/news/?PAGEN_1={page + 1}">Далее</a>'
+                     if page < listing_pages else '')
+        store.save(f'{SYNTHETIC_ORIGIN}/news/?PAGEN_1={page}', 200, 'text/html; charset=utf-8',
+                   f'<html><body><div class="news-list">{links}</div>{next_link}</body></html>'
+                   .encode('utf-8'))
+        for i in range(articles_per_page):
+            store.save(f'{SYNTHETIC_ORIGIN}/news/{page * 1000 + i}/', 200,
+                       'text/html; charset=utf-8', article_page)
+    return [f'{SYNTHETIC_ORIGIN}/news/?PAGEN_1=1']
+
+
+def benchmark_crawl(fixtures_path: pathlib.Path, seed_urls: list[str], latency: float,
+                    workers: int, articles: int) -> dict[str, dict[str, float]]:
+    """
+    Measure Crawler.find_articles and HTMLParser.parse against a replay server.
+
+    Articles found by the crawler are downloaded and parsed by the given number
+    of threads. CPU time is measured for the benchmark process only, the
+    replay server runs in its own process.
+
+    Args:
+        fixtures_path (pathlib.Path): Fixture directory
+        seed_urls (list[str]): Recorded seed urls
+        latency (float): Number of seconds the server waits before answering
+        workers (int): Number of articles downloaded and parsed at once
+        articles (int): Number of articles to find and parse
+
+    Returns:
+        dict[str, dict[str, float]]: Pages per second and CPU milliseconds per page
+            of crawling and parsing
+    """
+    with ReplayServer(fixtures_path, seed_urls[0], latency) as server, \
+            tempfile.TemporaryDirectory() as directory:
+        config = make_config(pathlib.Path(directory),
+                             seed_urls=[server.to_local_url(url) for url in seed_urls],
+                             total_articles_to_find_and_parse=articles, num_workers=workers,
+                             pool_maxsize=workers, requests_per_second=10000, burst_size=10000,
+                             respect_crawl_delay=False, use_http_cache=False, max_retries=0,
+                             collect_stats=False, fixtures_path='', sites=[])
+        crawler = Crawler(config)
+
+        def find_articles() -> int:
+            crawler.find_articles()
+            return int(crawler.get_state()['pages_visited'])
+
+        def parse() -> int:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(
+                    lambda item: HTMLParser(item[1], item[0], config).parse(),
+                    enumerate(crawler.urls, start=1)))
+            if not all(parsed):
+                raise ValueError('Not all articles were parsed from fixtures')
+            return len(parsed)
+
+        return {'find_articles': measure_throughput(find_articles),
+                'parse': measure_throughput(parse)}
+
+
+def measure_throughput(stage: Callable[[], int]) -> dict[str, float]:
+    """
+    Run a stage measuring wall clock and CPU time of the process.
+
+    Args:
+        stage (Callable[[], int]): Stage returning the number of processed pages
+
+    Returns:
+        dict[str, float]: Number of pages, pages per second and CPU milliseconds per page
+    """
+    wall_start, cpu_start = perf_counter(), process_time()
+    pages = stage()
+    wall, cpu = perf_counter() - wall_start, process_time() - cpu_start
+    if not pages:
+        raise ValueError('No pages were processed')
+    return {'pages': pages, 'pages_per_second': pages / wall, 'cpu_ms_per_page': cpu * 1000 / pages}
+
+
+def load_pages(html_dir: pathlib.Path) -> list[str]:
+    """
+    Read saved article pages.
+
+    Args:
+        html_dir (pathlib.Path): Folder with *.html files
+
+    Returns:
+        list[str]: Article pages
+    """
+    return [path.read_text(encoding='utf-8') for path in sorted(html_dir.glob('*.html'))]
+
+
+def benchmark_parsing(pages: list[str], repeat: int) -> dict[str, float]:
+    """
+    Compare full and partial parsing of article pages.
+
+    Args:
+        pages (list[str]): Article pages
+        repeat (int): Number of passes over pages
+
+    Returns:
+        dict[str, float]: Milliseconds spent on a page by each parsing mode
+    """
+    results = {}
+    articles = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, partial_parsing in (('full', False), ('partial', True)):
+            config = make_config(pathlib.Path(directory), partial_parsing=partial_parsing)
+            start = perf_counter()
+            for _ in range(repeat):
+                parsed = [HTMLParser('https://example.com', 1, config).parse_html(page)
+                          for page in pages]
+            results[mode] = (perf_counter() - start) * 1000 / (repeat * len(pages))
+            articles[mode] = [(article.title, article.author, article.text) for article in parsed]
+
+    if articles['full'] != articles['partial']:
+        raise ValueError('Partial parsing extracted different articles')
+    return results
+
+
+def benchmark_text_assembly(paragraph_counts: list[int]) -> dict[int, dict[str, float]]:
+    """
+    Measure article text extraction on long-form pages.
+
+    Text assembly alone is timed for the former repeated string concatenation
+    and for the single join now used by HTMLParser.
+
+    Args:
+        paragraph_counts (list[int]): Numbers of paragraphs in generated articles
+
+    Returns:
+        dict[int, dict[str, float]]: Milliseconds spent on a page for each number of paragraphs
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_config(pathlib.Path(directory), partial_parsing=True)
+        for paragraphs in paragraph_counts:
+            page = generate_article_page(paragraphs=paragraphs, noise_blocks=0)
+            start = perf_counter()
+            article = HTMLParser('https://example.com', 1, config).parse_html(page)
+            parse_time = perf_counter() - start
+
+            blocks = article.text.splitlines()
+            start = perf_counter()
+            full_text = ''
+            for block in blocks:
+                full_text += block + '\n'
+            concatenation_time = perf_counter() - start
+
+            start = perf_counter()
+            joined_text = ''.join([f'{block}\n' for block in blocks])
+            join_time = perf_counter() - start
+            if joined_text != full_text:
+                raise ValueError('Text assembly strategies produced different texts')
+
+            results[paragraphs] = {'parse_html': parse_time * 1000,
+                                   'concatenation': concatenation_time * 1000,
+                                   'join': join_time * 1000}
+    return results
+
+
+def main() -> None:
+    """
+    Entrypoint for scrapper benchmarks.
+    """
+    parser = argparse.ArgumentParser(description='Measures scrapper parsing speed')
+    parser.add_argument('--html-dir', type=pathlib.Path,
+                        help='folder with saved article pages, synthetic pages are used if omitted')
+    parser.add_argument('--repeat', type=int, default=20, help='number of passes over pages')
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[100, 1000, 5000],
+                        help='numbers of paragraphs in long-form articles')
+    parser.add_argument('--fixtures', type=pathlib.Path,
+                        help='folder with recorded pages, a synthetic site is used if omitted')
+    parser.add_argument('--seed-urls', nargs='+',
+                        help='recorded seed urls, seed urls from scrapper config by default')
+    parser.add_argument('--latency', type=float, nargs='+', default=[0.0, 0.05],
+                        help='seconds the replay server waits before answering')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8],
+                        help='numbers of articles downloaded and parsed at once')
+    parser.add_argument('--articles', type=int, default=100,
+                        help='number of articles to find and parse')
+    args = parser.parse_args()
+
+    pages = load_pages(args.html_dir) if args.html_dir else [generate_article_page()]
+    for mode, milliseconds in benchmark_parsing(pages, args.repeat).items():
+        print(f'{mode:>10} parsing: {milliseconds:.2f} ms per page')
+
+    for paragraphs, timings in benchmark_text_assembly(args.paragraphs).items():
+        stages = ', '.join(f'{stage} {milliseconds:.2f} ms'
+                           for stage, milliseconds in timings.items())
+        print(f'{paragraphs:>10} paragraphs: {stages}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        fixtures_path: Optional[pathlib.Path] = args.fixtures
+        seed_urls = args.seed_urls
+        if fixtures_path is None:
+            fixtures_path = pathlib.Path(directory)
+            seed_urls = generate_fixtures(fixtures_path)
+        elif not seed_urls:
+            with open(CRAWLER_CONFIG_PATH, 'r', encoding='utf-8') as config_file:
+                seed_urls = json.load(config_file)['seed_urls']
+        for latency in args.latency:
+            for workers in args.workers:
+                results = benchmark_crawl(fixtures_path, seed_urls, latency, workers,
+                                          args.articles)
+                print(f'latency {latency * 1000:>5.0f} ms, {workers:>3} workers: ' + ', '.join(
+                    f"{stage} {timings['pages_per_second']:.1f} pages/s "
+                    f"({timings['cpu_ms_per_page']:.2f} ms CPU per page)"
+                    for stage, timings in results.items()))
+
+
+if __name__ == "__main__":
+    main()
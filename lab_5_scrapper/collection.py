@@ -0,0 +1,517 @@
+"""
+Collection of articles found by crawlers: downloading, parsing and saving them in the crawl order.
+"""
+import asyncio
+import multiprocessing
+import pathlib
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from queue import Queue
+from typing import ContextManager, Iterable, Iterator, Optional, Union
+
+import requests
+
+from core_utils import constants
+from core_utils.article.article import Article
+from core_utils.config_dto import SiteProfile
+from lab_5_scrapper.crawler_utils import (CrawlCheckpoint, ResponseTooLargeError,
+                                          RETRY_STATUS_CODES, SeenURLIndex)
+from lab_5_scrapper.scrapper import (Config, Crawler, HTMLParser, load_stored_articles,
+                                     make_request, prepare_environment)
+
+
+class MultiSiteCrawler:
+    """
+    Crawler of all configured sites.
+
+    Every site is crawled by its own Crawler in its own thread within its own
+    article budget and rate limit, so a slow or paused site does not hold up
+    the others. Article urls of the sites are merged one by one in the order
+    of the sites, so articles of all sites are downloaded at the same time,
+    while the order they are handed out in, and so their ids, does not depend
+    on which site responds faster. For the same reason every site keeps its
+    own seen urls, and an article linked from several sites is handed out
+    only when the first of them in the merge order finds it, counting
+    against the budget of each site that finds it.
+    """
+
+    def __init__(self, config: Config, stored_urls: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize an instance of the MultiSiteCrawler class.
+
+        Args:
+            config (Config): Configuration
+            stored_urls (Optional[Iterable[str]]): Urls of already collected articles to skip
+        """
+        self.config = config
+        stored_urls = list(stored_urls or ())
+        self.crawlers = [self._make_crawler(site, stored_urls) for site in config.get_sites()]
+        self._handed_out_urls = SeenURLIndex()
+        self._states: dict[str, dict] = {}
+
+    def _make_crawler(self, site: SiteProfile, stored_urls: list[str]) -> Crawler:
+        """
+        Create a crawler of a site.
+
+        Args:
+            site (SiteProfile): Site to crawl
+            stored_urls (list[str]): Urls of already collected articles to skip
+
+        Returns:
+            Crawler: Crawler of the site
+        """
+        return Crawler(self.config, stored_urls=stored_urls, site=site)
+
+    def discover_urls(self) -> Iterator[str]:
+        """
+        Visit listing pages of all sites at once and yield article urls in turn.
+
+        Yields:
+            str: Url of a newly found article
+        """
+        self._states = {crawler.site.name: crawler.get_state() for crawler in self.crawlers}
+        stop = threading.Event()
+        site_queues = deque()
+        for crawler in self.crawlers:
+            site_queue: Queue = Queue()
+            threading.Thread(target=self._discover_site_urls, args=(crawler, site_queue, stop),
+                             daemon=True).start()
+            site_queues.append((crawler.site.name, site_queue))
+        try:
+            while site_queues:
+                name, site_queue = site_queues.popleft()
+                url, state, error = site_queue.get()
+                if error is not None:
+                    raise error
+                self._states[name] = state
+                if url is None:
+                    continue
+                if self._handed_out_urls.add(url):
+                    yield url
+                site_queues.append((name, site_queue))
+        finally:
+            stop.set()
+
+    @staticmethod
+    def _discover_site_urls(crawler: Crawler, site_queue: Queue, stop: threading.Event) -> None:
+        """
+        Put article urls of a site to its queue together with the crawler state after each of them.
+
+        The last item has no url and carries the final state or the error the crawl failed with.
+
+        Args:
+            crawler (Crawler): Crawler of the site
+            site_queue (queue.Queue): Queue to put urls to
+            stop (threading.Event): Event that is set when urls are no longer needed
+        """
+        try:
+            for url in crawler.discover_urls():
+                site_queue.put((url, crawler.get_state(), None))
+                if stop.is_set():
+                    return
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            site_queue.put((None, None, error))
+            return
+        site_queue.put((None, crawler.get_state(), None))
+
+    def get_failed_pages(self) -> list[str]:
+        """
+        Get listing pages of all sites that could not be downloaded.
+
+        Returns:
+            list[str]: Urls of failed listing pages
+        """
+        return [page_url for crawler in self.crawlers for page_url in crawler.get_failed_pages()]
+
+    def get_state(self) -> dict:
+        """
+        Get crawl progress of all sites to save in a checkpoint.
+
+        Progress of a site is the one its crawler had when the last handed out
+        url of the site was found, so urls that are found but not handed out yet
+        are found again by a resumed crawl.
+
+        Returns:
+            dict: Seed urls and crawl progress of every site by site name
+        """
+        return {'seed_urls': self.get_search_urls(),
+                'sites': {crawler.site.name: self._states.get(crawler.site.name,
+                                                              crawler.get_state())
+                          for crawler in self.crawlers}}
+
+    def restore_state(self, state: dict) -> None:
+        """
+        Continue crawl of all sites from progress saved in a checkpoint.
+
+        Args:
+            state (dict): Crawl progress returned by get_state
+        """
+        for crawler in self.crawlers:
+            crawler.restore_state(state['sites'][crawler.site.name])
+            self._handed_out_urls.update(crawler.urls)
+
+    def get_search_urls(self) -> dict[str, list[str]]:
+        """
+        Get seed urls of all sites.
+
+        Returns:
+            dict[str, list[str]]: Seed urls by site name
+        """
+        return {crawler.site.name: crawler.get_search_urls() for crawler in self.crawlers}
+
+
+def parse_article_page(full_url: str, article_id: int, html: str, config: Config) -> dict:
+    """
+    Extract article fields from a downloaded page, meant to be run in a parsing process.
+
+    Args:
+        full_url (str): Article url
+        article_id (int): Article id
+        html (str): Article page
+        config (Config): Configuration
+
+    Returns:
+        dict: Values of filled Article attributes
+    """
+    article = HTMLParser(full_url=full_url, article_id=article_id, config=config).parse_html(html)
+    return {field: getattr(article, field)
+            for field in ('title', 'author', 'date', 'topics', 'text')}
+
+
+def is_collectable(full_url: str, response: requests.models.Response) -> bool:
+    """
+    Check whether a downloaded article page is to be parsed.
+
+    Args:
+        full_url (str): Article url
+        response (requests.models.Response): Response to the article request
+
+    Returns:
+        bool: Whether the page has been downloaded, False if it cannot be collected,
+            e.g. it is not found
+
+    Raises:
+        requests.HTTPError: If the page is temporarily unavailable,
+            i.e. the host answers with 429 or 5xx after all retries
+    """
+    if response.status_code in RETRY_STATUS_CODES:
+        raise requests.HTTPError(f'{full_url} answered with {response.status_code}',
+                                 response=response)
+    return response.ok
+
+
+def collect_article(full_url: str, config: Config,
+                    parsing_pool: Optional[Executor] = None) -> Optional[Article]:
+    """
+    Download and parse a single article.
+
+    The article gets its id only when it is saved, so it is parsed with id 0.
+
+    Args:
+        full_url (str): Article url
+        config (Config): Configuration
+        parsing_pool (Optional[Executor]): Process pool to parse downloaded page in
+
+    Returns:
+        Optional[Article]: Parsed article, None if the page cannot be collected,
+            e.g. it is not found or is too large
+
+    Raises:
+        requests.RequestException: If the page is temporarily unavailable: the host
+            does not respond, answers with 429 or 5xx after all retries
+            or is paused by the circuit breaker
+    """
+    try:
+        response = make_request(full_url, config)
+    except ResponseTooLargeError:
+        return None
+    if not is_collectable(full_url, response):
+        return None
+
+    parser = HTMLParser(full_url=full_url, article_id=0, config=config)
+    if parsing_pool is None:
+        return parser.parse_html(response.text)
+    # a parsing process records time into its own statistics, so it is measured here
+    with config.get_crawl_stats().measure('parse'):
+        fields = parsing_pool.submit(parse_article_page, full_url, 0, response.text,
+                                     config).result()
+    for field, value in fields.items():
+        setattr(parser.article, field, value)
+    return parser.article
+
+
+class ArticleCollection:
+    """
+    Articles handed out to workers, saved with consecutive ids in the crawl order.
+
+    An article is saved once it and all articles handed out before it are
+    collected, so ids do not depend on which article is downloaded first and
+    articles that cannot be collected leave no gaps between ids.
+    """
+
+    def __init__(self, config: Config, first_article_id: int,
+                 checkpoint: Optional[CrawlCheckpoint] = None) -> None:
+        """
+        Initialize an instance of the ArticleCollection class.
+
+        Args:
+            config (Config): Configuration
+            first_article_id (int): Id of the first saved article
+            checkpoint (Optional[CrawlCheckpoint]): Checkpoint to keep crawl progress in
+        """
+        self.config = config
+        self.next_article_id = first_article_id
+        self.saved_urls: list[str] = []
+        self.failed_urls: list[str] = []
+        self.dropped_urls: list[str] = []
+        self._checkpoint = checkpoint
+        self._in_flight: deque[tuple[str, Future]] = deque()
+
+    def add(self, full_url: str, future: Future) -> None:
+        """
+        Register an article handed out to a worker and save articles collected so far.
+
+        Args:
+            full_url (str): Article url
+            future (concurrent.futures.Future): Result of collect_article for the url
+        """
+        self._in_flight.append((full_url, future))
+        self.save_collected()
+
+    def save_collected(self, wait: bool = False) -> None:
+        """
+        Save collected articles in the order they were handed out.
+
+        Articles that failed temporarily are left to be retried on the next run,
+        while those that cannot be collected at all are removed from the checkpoint.
+
+        Args:
+            wait (bool): Wait for all articles instead of stopping at the first
+                one that is not collected yet
+        """
+        while self._in_flight and (wait or self._in_flight[0][1].done()):
+            self.save(*self._in_flight.popleft())
+
+    def save(self, full_url: str, future: Union[Future, asyncio.Future]) -> None:
+        """
+        Save a collected article with the next id.
+
+        Articles are to be passed in the order they were handed out.
+
+        Args:
+            full_url (str): Article url
+            future (Union[concurrent.futures.Future, asyncio.Future]): Result
+                of collecting the article
+        """
+        try:
+            article = future.result()
+        except requests.RequestException:
+            self.failed_urls.append(full_url)
+            return
+        if article is None:
+            self.dropped_urls.append(full_url)
+            if self._checkpoint:
+                self._checkpoint.finish(full_url)
+            return
+        article.article_id = self.next_article_id
+        self.next_article_id += 1
+        save_article(article, self.config)
+        self.saved_urls.append(full_url)
+
+
+def save_article(article: Article, config: Config) -> None:
+    """
+    Pass article text and meta information to the article writer, recording time of writing.
+
+    The article is on disk once its batch is written or the writer is flushed.
+
+    Args:
+        article (Article): Filled article
+        config (Config): Configuration
+    """
+    stats = config.get_crawl_stats()
+    with stats.measure('write'):
+        config.get_article_writer().write(article)
+    stats.count_article()
+
+
+def report_crawl_stats(config: Config) -> None:
+    """
+    Print crawl statistics and save them to a JSON file, if they are collected.
+
+    Args:
+        config (Config): Configuration
+    """
+    stats = config.get_crawl_stats()
+    if stats.enabled:
+        print(stats.format_report())
+        stats.save(constants.CRAWL_STATS_PATH)
+
+
+def make_parsing_pool(config: Config) -> ContextManager[Optional[Executor]]:
+    """
+    Create a process pool to parse downloaded pages in, if parsing processes are configured.
+
+    The pool is created while download threads are running, and a forked process
+    may inherit locks held by them, so processes are started from a clean server
+    process instead, or spawned where it is not available.
+
+    Args:
+        config (Config): Configuration
+
+    Returns:
+        ContextManager[Optional[Executor]]: Process pool, or a context giving None
+    """
+    parsing_processes = config.get_parsing_processes()
+    if not parsing_processes:
+        return nullcontext()
+    start_method = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                    else 'spawn')
+    return ProcessPoolExecutor(max_workers=parsing_processes,
+                               mp_context=multiprocessing.get_context(start_method))
+
+
+def crawl(crawler: Union[Crawler, MultiSiteCrawler], config: Config, first_article_id: int,
+          checkpoint: Optional[CrawlCheckpoint] = None) -> None:
+    """
+    Collect articles found by the crawler concurrently.
+
+    Articles left unsaved by an interrupted crawl are collected first. Every
+    article handed out to workers is recorded in the checkpoint together with
+    the crawler state, so the checkpoint on disk always describes a state the
+    crawl can be resumed from. Articles get ids in the crawl order when they
+    are saved. Articles that fail temporarily and listing pages that fail after
+    all retries are reported and stay in the checkpoint to be retried on the next run.
+
+    Args:
+        crawler (Union[Crawler, MultiSiteCrawler]): Crawler, possibly restored
+            from the checkpoint
+        config (Config): Configuration
+        first_article_id (int): Id of the first newly saved article
+        checkpoint (Optional[CrawlCheckpoint]): Checkpoint to keep crawl progress in
+    """
+    collection = ArticleCollection(config, first_article_id, checkpoint)
+
+    # articles are handed to workers while the crawler is still visiting seed pages
+    with make_parsing_pool(config) as parsing_pool, \
+            ThreadPoolExecutor(max_workers=config.get_num_workers()) as executor:
+        for full_url in checkpoint.get_pending() if checkpoint else []:
+            collection.add(full_url, executor.submit(collect_article, full_url, config,
+                                                     parsing_pool))
+        for full_url in crawler.discover_urls():
+            if checkpoint:
+                checkpoint.start(full_url)
+                checkpoint.save(crawler.get_state())
+            collection.add(full_url, executor.submit(collect_article, full_url, config,
+                                                     parsing_pool))
+        collection.save_collected(wait=True)
+    finish_crawl(crawler, config, collection, checkpoint)
+
+
+def finish_crawl(crawler: Union[Crawler, MultiSiteCrawler], config: Config,
+                 collection: ArticleCollection,
+                 checkpoint: Optional[CrawlCheckpoint] = None) -> None:
+    """
+    Write saved articles to disk, mark them as collected in the checkpoint and report failures.
+
+    Args:
+        crawler (Union[Crawler, MultiSiteCrawler]): Crawler that has finished
+        config (Config): Configuration
+        collection (ArticleCollection): Articles collected during the crawl
+        checkpoint (Optional[CrawlCheckpoint]): Checkpoint to keep crawl progress in
+    """
+    # articles count as collected in the checkpoint only once they are on disk
+    with config.get_crawl_stats().measure('write'):
+        config.get_article_writer().flush()
+    if checkpoint:
+        for full_url in collection.saved_urls:
+            checkpoint.finish(full_url)
+        checkpoint.save(crawler.get_state())
+        if not collection.failed_urls and not crawler.get_failed_pages():
+            checkpoint.remove()
+    if collection.dropped_urls:
+        print(f'Skipped {len(collection.dropped_urls)} articles that cannot be collected')
+    if collection.failed_urls or crawler.get_failed_pages():
+        print(f'Failed to collect {len(collection.failed_urls)} articles and to visit '
+              f'{len(crawler.get_failed_pages())} listing pages'
+              f'{", run again to retry them" if checkpoint else ""}')
+
+
+def open_checkpoint(config: Config) -> Optional[CrawlCheckpoint]:
+    """
+    Load the checkpoint of an interrupted crawl of the configured sites or start a new one.
+
+    Args:
+        config (Config): Configuration
+
+    Returns:
+        Optional[CrawlCheckpoint]: Checkpoint, None if checkpoints are not used
+    """
+    if not config.get_use_checkpoints():
+        return None
+    checkpoint = CrawlCheckpoint(constants.CRAWL_CHECKPOINT_PATH)
+    seed_urls = {site.name: site.seed_urls for site in config.get_sites()}
+    if not checkpoint.load() or checkpoint.crawler_state.get('seed_urls') != seed_urls:
+        checkpoint = CrawlCheckpoint(constants.CRAWL_CHECKPOINT_PATH)
+    return checkpoint
+
+
+def prepare_collection(config: Config) -> tuple[Optional[CrawlCheckpoint], dict[str, int], int]:
+    """
+    Open the crawl checkpoint and prepare ASSETS_PATH for a run.
+
+    Articles collected before are kept if the run is incremental or resumes an interrupted crawl.
+
+    Args:
+        config (Config): Configuration
+
+    Returns:
+        tuple[Optional[CrawlCheckpoint], dict[str, int], int]: Checkpoint, None if checkpoints
+            are not used, urls of stored articles mapped to their ids and the largest stored id
+    """
+    checkpoint = open_checkpoint(config)
+    resuming = checkpoint is not None and bool(checkpoint.crawler_state)
+    prepare_environment(constants.ASSETS_PATH,
+                        incremental=config.get_incremental() or resuming)
+    # seen urls are rebuilt from saved articles on every run rather than kept on disk,
+    # so an article that was found but not saved is found again by the next run
+    stored_urls, last_id = load_stored_articles(constants.ASSETS_PATH)
+    return checkpoint, stored_urls, last_id
+
+
+def restore_crawl(crawler: MultiSiteCrawler, checkpoint: Optional[CrawlCheckpoint],
+                  stored_urls: Iterable[str]) -> None:
+    """
+    Continue an interrupted crawl from the checkpoint, if there is one.
+
+    Args:
+        crawler (MultiSiteCrawler): Crawler to restore
+        checkpoint (Optional[CrawlCheckpoint]): Checkpoint of the interrupted crawl
+        stored_urls (Iterable[str]): Urls of stored articles, which are no longer pending
+    """
+    if checkpoint is None or not checkpoint.crawler_state:
+        return
+    crawler.restore_state(checkpoint.crawler_state)
+    for url in stored_urls:
+        checkpoint.finish(url)
+
+
+def collect_articles(path_to_config: pathlib.Path) -> None:
+    """
+    Crawl the configured sites and save their articles to ASSETS_PATH.
+
+    Args:
+        path_to_config (pathlib.Path): Path to configuration
+    """
+    configuration = Config(path_to_config=path_to_config)
+    configuration.get_crawl_stats()
+    checkpoint, stored_urls, last_id = prepare_collection(configuration)
+    crawler = MultiSiteCrawler(configuration, stored_urls=stored_urls)
+    restore_crawl(crawler, checkpoint, stored_urls)
+    try:
+        crawl(crawler, configuration, last_id + 1, checkpoint)
+    finally:
+        configuration.get_article_writer().flush()
+        report_crawl_stats(configuration)
@@ -0,0 +1,287 @@
+"""
+Validation of optional crawler configuration parameters.
+"""
+import re
+
+from core_utils.config_dto import SiteProfile
+
+
+class IncorrectNumberOfWorkersError(Exception):
+    """
+    Number of workers is not a positive integer
+    """
+
+
+class IncorrectConnectionPoolError(Exception):
+    """
+    Connection pool sizes are not positive integers or keep-alive is not True or False
+    """
+
+
+class IncorrectNumberOfRetriesError(Exception):
+    """
+    Number of retries is not a non-negative integer
+    """
+
+
+class IncorrectBackoffError(Exception):
+    """
+    Backoff factor or maximum backoff is not a positive number
+    """
+
+
+class IncorrectCircuitBreakerError(Exception):
+    """
+    Circuit breaker threshold or timeout is not a positive number
+    """
+
+
+class IncorrectMaxPageSizeError(Exception):
+    """
+    Maximum page size is not a positive integer
+    """
+
+
+class IncorrectRateLimitError(Exception):
+    """
+    Rate limit is not a positive number, burst size is not a positive integer
+    or crawl delay flag is not True or False
+    """
+
+
+class IncorrectHTTPCacheError(Exception):
+    """
+    Cache flag is not True or False or cache size is not a positive integer
+    """
+
+
+class IncorrectIncrementalModeError(Exception):
+    """
+    Incremental mode value is not True or False
+    """
+
+
+class IncorrectCrawlLimitsError(Exception):
+    """
+    Crawl depth is not a non-negative integer or number of pages is not a positive integer
+    """
+
+
+class IncorrectParsingModeError(Exception):
+    """
+    Partial parsing value is not True or False
+    """
+
+
+class IncorrectNumberOfProcessesError(Exception):
+    """
+    Number of parsing processes is not a non-negative integer
+    """
+
+
+class IncorrectTextSelectorsError(Exception):
+    """
+    Text selectors are not a non-empty list of strings
+    """
+
+
+class IncorrectCheckpointModeError(Exception):
+    """
+    Checkpoint mode value is not True or False
+    """
+
+
+class IncorrectStatsModeError(Exception):
+    """
+    Statistics collection mode value is not True or False
+    """
+
+
+class IncorrectFixturesPathError(Exception):
+    """
+    Fixtures path is not a string
+    """
+
+
+class IncorrectArticleWriterError(Exception):
+    """
+    Write batch size is not a positive integer or compact meta
+    or fsync mode value is not True or False
+    """
+
+
+class IncorrectSiteProfileError(Exception):
+    """
+    Sites are not a list of profiles with unique names, seed urls, number of articles
+    and valid optional selectors and rate limits
+    """
+
+
+def _is_integer(value: object) -> bool:
+    """
+    Check that a config value is an integer and not a boolean.
+
+    Args:
+        value (object): Config value
+
+    Returns:
+        bool: Whether the value is an integer
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_positive_number(value: object) -> bool:
+    """
+    Check that a config value is a positive integer or float and not a boolean.
+
+    Args:
+        value (object): Config value
+
+    Returns:
+        bool: Whether the value is a positive number
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def _is_selector_list(value: object) -> bool:
+    """
+    Check that a config value is a non-empty list of non-empty CSS selectors.
+
+    Args:
+        value (object): Config value
+
+    Returns:
+        bool: Whether the value is a list of selectors
+    """
+    return (isinstance(value, list) and bool(value)
+            and all(isinstance(selector, str) and selector for selector in value))
+
+
+def _is_site_profile(site: object) -> bool:
+    """
+    Check that a config value describes a site to crawl.
+
+    Args:
+        site (object): Config value
+
+    Returns:
+        bool: Whether the value is a valid site profile
+    """
+    if not isinstance(site, dict) or not set(site).issubset(SiteProfile.__annotations__):
+        return False
+    total = site.get('total_articles')
+    selectors = [site.get(key, 'selector') for key in ('article_link_selector', 'title_selector',
+                                                       'next_page_selector', 'author_selector')]
+    return (isinstance(site.get('name'), str) and bool(site['name'])
+            and re.match(r"https?://", str(site.get('base_url'))) is not None
+            and isinstance(site.get('seed_urls'), list) and bool(site['seed_urls'])
+            and all(re.match(r"https?://", str(seed_url)) for seed_url in site['seed_urls'])
+            and _is_integer(total) and 0 < total <= 150  # type: ignore[operator]
+            and _is_selector_list(selectors)
+            and _is_selector_list(site.get('text_selectors', ['main p']))
+            and isinstance(site.get('author_prefix', ''), str)
+            and (site.get('requests_per_second') is None
+                 or _is_positive_number(site['requests_per_second']))
+            and (site.get('burst_size') is None
+                 or (_is_integer(site['burst_size']) and site['burst_size'] > 0)))
+
+
+def validate_optional_config_content(config: dict) -> None:
+    """
+    Ensure optional performance parameters are not corrupt when present.
+
+    Args:
+        config (dict): Raw configuration content
+    """
+    if not _is_integer(config.get('num_workers', 1)) or config.get('num_workers', 1) <= 0:
+        raise IncorrectNumberOfWorkersError
+
+    for pool_size in (config.get('pool_connections', 10), config.get('pool_maxsize', 10)):
+        if not _is_integer(pool_size) or pool_size <= 0:
+            raise IncorrectConnectionPoolError
+    if not isinstance(config.get('keep_alive', True), bool):
+        raise IncorrectConnectionPoolError
+
+    if not _is_positive_number(config.get('requests_per_second', 1.0)):
+        raise IncorrectRateLimitError
+    if (not _is_integer(config.get('burst_size', 1)) or config.get('burst_size', 1) <= 0
+            or not isinstance(config.get('respect_crawl_delay', True), bool)):
+        raise IncorrectRateLimitError
+
+    if (not isinstance(config.get('use_http_cache', False), bool)
+            or not _is_integer(config.get('http_cache_size_mb', 100))
+            or config.get('http_cache_size_mb', 100) <= 0):
+        raise IncorrectHTTPCacheError
+
+    if (not _is_integer(config.get('max_page_size_mb', 10))
+            or config.get('max_page_size_mb', 10) <= 0):
+        raise IncorrectMaxPageSizeError
+
+    if (not _is_integer(config.get('write_batch_size', 1))
+            or config.get('write_batch_size', 1) <= 0
+            or not isinstance(config.get('compact_meta', False), bool)
+            or not isinstance(config.get('fsync_writes', False), bool)):
+        raise IncorrectArticleWriterError
+
+    _validate_retry_config_content(config)
+    _validate_crawling_config_content(config)
+
+
+def _validate_retry_config_content(config: dict) -> None:
+    """
+    Ensure optional retry parameters are not corrupt when present.
+
+    Args:
+        config (dict): Raw configuration content
+    """
+    if not _is_integer(config.get('max_retries', 0)) or config.get('max_retries', 0) < 0:
+        raise IncorrectNumberOfRetriesError
+
+    if (not _is_positive_number(config.get('backoff_factor', 0.5))
+            or not _is_positive_number(config.get('max_backoff', 30.0))):
+        raise IncorrectBackoffError
+
+    if (not _is_integer(config.get('circuit_breaker_threshold', 5))
+            or not _is_positive_number(config.get('circuit_breaker_threshold', 5))
+            or not _is_positive_number(config.get('circuit_breaker_timeout', 60.0))):
+        raise IncorrectCircuitBreakerError
+
+
+def _validate_crawling_config_content(config: dict) -> None:
+    """
+    Ensure optional crawling and parsing parameters are not corrupt when present.
+
+    Args:
+        config (dict): Raw configuration content
+    """
+    if not isinstance(config.get('incremental', False), bool):
+        raise IncorrectIncrementalModeError
+
+    max_depth, max_pages = config.get('max_depth', 10), config.get('max_pages', 50)
+    if (not _is_integer(max_depth) or max_depth < 0
+            or not _is_integer(max_pages) or max_pages <= 0):
+        raise IncorrectCrawlLimitsError
+
+    if not isinstance(config.get('partial_parsing', False), bool):
+        raise IncorrectParsingModeError
+
+    if (not _is_integer(config.get('parsing_processes', 0))
+            or config.get('parsing_processes', 0) < 0):
+        raise IncorrectNumberOfProcessesError
+
+    if not _is_selector_list(config.get('text_selectors', ['main p'])):
+        raise IncorrectTextSelectorsError
+
+    if not isinstance(config.get('use_checkpoints', True), bool):
+        raise IncorrectCheckpointModeError
+
+    if not isinstance(config.get('collect_stats', True), bool):
+        raise IncorrectStatsModeError
+
+    if not isinstance(config.get('fixtures_path', ''), str):
+        raise IncorrectFixturesPathError
+
+    sites = config.get('sites', [])
+    if (not isinstance(sites, list) or not all(_is_site_profile(site) for site in sites)
+            or len({site['name'] for site in sites}) != len(sites)):
+        raise IncorrectSiteProfileError
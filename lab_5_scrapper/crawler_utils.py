@@ -0,0 +1,731 @@
+"""
+Networking and bookkeeping helpers for the crawler.
+"""
+import hashlib
+import json
+import pathlib
+import random
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import monotonic, perf_counter, sleep
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+#: Response statuses meaning the server may answer a repeated request
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+
+#: Number of bytes read from a response body at once
+CHUNK_SIZE = 64 * 1024
+
+#: Upper bounds of latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Request is not sent because its host keeps failing.
+    """
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """
+    Response body is larger than allowed.
+    """
+
+
+def read_body(response: requests.Response, max_size: int) -> None:
+    """
+    Download body of a streamed response in chunks, decompressing it on the fly.
+
+    Args:
+        response (requests.Response): A response requested with stream=True
+        max_size (int): Largest allowed size of the decompressed body in bytes
+
+    Raises:
+        ResponseTooLargeError: If the body is larger than max_size
+    """
+    content_length = response.headers.get('Content-Length', '')
+    body = bytearray()
+    try:
+        if content_length.isdigit() and int(content_length) > max_size:
+            raise ResponseTooLargeError(f'{response.url} declares {content_length} bytes')
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            body += chunk
+            if len(body) > max_size:
+                raise ResponseTooLargeError(f'{response.url} is larger than {max_size} bytes')
+    except ResponseTooLargeError:
+        response.close()
+        raise
+    response._content = bytes(body)  # pylint: disable=protected-access
+
+
+def apply_encoding(response: requests.Response, default_encoding: str) -> None:
+    """
+    Set encoding of response text without guessing it from the body.
+
+    Args:
+        response (requests.Response): A response
+        default_encoding (str): Encoding to use if the server does not declare a charset
+    """
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    else:
+        response.encoding = default_encoding
+
+
+def backoff_delay(attempt: int, backoff_factor: float, max_backoff: float) -> float:
+    """
+    Compute time to wait before repeating a failed request.
+
+    The delay grows exponentially with the attempt number and is picked at
+    random below that bound, so workers that failed together do not retry together.
+
+    Args:
+        attempt (int): Number of the failed attempt, starting from 0
+        backoff_factor (float): Delay bound after the first failed attempt in seconds
+        max_backoff (float): Largest delay bound in seconds
+
+    Returns:
+        float: Number of seconds to wait
+    """
+    return random.uniform(0, min(max_backoff, backoff_factor * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker that stops sending requests to a host that keeps failing.
+
+    After failure_threshold failed requests in a row the circuit of a host
+    opens and requests to it are refused at once. When reset_timeout passes,
+    a single trial request is let through: success closes the circuit,
+    failure opens it for another reset_timeout.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """
+        Initialize an instance of the CircuitBreaker class.
+
+        Args:
+            failure_threshold (int): Number of failures in a row that opens the circuit
+            reset_timeout (float): Number of seconds the circuit stays open
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._hosts: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """
+        Check whether a request to the host may be sent.
+
+        Args:
+            host (str): Host name
+
+        Returns:
+            bool: Whether the circuit of the host is closed or lets a trial request through
+        """
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state['failures'] < self._failure_threshold:
+                return True
+            now = monotonic()
+            if now < state['opened_until']:
+                return False
+            state['opened_until'] = now + self._reset_timeout
+            return True
+
+    def record_success(self, host: str) -> None:
+        """
+        Close the circuit of a host that answered.
+
+        Args:
+            host (str): Host name
+        """
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        """
+        Count a failed request and open the circuit if the host fails too often.
+
+        Args:
+            host (str): Host name
+        """
+        with self._lock:
+            state = self._hosts.setdefault(host, {'failures': 0, 'opened_until': 0.0})
+            state['failures'] += 1
+            if state['failures'] >= self._failure_threshold:
+                state['opened_until'] = monotonic() + self._reset_timeout
+
+
+class RateLimiter:
+    """
+    Per-host token bucket scheduler for outgoing requests.
+    """
+
+    def __init__(self, requests_per_second: float, burst_size: int,
+                 crawl_delay_getter: Optional[Callable[[str], Optional[float]]] = None,
+                 host_limits: Optional[dict[str, tuple[float, int]]] = None) -> None:
+        """
+        Initialize an instance of the RateLimiter class.
+
+        Args:
+            requests_per_second (float): Sustained number of requests per second to a single host
+            burst_size (int): Number of requests to a single host allowed in a row without waiting
+            crawl_delay_getter (Optional[Callable[[str], Optional[float]]]): Function returning
+                the delay a host asks for, called once for every new host
+            host_limits (Optional[dict[str, tuple[float, int]]]): Requests per second
+                and burst size of hosts that do not use the default ones
+        """
+        self._requests_per_second = requests_per_second
+        self._burst_size = burst_size
+        self._crawl_delay_getter = crawl_delay_getter
+        self._host_limits = host_limits or {}
+        self._buckets: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._setup_lock = threading.Lock()
+        self._host_locks: dict[str, threading.Lock] = {}
+
+    def _register_host(self, host: str) -> None:
+        """
+        Create a bucket for a host seen for the first time.
+
+        The delay of the host is read under a lock of that host only,
+        so a slow robots.txt does not hold up requests to other hosts.
+
+        Args:
+            host (str): Host name
+        """
+        with self._setup_lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            if host in self._buckets:
+                return
+            rate, burst_size = self._host_limits.get(host,
+                                                     (self._requests_per_second, self._burst_size))
+            delay = self._crawl_delay_getter(host) if self._crawl_delay_getter else None
+            if delay:
+                rate = min(rate, 1 / delay)
+            with self._lock:
+                self._buckets[host] = {'rate': rate,
+                                       'burst': float(burst_size),
+                                       'tokens': float(burst_size),
+                                       'updated': monotonic(),
+                                       'not_before': 0.0}
+
+    def __contains__(self, host: object) -> bool:
+        """
+        Check whether the host already has a bucket.
+
+        Args:
+            host (object): Host name
+
+        Returns:
+            bool: Whether requests to the host have been scheduled before
+        """
+        return host in self._buckets
+
+    def reserve(self, host: str) -> float:
+        """
+        Reserve a request to the host without waiting for it.
+
+        Args:
+            host (str): Host name
+
+        Returns:
+            float: Number of seconds to wait before sending the request
+        """
+        if host not in self._buckets:
+            self._register_host(host)
+        with self._lock:
+            bucket = self._buckets[host]
+            now = monotonic()
+            bucket['tokens'] = min(bucket['burst'],
+                                   bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+            bucket['updated'] = now
+            bucket['tokens'] -= 1
+            return max(-bucket['tokens'] / bucket['rate'], bucket['not_before'] - now, 0.0)
+
+    def acquire(self, host: str) -> None:
+        """
+        Block until a request to the host is allowed.
+
+        Args:
+            host (str): Host name
+        """
+        wait = self.reserve(host)
+        if wait:
+            sleep(wait)
+
+    def pause(self, host: str, seconds: float) -> None:
+        """
+        Forbid requests to the host for the given time, e.g. after Retry-After.
+
+        Args:
+            host (str): Host name
+            seconds (float): Number of seconds to wait
+        """
+        if host not in self._buckets:
+            self._register_host(host)
+        with self._lock:
+            bucket = self._buckets[host]
+            bucket['not_before'] = max(bucket['not_before'], monotonic() + seconds)
+
+
+class ResponseCache:
+    """
+    On-disk cache of responses revalidated with conditional requests.
+    """
+
+    def __init__(self, path: pathlib.Path, max_size: int) -> None:
+        """
+        Initialize an instance of the ResponseCache class.
+
+        Args:
+            path (pathlib.Path): Folder to keep cached bodies and index in
+            max_size (int): Maximum total size of cached bodies in bytes
+        """
+        self.path = path
+        self.max_size = max_size
+        self._index_path = self.path / 'index.json'
+        self._lock = threading.Lock()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, dict] = {}
+        if self._index_path.exists():
+            with open(self._index_path, 'r', encoding='utf-8') as index_file:
+                self._index = json.load(index_file)
+
+    def get_validators(self, url: str) -> dict[str, str]:
+        """
+        Build conditional request headers for a cached url.
+
+        Args:
+            url (str): Requested url
+
+        Returns:
+            dict[str, str]: If-None-Match and If-Modified-Since headers, empty if url is not cached
+        """
+        with self._lock:
+            entry = self._index.get(url)
+        if not entry or not (self.path / entry['file']).exists():
+            return {}
+        validators = {}
+        if entry['etag']:
+            validators['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            validators['If-Modified-Since'] = entry['last_modified']
+        return validators
+
+    def load(self, url: str,
+             response: requests.models.Response) -> Optional[requests.models.Response]:
+        """
+        Fill a 304 Not Modified response with the cached body.
+
+        Args:
+            url (str): Requested url
+            response (requests.models.Response): Response to a conditional request
+
+        Returns:
+            Optional[requests.models.Response]: Response with restored body and status code 200,
+                None if the body has been evicted meanwhile
+        """
+        with self._lock:
+            entry = self._index.pop(url, None)
+            if not entry or not (self.path / entry['file']).exists():
+                return None
+            self._index[url] = entry
+            body = (self.path / entry['file']).read_bytes()
+        response._content = body  # pylint: disable=protected-access
+        response.status_code = 200
+        if entry['content_type']:
+            response.headers['Content-Type'] = entry['content_type']
+        return response
+
+    def store(self, url: str, response: requests.models.Response) -> None:
+        """
+        Save a response body if the server provided validators for it.
+
+        Args:
+            url (str): Requested url
+            response (requests.models.Response): Successful response
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        file_name = f'{hashlib.sha256(url.encode("utf-8")).hexdigest()}.body'
+        (self.path / file_name).write_bytes(response.content)
+        with self._lock:
+            self._index.pop(url, None)
+            self._index[url] = {'file': file_name,
+                                'etag': etag,
+                                'last_modified': last_modified,
+                                'content_type': response.headers.get('Content-Type'),
+                                'size': len(response.content)}
+            self._evict()
+            self._save_index()
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits its size.
+        """
+        total_size = sum(entry['size'] for entry in self._index.values())
+        while total_size > self.max_size and self._index:
+            url = next(iter(self._index))
+            entry = self._index.pop(url)
+            (self.path / entry['file']).unlink(missing_ok=True)
+            total_size -= entry['size']
+
+    def _save_index(self) -> None:
+        """
+        Atomically write cache index to disk.
+        """
+        tmp_path = self._index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as index_file:
+            json.dump(self._index, index_file, ensure_ascii=False)
+        tmp_path.replace(self._index_path)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Bring url to a form in which equal pages have equal urls.
+
+    Scheme and host are lowercased, default port, fragment and trailing slash are dropped,
+    query parameters are sorted.
+
+    Args:
+        url (str): Url to canonicalize
+
+    Returns:
+        str: Canonical url
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(':')[2]) in (('http', '80'), ('https', '443')):
+        netloc = netloc.rpartition(':')[0]
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+class SeenURLIndex:
+    """
+    Set of canonical urls that have already been discovered.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the SeenURLIndex class.
+        """
+        self._urls: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: object) -> bool:
+        """
+        Check whether an equivalent url has been seen.
+
+        Args:
+            url (object): Url to check
+
+        Returns:
+            bool: Whether url has been seen
+        """
+        return isinstance(url, str) and canonicalize_url(url) in self._urls
+
+    def __len__(self) -> int:
+        """
+        Get number of seen urls.
+
+        Returns:
+            int: Number of seen urls
+        """
+        return len(self._urls)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over seen urls in canonical form.
+
+        Returns:
+            Iterator[str]: Canonical urls
+        """
+        return iter(list(self._urls))
+
+    def add(self, url: str) -> bool:
+        """
+        Mark url as seen.
+
+        Args:
+            url (str): Url to add
+
+        Returns:
+            bool: True if url has not been seen before
+        """
+        canonical_url = canonicalize_url(url)
+        with self._lock:
+            if canonical_url in self._urls:
+                return False
+            self._urls.add(canonical_url)
+        return True
+
+    def update(self, urls: Iterable[str]) -> None:
+        """
+        Mark several urls as seen.
+
+        Args:
+            urls (Iterable[str]): Urls to add
+        """
+        for url in urls:
+            self.add(url)
+
+
+class CrawlCheckpoint:
+    """
+    Crawl progress kept on disk to resume an interrupted crawl.
+
+    Besides the crawler state, a checkpoint keeps urls of articles that were
+    handed out but are not saved yet: those that were in flight when the crawl
+    stopped and those that failed for a reason that may pass, e.g. a timeout.
+    Article ids are not kept, as they are given to articles only when they are saved.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Initialize an instance of the CrawlCheckpoint class.
+
+        Args:
+            path (pathlib.Path): File to keep the checkpoint in
+        """
+        self.path = path
+        self.crawler_state: dict = {}
+        self._pending: dict[str, None] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """
+        Read the checkpoint left by a previous crawl.
+
+        Returns:
+            bool: Whether there is a checkpoint to resume from
+        """
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as checkpoint_file:
+                state = json.load(checkpoint_file)
+            crawler_state, pending = state['crawler'], dict.fromkeys(state['pending'])
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return False
+        self.crawler_state = crawler_state
+        self._pending = pending
+        return True
+
+    def get_pending(self) -> list[str]:
+        """
+        Get articles that have been handed out but not saved.
+
+        Returns:
+            list[str]: Article urls in the order they were handed out
+        """
+        with self._lock:
+            return list(self._pending)
+
+    def start(self, url: str) -> None:
+        """
+        Record that an article has been handed out for collection.
+
+        Args:
+            url (str): Article url
+        """
+        with self._lock:
+            self._pending[url] = None
+
+    def finish(self, url: str) -> None:
+        """
+        Record that an article has been saved or cannot be collected at all.
+
+        Args:
+            url (str): Article url
+        """
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def save(self, crawler_state: dict) -> None:
+        """
+        Atomically write the checkpoint to disk.
+
+        Args:
+            crawler_state (dict): Current crawler state
+        """
+        with self._lock:
+            self.crawler_state = crawler_state
+            state = {'crawler': crawler_state, 'pending': list(self._pending)}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as checkpoint_file:
+                json.dump(state, checkpoint_file, ensure_ascii=False)
+            tmp_path.replace(self.path)
+
+    def remove(self) -> None:
+        """
+        Delete the checkpoint once the crawl is complete.
+        """
+        self.path.unlink(missing_ok=True)
+
+
+class CrawlStats:
+    """
+    Per-stage latency histograms and throughput counters of a crawl.
+
+    Stages are recorded from any thread. Time of a stage is summed over
+    threads, so with several workers the stage totals exceed crawl time.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Initialize an instance of the CrawlStats class.
+
+        Args:
+            enabled (bool): Record stages or ignore them
+        """
+        self.enabled = enabled
+        self._stages: dict[str, dict] = {}
+        self._articles = 0
+        self._started = perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, size: int = 0) -> None:
+        """
+        Add a measurement of a stage.
+
+        Args:
+            stage (str): Stage name
+            seconds (float): Time the stage took
+            size (int): Number of bytes the stage processed
+        """
+        if not self.enabled:
+            return
+        bucket = bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            stage_stats = self._stages.setdefault(stage, {
+                'count': 0, 'seconds': 0.0, 'max': 0.0, 'bytes': 0,
+                'histogram': [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            })
+            stage_stats['count'] += 1
+            stage_stats['seconds'] += seconds
+            stage_stats['max'] = max(stage_stats['max'], seconds)
+            stage_stats['bytes'] += size
+            stage_stats['histogram'][bucket] += 1
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Record time a block of code takes as a stage, even if it fails.
+
+        Args:
+            stage (str): Stage name
+
+        Yields:
+            None: Control to the measured block
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, perf_counter() - start)
+
+    def count_article(self) -> None:
+        """
+        Count a saved article.
+        """
+        with self._lock:
+            self._articles += 1
+
+    def summary(self) -> dict:
+        """
+        Get crawl throughput and statistics of every stage.
+
+        Percentiles are upper bounds of histogram buckets.
+
+        Returns:
+            dict: Crawl time, articles per second, downloaded bytes and stage statistics
+        """
+        elapsed = perf_counter() - self._started
+        with self._lock:
+            stages = {stage: {'count': stats['count'],
+                              'total_seconds': round(stats['seconds'], 4),
+                              'mean_ms': round(stats['seconds'] * 1000 / stats['count'], 2),
+                              'p50_ms': self._percentile(stats, 0.5),
+                              'p95_ms': self._percentile(stats, 0.95),
+                              'max_ms': round(stats['max'] * 1000, 2),
+                              'bytes': stats['bytes'],
+                              'histogram_ms': dict(zip(
+                                  [f'<={bound}' for bound in LATENCY_BUCKETS_MS]
+                                  + [f'>{LATENCY_BUCKETS_MS[-1]}'], stats['histogram']))}
+                      for stage, stats in self._stages.items()}
+            articles = self._articles
+        return {'elapsed_seconds': round(elapsed, 4),
+                'articles': articles,
+                'articles_per_second': round(articles / elapsed, 3) if elapsed else 0.0,
+                'bytes_downloaded': stages.get('download', {}).get('bytes', 0),
+                'stages': stages}
+
+    @staticmethod
+    def _percentile(stage_stats: dict, fraction: float) -> float:
+        """
+        Estimate a latency percentile of a stage from its histogram.
+
+        Args:
+            stage_stats (dict): Recorded statistics of a stage
+            fraction (float): Share of measurements below the percentile
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile in milliseconds
+        """
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, stage_stats['histogram']):
+            seen += count
+            if seen >= fraction * stage_stats['count']:
+                return float(min(bound, round(stage_stats['max'] * 1000, 2)))
+        return round(float(stage_stats['max']) * 1000, 2)
+
+    def format_report(self) -> str:
+        """
+        Format summary as a table with the slowest stage first.
+
+        Returns:
+            str: Human-readable report
+        """
+        summary = self.summary()
+        stages = sorted(summary['stages'].items(), key=lambda item: -item[1]['total_seconds'])
+        lines = [f"Collected {summary['articles']} articles in {summary['elapsed_seconds']:.2f} s "
+                 f"({summary['articles_per_second']:.2f} articles/s), "
+                 f"downloaded {summary['bytes_downloaded'] / 1024 / 1024:.2f} MB",
+                 f"{'stage':<12}{'count':>8}{'total s':>10}{'mean ms':>10}"
+                 f"{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for stage, stats in stages:
+            lines.append(f"{stage:<12}{stats['count']:>8}{stats['total_seconds']:>10.2f}"
+                         f"{stats['mean_ms']:>10.1f}{stats['p50_ms']:>10.1f}"
+                         f"{stats['p95_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+        measured = sum(stats['total_seconds'] for _, stats in stages)
+        if stages and measured:
+            lines.append(f"Slowest stage: {stages[0][0]} "
+                         f"({stages[0][1]['total_seconds'] / measured:.0%} of measured time)")
+        return '\n'.join(lines)
+
+    def save(self, path: pathlib.Path) -> None:
+        """
+        Write summary to a JSON file.
+
+        Args:
+            path (pathlib.Path): File to write
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as stats_file:
+            json.dump(self.summary(), stats_file, indent=4)
+            stats_file.write('\n')
@@ -0,0 +1,227 @@
+"""
+Downloading pages within the rate limit, with retries and a circuit breaker per host.
+"""
+import datetime
+from email.utils import parsedate_to_datetime
+from time import perf_counter, sleep
+from typing import Optional, TYPE_CHECKING
+from urllib.parse import urlparse
+
+import requests
+
+from lab_5_scrapper.crawler_utils import (apply_encoding, backoff_delay, CircuitOpenError,
+                                          RateLimiter, read_body, RETRY_STATUS_CODES)
+
+if TYPE_CHECKING:
+    from lab_5_scrapper.scrapper import Config
+
+
+def make_request(url: str, config: 'Config') -> requests.models.Response:
+    """
+    Deliver a response from a request with given configuration.
+
+    Requests failing with a timeout, a connection error or a 429/5xx status
+    are repeated up to max_retries times after an exponential backoff with
+    jitter. Once circuit_breaker_threshold requests to a host in a row fail
+    after all retries, further requests to it are refused at once until the
+    circuit breaker lets a trial request through.
+
+    Args:
+        url (str): Site url
+        config (Config): Configuration
+
+    Returns:
+        requests.models.Response: A response from a request
+
+    Raises:
+        requests.RequestException: If no response is received after all retries
+            or the host is paused by the circuit breaker
+    """
+    host = urlparse(url).netloc
+    attempt = 0
+    while True:
+        try:
+            response = _send_request(url, config)
+        except (requests.ConnectionError, requests.Timeout):
+            if finish_attempt(host, config, attempt):
+                raise
+        else:
+            if finish_attempt(host, config, attempt, response):
+                return response
+        attempt += 1
+
+
+def ensure_host_allowed(host: str, config: 'Config') -> None:
+    """
+    Refuse a request to a host paused by the circuit breaker.
+
+    Args:
+        host (str): Host name
+        config (Config): Configuration
+
+    Raises:
+        CircuitOpenError: If the circuit of the host is open
+    """
+    if not config.get_circuit_breaker().allow(host):
+        raise CircuitOpenError(f'Requests to {host} are paused after repeated failures')
+
+
+def finish_attempt(host: str, config: 'Config', attempt: int,
+                   response: Optional[requests.models.Response] = None) -> bool:
+    """
+    Record the outcome of an attempt to make a request and schedule a retry if it is needed.
+
+    Args:
+        host (str): Host name
+        config (Config): Configuration
+        attempt (int): Number of the attempt, starting from 0
+        response (Optional[requests.models.Response]): A response, None if the attempt
+            failed with a timeout or a connection error
+
+    Returns:
+        bool: Whether the attempt is the last one
+    """
+    if response is not None and response.status_code not in RETRY_STATUS_CODES:
+        config.get_circuit_breaker().record_success(host)
+        return True
+    if attempt == config.get_max_retries():
+        config.get_circuit_breaker().record_failure(host)
+        return True
+    config.get_rate_limiter().pause(host, backoff_delay(attempt, config.get_backoff_factor(),
+                                                        config.get_max_backoff()))
+    return False
+
+
+def _send_request(url: str, config: 'Config') -> requests.models.Response:
+    """
+    Make a single request within the rate limit, revalidating a cached response if there is one.
+
+    Args:
+        url (str): Site url
+        config (Config): Configuration
+
+    Returns:
+        requests.models.Response: A response from a request
+
+    Raises:
+        CircuitOpenError: If the host is paused by the circuit breaker
+    """
+    host = urlparse(url).netloc
+    ensure_host_allowed(host, config)
+    rate_limiter = config.get_rate_limiter()
+    with config.get_crawl_stats().measure('rate_limit'):
+        rate_limiter.acquire(host)
+    http_cache = config.get_http_cache()
+    response = download(url, config, http_cache.get_validators(url) if http_cache else None)
+    if http_cache and response.status_code == 304:
+        cached_response = http_cache.load(url, response)
+        if cached_response:
+            apply_encoding(cached_response, config.get_encoding())
+            return cached_response
+        response = download(url, config)
+    if http_cache and response.ok:
+        http_cache.store(url, response)
+    respect_retry_after(response, host, rate_limiter)
+    return response
+
+
+def download(url: str, config: 'Config',
+             headers: Optional[dict[str, str]] = None) -> requests.models.Response:
+    """
+    Get a page, streaming its compressed body and decoding it with the configured encoding.
+
+    The session asks for gzip and deflate, and for brotli when the brotli
+    package is installed; the body is decompressed while it is read, and
+    reading stops as soon as it exceeds max_page_size_mb. Text is decoded with
+    the charset from Content-Type or, if there is none, with the configured
+    encoding instead of guessing it from the body.
+
+    Time to response headers is recorded as the ttfb stage: it includes DNS
+    lookup, connecting and TLS handshake when no pooled connection is reused,
+    as requests does not time them separately. Reading the body is recorded
+    as the download stage. Pages are also saved to the fixture store if
+    fixtures are being recorded.
+
+    Args:
+        url (str): Site url
+        config (Config): Configuration
+        headers (Optional[dict[str, str]]): Headers to add to the request
+
+    Returns:
+        requests.models.Response: A response with downloaded body
+
+    Raises:
+        ResponseTooLargeError: If the page is larger than allowed
+    """
+    response = config.get_session().get(
+        url=url,
+        headers=headers,
+        timeout=config.get_timeout(),
+        verify=config.get_verify_certificate(),
+        stream=True
+    )
+    stats = config.get_crawl_stats()
+    stats.record('ttfb', response.elapsed.total_seconds())
+    start = perf_counter()
+    read_body(response, config.get_max_page_size())
+    stats.record('download', perf_counter() - start, len(response.content))
+    apply_encoding(response, config.get_encoding())
+    fixture_store = config.get_fixture_store()
+    if fixture_store is not None and response.status_code == 200:
+        fixture_store.save(url, response.status_code, response.headers.get('Content-Type', ''),
+                           response.content)
+    return response
+
+
+def read_robots_txt(host_url: str, config: 'Config') -> Optional[str]:
+    """
+    Download robots.txt of a host with the configured timeout and retries.
+
+    The file is read while the rate limit of the host is being set up, so
+    attempts are spaced by sleeping instead of pausing the host in the rate
+    limiter, and their failures do not count towards the circuit breaker.
+
+    Args:
+        host_url (str): Scheme and host, e.g. https://www.nkj.ru
+        config (Config): Configuration
+
+    Returns:
+        Optional[str]: Content of robots.txt, None if the host has none or does not answer
+    """
+    for attempt in range(config.get_max_retries() + 1):
+        if attempt:
+            sleep(backoff_delay(attempt - 1, config.get_backoff_factor(),
+                                config.get_max_backoff()))
+        try:
+            response = download(f'{host_url}/robots.txt', config)
+        except (requests.ConnectionError, requests.Timeout):
+            continue
+        except requests.RequestException:
+            return None
+        if response.status_code not in RETRY_STATUS_CODES:
+            return response.text if response.ok else None
+    return None
+
+
+def respect_retry_after(response: requests.models.Response, host: str,
+                        rate_limiter: RateLimiter) -> None:
+    """
+    Pause requests to a host for the time it asks for in Retry-After.
+
+    Args:
+        response (requests.models.Response): A response from a request
+        host (str): Host name
+        rate_limiter (RateLimiter): Rate limiter to pause the host in
+    """
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after or response.status_code not in (429, 503):
+        return
+    if retry_after.isdigit():
+        rate_limiter.pause(host, int(retry_after))
+        return
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return
+    rate_limiter.pause(host, (retry_date - datetime.datetime.now(
+        datetime.timezone.utc)).total_seconds())
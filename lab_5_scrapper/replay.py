@@ -0,0 +1,237 @@
+"""
+Recorded responses and a local server replaying them.
+
+A crawl with fixtures_path set in the configuration saves every downloaded
+page to a fixture directory. ReplayServer serves those pages on localhost,
+so the crawler and the parser can be run and measured without network access.
+"""
+import hashlib
+import json
+import multiprocessing
+import pathlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from types import TracebackType
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+
+class FixtureStore:
+    """
+    Directory of recorded responses indexed by url.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Initialize an instance of the FixtureStore class.
+
+        Args:
+            path (pathlib.Path): Fixture directory
+        """
+        self.path = path
+        self._index: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        index_path = self.path / 'index.json'
+        if index_path.exists():
+            with open(index_path, 'r', encoding='utf-8') as index_file:
+                self._index = json.load(index_file)
+
+    def __contains__(self, url: object) -> bool:
+        """
+        Check whether a response to the url is recorded.
+
+        Args:
+            url (object): Page url
+
+        Returns:
+            bool: Whether the url is recorded
+        """
+        return url in self._index
+
+    def __len__(self) -> int:
+        """
+        Get number of recorded responses.
+
+        Returns:
+            int: Number of recorded responses
+        """
+        return len(self._index)
+
+    def save(self, url: str, status: int, content_type: str, body: bytes) -> None:
+        """
+        Record a response.
+
+        Args:
+            url (str): Requested url
+            status (int): Response status
+            content_type (str): Content-Type header of the response
+            body (bytes): Decompressed response body
+        """
+        file_name = f'{hashlib.sha1(url.encode("utf-8")).hexdigest()}.html'
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            (self.path / file_name).write_bytes(body)
+            self._index[url] = {'status': status, 'content_type': content_type,
+                                'file': file_name}
+            tmp_path = self.path / 'index.json.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as index_file:
+                json.dump(self._index, index_file, indent=4, ensure_ascii=False)
+            tmp_path.replace(self.path / 'index.json')
+
+    def load(self, url: str) -> Optional[tuple[int, str, bytes]]:
+        """
+        Read a recorded response.
+
+        Args:
+            url (str): Requested url
+
+        Returns:
+            Optional[tuple[int, str, bytes]]: Status, Content-Type and body,
+                None if the url is not recorded
+        """
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+        return entry['status'], entry['content_type'], (self.path / entry['file']).read_bytes()
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server holding recorded responses of a single origin.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, store: FixtureStore, origin: str, latency: float) -> None:
+        """
+        Initialize an instance of the _ReplayHTTPServer class on a free local port.
+
+        Args:
+            store (FixtureStore): Recorded responses
+            origin (str): Scheme and host the responses were recorded from
+            latency (float): Number of seconds to wait before answering a request
+        """
+        super().__init__(('127.0.0.1', 0), _ReplayHandler)
+        self.store = store
+        self.origin = origin
+        self.latency = latency
+        self.base_url = f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Handler answering requests with recorded responses.
+    """
+
+    server: _ReplayHTTPServer
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Answer with the response recorded for the requested path of the origin.
+        """
+        sleep(self.server.latency)
+        recorded = self.server.store.load(f'{self.server.origin}{self.path}')
+        if recorded is None:
+            self.send_error(404)
+            return
+        status, content_type, body = recorded
+        # absolute links must lead to the stand-in server, not to the recorded site
+        body = body.replace(self.server.origin.encode(), self.server.base_url.encode())
+        self.send_response(status)
+        self.send_header('Content-Type', content_type or 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """
+        Keep the console quiet.
+
+        Args:
+            format (str): Message format
+            *args (Any): Message arguments
+        """
+
+
+def _serve(path: pathlib.Path, origin: str, latency: float, connection: Any) -> None:
+    """
+    Run the replay server until the process is terminated.
+
+    Args:
+        path (pathlib.Path): Fixture directory
+        origin (str): Scheme and host the responses were recorded from
+        latency (float): Number of seconds to wait before answering a request
+        connection (Any): Pipe end to send the server url to
+    """
+    server = _ReplayHTTPServer(FixtureStore(path), origin, latency)
+    connection.send(server.base_url)
+    server.serve_forever()
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in for a recorded site.
+
+    The server runs in its own process, so it competes with the measured
+    crawler neither for the interpreter lock nor for CPU time of the process.
+    """
+
+    def __init__(self, path: pathlib.Path, origin: str, latency: float = 0.0) -> None:
+        """
+        Initialize an instance of the ReplayServer class.
+
+        Args:
+            path (pathlib.Path): Fixture directory
+            origin (str): Scheme and host the responses were recorded from,
+                e.g. https://www.nkj.ru
+            latency (float): Number of seconds to wait before answering a request
+        """
+        self.path = path
+        self.origin = urlsplit(origin)._replace(path='', query='', fragment='').geturl()
+        self.latency = latency
+        self.base_url = ''
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> 'ReplayServer':
+        """
+        Start the server.
+
+        Returns:
+            ReplayServer: Running server
+        """
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(
+            target=_serve, args=(self.path, self.origin, self.latency, sender), daemon=True)
+        self._process.start()
+        self.base_url = receiver.recv()
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        """
+        Stop the server.
+
+        Args:
+            exc_type (Optional[type[BaseException]]): Exception type
+            exc_value (Optional[BaseException]): Exception raised in the block
+            traceback (Optional[TracebackType]): Traceback of the exception
+        """
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+    def to_local_url(self, url: str) -> str:
+        """
+        Turn a url of the recorded site into a url of the server.
+
+        Args:
+            url (str): Url of the recorded site
+
+        Returns:
+            str: Url of the same page on the server
+        """
+        if not url.startswith(self.origin):
+            return url
+        return f'{self.base_url}{url[len(self.origin):]}'
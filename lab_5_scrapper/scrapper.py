@@ -2,21 +2,32 @@
 Crawler implementation.
 """
 # pylint: disable=too-many-arguments, too-many-instance-attributes, unused-import, undefined-variable
+# pylint: disable=too-many-public-methods
 import datetime
 import json
 import pathlib
 import re
-from random import randrange
-from time import sleep
-from typing import Pattern, Union
+import shutil
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Pattern, Union
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
 
 from core_utils import constants
-from core_utils.article.article import Article
-from core_utils.article.io import to_meta, to_raw
-from core_utils.config_dto import ConfigDTO
+from core_utils.article.article import Article, get_article_id_from_filepath
+from core_utils.article.io import ArticleWriter
+from core_utils.config_dto import ConfigDTO, SiteProfile
+from lab_5_scrapper.config_validation import validate_optional_config_content
+from lab_5_scrapper.crawler_utils import (CircuitBreaker, CrawlStats, RateLimiter, ResponseCache,
+                                          SeenURLIndex)
+from lab_5_scrapper.fetching import make_request, read_robots_txt
+from lab_5_scrapper.replay import FixtureStore
 
 
 class IncorrectSeedURLError(Exception):
@@ -84,6 +95,76 @@ class Config:
         self._timeout = self.config.timeout
         self._should_verify_certificate = self.config.should_verify_certificate
         self._headless_mode = self.config.headless_mode
+        self._num_workers = self.config.num_workers
+        self._pool_connections = self.config.pool_connections
+        self._pool_maxsize = self.config.pool_maxsize
+        self._keep_alive = self.config.keep_alive
+        self._max_retries = self.config.max_retries
+        self._requests_per_second = self.config.requests_per_second
+        self._burst_size = self.config.burst_size
+        self._respect_crawl_delay = self.config.respect_crawl_delay
+        self._use_http_cache = self.config.use_http_cache
+        self._http_cache_size_mb = self.config.http_cache_size_mb
+        self._incremental = self.config.incremental
+        self._max_depth = self.config.max_depth
+        self._max_pages = self.config.max_pages
+        self._partial_parsing = self.config.partial_parsing
+        self._parsing_processes = self.config.parsing_processes
+        self._text_selectors = self.config.text_selectors
+        self._use_checkpoints = self.config.use_checkpoints
+        self._backoff_factor = self.config.backoff_factor
+        self._max_backoff = self.config.max_backoff
+        self._circuit_breaker_threshold = self.config.circuit_breaker_threshold
+        self._circuit_breaker_timeout = self.config.circuit_breaker_timeout
+        self._max_page_size_mb = self.config.max_page_size_mb
+        self._sites = self.config.sites
+        self._collect_stats = self.config.collect_stats
+        self._fixtures_path = self.config.fixtures_path
+        self._write_batch_size = self.config.write_batch_size
+        self._compact_meta = self.config.compact_meta
+        self._fsync_writes = self.config.fsync_writes
+
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        self._http_cache: Optional[ResponseCache] = None
+        self._crawl_stats: Optional[CrawlStats] = None
+        self._fixture_store: Optional[FixtureStore] = None
+        self._article_writer: Optional[ArticleWriter] = None
+
+    def __getstate__(self) -> dict:
+        """
+        Get configuration state for sending it to another process.
+
+        Sessions, locks and caches are bound to the current process and are not sent.
+
+        Returns:
+            dict: Picklable state
+        """
+        state = self.__dict__.copy()
+        for runtime_attribute in ('_session', '_session_lock', '_rate_limiter',
+                                  '_circuit_breaker', '_http_cache', '_crawl_stats',
+                                  '_fixture_store', '_article_writer'):
+            del state[runtime_attribute]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore configuration received from another process.
+
+        Args:
+            state (dict): Picklable state
+        """
+        self.__dict__.update(state)
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._rate_limiter = None
+        self._circuit_breaker = None
+        self._http_cache = None
+        self._crawl_stats = None
+        self._fixture_store = None
+        self._article_writer = None
 
     def _extract_config_content(self) -> ConfigDTO:
         """
@@ -127,6 +208,8 @@ class Config:
                 not isinstance(config['headless_mode'], bool)):
             raise IncorrectVerifyError
 
+        validate_optional_config_content(config)
+
     def get_seed_urls(self) -> list[str]:
         """
         Retrieve seed urls.
@@ -190,25 +273,298 @@ class Config:
         """
         return self._headless_mode
 
+    def get_num_workers(self) -> int:
+        """
+        Retrieve number of articles to fetch and parse concurrently.
 
-def make_request(url: str, config: Config) -> requests.models.Response:
-    """
-    Deliver a response from a request with given configuration.
+        Returns:
+            int: Number of concurrent workers
+        """
+        return self._num_workers
 
-    Args:
-        url (str): Site url
-        config (Config): Configuration
+    def get_incremental(self) -> bool:
+        """
+        Retrieve whether to keep already collected articles.
 
-    Returns:
-        requests.models.Response: A response from a request
-    """
-    sleep(randrange(3))
-    return requests.get(
-        url=url,
-        timeout=config.get_timeout(),
-        headers=config.get_headers(),
-        verify=config.get_verify_certificate()
-    )
+        Returns:
+            bool: Whether to crawl incrementally or not
+        """
+        return self._incremental
+
+    def get_max_depth(self) -> int:
+        """
+        Retrieve maximum number of "next page" links followed from a seed url.
+
+        Returns:
+            int: Maximum pagination depth
+        """
+        return self._max_depth
+
+    def get_max_pages(self) -> int:
+        """
+        Retrieve maximum number of listing pages visited during a crawl.
+
+        Returns:
+            int: Maximum number of listing pages
+        """
+        return self._max_pages
+
+    def get_partial_parsing(self) -> bool:
+        """
+        Retrieve whether to build HTML tree only for the parsed parts of a page.
+
+        Returns:
+            bool: Whether to parse article pages partially or not
+        """
+        return self._partial_parsing
+
+    def get_parsing_processes(self) -> int:
+        """
+        Retrieve number of processes parsing downloaded pages.
+
+        Returns:
+            int: Number of parsing processes, 0 if pages are parsed in downloading threads
+        """
+        return self._parsing_processes
+
+    def get_text_selectors(self) -> list[str]:
+        """
+        Retrieve CSS selectors of text blocks that make up article text.
+
+        Returns:
+            list[str]: Text block selectors
+        """
+        return self._text_selectors
+
+    def get_sites(self) -> list[SiteProfile]:
+        """
+        Retrieve profiles of sites crawled in one run.
+
+        Without configured sites, a single profile of www.nkj.ru is made of seed urls,
+        number of articles and text selectors.
+
+        Returns:
+            list[SiteProfile]: Site profiles
+        """
+        if self._sites:
+            return self._sites
+        seed = urlparse(self._seed_urls[0] if self._seed_urls else '')
+        return [SiteProfile(name=seed.netloc or 'default',
+                            base_url=f'{seed.scheme}://{seed.netloc}' if seed.netloc else '',
+                            seed_urls=self._seed_urls,
+                            total_articles=self._num_articles,
+                            author_prefix='Автор:',
+                            text_selectors=self._text_selectors)]
+
+    def get_site(self, url: str) -> SiteProfile:
+        """
+        Retrieve profile of the site a url belongs to.
+
+        A site is found by the host of its base url or seed urls,
+        the first site is used for urls of unknown hosts.
+
+        Args:
+            url (str): Url of a page
+
+        Returns:
+            SiteProfile: Site profile
+        """
+        host = urlparse(url).netloc
+        sites = self.get_sites()
+        return next((site for site in sites
+                     if host in {urlparse(site_url).netloc
+                                 for site_url in (site.base_url, *site.seed_urls)}),
+                    sites[0])
+
+    def get_use_checkpoints(self) -> bool:
+        """
+        Retrieve whether crawl progress is saved to resume an interrupted crawl.
+
+        Returns:
+            bool: Whether to use checkpoints
+        """
+        return self._use_checkpoints
+
+    def get_max_retries(self) -> int:
+        """
+        Retrieve number of retries for a failed request.
+
+        Returns:
+            int: Number of retries
+        """
+        return self._max_retries
+
+    def get_max_page_size(self) -> int:
+        """
+        Retrieve largest allowed size of a downloaded page.
+
+        Returns:
+            int: Maximum page size in bytes
+        """
+        return self._max_page_size_mb * 1024 * 1024
+
+    def get_backoff_factor(self) -> float:
+        """
+        Retrieve delay bound before the first retry of a failed request.
+
+        Returns:
+            float: Backoff factor in seconds
+        """
+        return self._backoff_factor
+
+    def get_max_backoff(self) -> float:
+        """
+        Retrieve largest delay bound before a retry.
+
+        Returns:
+            float: Maximum backoff in seconds
+        """
+        return self._max_backoff
+
+    def get_session(self) -> requests.Session:
+        """
+        Retrieve HTTP session shared by all requests made with this configuration.
+
+        The session is created on first use. Its connection pool keeps up to
+        pool_maxsize connections per host alive, so consecutive requests to
+        the same site skip TCP and TLS handshakes.
+
+        Returns:
+            requests.Session: Shared session
+        """
+        with self._session_lock:
+            if self._session is None:
+                adapter = HTTPAdapter(pool_connections=self._pool_connections,
+                                      pool_maxsize=self._pool_maxsize,
+                                      pool_block=True)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(self._headers)
+                if not self._keep_alive:
+                    session.headers['Connection'] = 'close'
+                self._session = session
+        return self._session
+
+    def get_rate_limiter(self) -> RateLimiter:
+        """
+        Retrieve rate limiter shared by all requests made with this configuration.
+
+        Returns:
+            RateLimiter: Shared rate limiter
+        """
+        with self._session_lock:
+            if self._rate_limiter is None:
+                self._rate_limiter = RateLimiter(
+                    requests_per_second=self._requests_per_second,
+                    burst_size=self._burst_size,
+                    crawl_delay_getter=self._get_crawl_delay if self._respect_crawl_delay else None,
+                    host_limits={urlparse(site.base_url).netloc: (
+                        site.requests_per_second or self._requests_per_second,
+                        site.burst_size or self._burst_size
+                    ) for site in self._sites}
+                )
+        return self._rate_limiter
+
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        """
+        Retrieve circuit breaker shared by all requests made with this configuration.
+
+        Returns:
+            CircuitBreaker: Shared circuit breaker
+        """
+        with self._session_lock:
+            if self._circuit_breaker is None:
+                self._circuit_breaker = CircuitBreaker(
+                    failure_threshold=self._circuit_breaker_threshold,
+                    reset_timeout=self._circuit_breaker_timeout
+                )
+        return self._circuit_breaker
+
+    def get_http_cache(self) -> Optional[ResponseCache]:
+        """
+        Retrieve response cache if it is enabled.
+
+        Returns:
+            Optional[ResponseCache]: Shared response cache or None
+        """
+        if not self._use_http_cache:
+            return None
+        with self._session_lock:
+            if self._http_cache is None:
+                self._http_cache = ResponseCache(constants.HTTP_CACHE_PATH,
+                                                 self._http_cache_size_mb * 1024 * 1024)
+        return self._http_cache
+
+    def get_crawl_stats(self) -> CrawlStats:
+        """
+        Retrieve crawl statistics shared by all requests made with this configuration.
+
+        If statistics are not collected, the returned instance ignores measurements.
+
+        Returns:
+            CrawlStats: Shared crawl statistics
+        """
+        with self._session_lock:
+            if self._crawl_stats is None:
+                self._crawl_stats = CrawlStats(enabled=self._collect_stats)
+        return self._crawl_stats
+
+    def get_article_writer(self) -> ArticleWriter:
+        """
+        Retrieve writer shared by all articles collected with this configuration.
+
+        Returns:
+            ArticleWriter: Shared article writer
+        """
+        with self._session_lock:
+            if self._article_writer is None:
+                self._article_writer = ArticleWriter(batch_size=self._write_batch_size,
+                                                     compact=self._compact_meta,
+                                                     fsync=self._fsync_writes)
+        return self._article_writer
+
+    def get_fixture_store(self) -> Optional[FixtureStore]:
+        """
+        Retrieve store recording downloaded pages if recording is enabled.
+
+        A relative fixtures path is resolved against the project root.
+
+        Returns:
+            Optional[FixtureStore]: Shared fixture store or None
+        """
+        if not self._fixtures_path:
+            return None
+        with self._session_lock:
+            if self._fixture_store is None:
+                self._fixture_store = FixtureStore(constants.PROJECT_ROOT / self._fixtures_path)
+        return self._fixture_store
+
+    def _get_crawl_delay(self, host: str) -> Optional[float]:
+        """
+        Read Crawl-delay for the configured user agent from robots.txt of a host.
+
+        Args:
+            host (str): Host name
+
+        Returns:
+            Optional[float]: Delay between requests in seconds, if the host sets one
+        """
+        scheme = next((urlparse(url).scheme for site in self.get_sites()
+                       for url in (site.base_url, *site.seed_urls)
+                       if urlparse(url).netloc == host), 'https')
+        robots_txt = read_robots_txt(f'{scheme}://{host}', self)
+        if robots_txt is None:
+            return None
+
+        robots = RobotFileParser()
+        robots.parse(robots_txt.splitlines())
+        user_agent = self._headers.get('User-Agent', '*')
+        delay = float(robots.crawl_delay(user_agent) or 0)
+        rate = robots.request_rate(user_agent)
+        if rate:
+            delay = max(delay, rate.seconds / rate.requests)
+        return delay or None
 
 
 class Crawler:
@@ -218,50 +574,186 @@ class Crawler:
 
     url_pattern: Union[Pattern, str]
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, stored_urls: Optional[Iterable[str]] = None,
+                 site: Optional[SiteProfile] = None,
+                 seen_urls: Optional[SeenURLIndex] = None) -> None:
         """
         Initialize an instance of the Crawler class.
 
         Args:
             config (Config): Configuration
+            stored_urls (Optional[Iterable[str]]): Urls of already collected articles to skip
+            site (Optional[SiteProfile]): Site to crawl, the first configured site by default
+            seen_urls (Optional[SeenURLIndex]): Index of discovered urls shared
+                with crawlers of other sites
         """
         self.config = config
+        self.site = site or config.get_sites()[0]
         self.urls = []
-        self.url_pattern = "https://www.nkj.ru"
+        self.url_pattern = self.site.base_url
+        self.next_page_selector = self.site.next_page_selector
+        self._seen_urls = seen_urls if seen_urls is not None else SeenURLIndex()
+        self._seen_urls.update(stored_urls or ())
+        self._frontier: deque[tuple[str, int]] = deque()
+        self._seen_pages = SeenURLIndex()
+        self._pages_visited = 0
+        self._failed_pages: list[tuple[str, int]] = []
 
-    def _extract_url(self, article_bs: BeautifulSoup) -> str:
+    def _extract_url(self, article_bs: Tag) -> str:
         """
         Find and retrieve url from HTML.
 
         Args:
-            article_bs (bs4.BeautifulSoup): BeautifulSoup instance
+            article_bs (bs4.Tag): Article link
 
         Returns:
-            str: Url from HTML
+            str: Absolute url from HTML, empty if the link has none
         """
-        link = article_bs.find("h2").find("a").get("href")
-        url = str(self.url_pattern + link)
-        return url
+        link = article_bs.get("href")
+        if not isinstance(link, str) or not link:
+            return ''
+        return urljoin(str(self.url_pattern), link)
 
     def find_articles(self) -> None:
         """
         Find articles.
         """
+        for _ in self.discover_urls():
+            pass
+
+    def _extract_next_page(self, page_bs: BeautifulSoup, page_url: str) -> Optional[str]:
+        """
+        Find url of the next listing page.
+
+        Args:
+            page_bs (bs4.BeautifulSoup): BeautifulSoup instance of a listing page
+            page_url (str): Url of the listing page
+
+        Returns:
+            Optional[str]: Absolute url of the next page, if there is one
+        """
+        next_link = page_bs.select_one(self.next_page_selector)
+        href = next_link.get("href") if next_link else None
+        if not isinstance(href, str) or not href:
+            return None
+        return urljoin(page_url, href)
+
+    def discover_urls(self) -> Iterator[str]:
+        """
+        Visit listing pages and yield article urls as soon as they are found.
+
+        Listing pages are visited breadth-first: first all seed urls, then
+        the pages their "next page" links lead to, and so on up to
+        max_depth links away from a seed and max_pages pages in total.
+        Every yielded url is also stored in the urls field.
+
+        Yields:
+            str: Url of a newly found article
+        """
+        self._queue_seed_urls()
+        while self._should_continue():
+            # a page leaves the frontier only after all its articles are yielded,
+            # so a crawl resumed from a checkpoint visits a partly processed page again
+            page_url, depth = self._frontier[0]
+            try:
+                response: Optional[requests.Response] = make_request(page_url, self.config)
+            except requests.RequestException:
+                response = None
+            if response is not None and response.ok:
+                yield from self._process_listing_page(
+                    BeautifulSoup(response.text, 'lxml'), page_url, depth)
+            else:
+                self._failed_pages.append((page_url, depth))
+            self._frontier.popleft()
+            self._pages_visited += 1
+
+    def _queue_seed_urls(self) -> None:
+        """
+        Put seed urls not visited yet to the frontier.
+        """
         for seed_url in self.get_search_urls():
-            response = make_request(seed_url, self.config)
-            if not response.ok:
-                continue
-
-            article_bs = BeautifulSoup(response.text, 'lxml')
-            # for i in range(20):
-            #     url = self._extract_url(article_bs)
-            #     if url:
-            #         self.urls.append(url)
-            for link in article_bs.find(class_='news-list').find_all('article'):
-                if len(self.urls) == self.config.get_num_articles():
-                    break
-                if self._extract_url(link) and self._extract_url(link) not in self.urls:
-                    self.urls.append(self._extract_url(link))
+            if self._seen_pages.add(seed_url):
+                self._frontier.append((seed_url, 0))
+
+    def _should_continue(self) -> bool:
+        """
+        Check whether there are listing pages to visit within the crawl limits.
+
+        Returns:
+            bool: Whether the crawl should go on
+        """
+        return (bool(self._frontier) and self._pages_visited < self.config.get_max_pages()
+                and len(self.urls) < self.site.total_articles)
+
+    def _process_listing_page(self, article_bs: BeautifulSoup, page_url: str,
+                              depth: int) -> Iterator[str]:
+        """
+        Queue the next listing page and yield new article urls from a listing page.
+
+        Args:
+            article_bs (bs4.BeautifulSoup): BeautifulSoup instance of a listing page
+            page_url (str): Url of the listing page
+            depth (int): Number of "next page" links followed from a seed url to the page
+
+        Yields:
+            str: Url of a newly found article
+        """
+        next_page = self._extract_next_page(article_bs, page_url)
+        if (next_page and depth < self.config.get_max_depth()
+                and self._seen_pages.add(next_page)):
+            self._frontier.append((next_page, depth + 1))
+
+        # for i in range(20):
+        #     url = self._extract_url(article_bs)
+        #     if url:
+        #         self.urls.append(url)
+        for link in article_bs.select(self.site.article_link_selector):
+            if len(self.urls) == self.site.total_articles:
+                break
+            url = self._extract_url(link)
+            if url and self._seen_urls.add(url):
+                self.urls.append(url)
+                yield url
+
+    def get_failed_pages(self) -> list[str]:
+        """
+        Get listing pages that could not be downloaded.
+
+        Returns:
+            list[str]: Urls of failed listing pages
+        """
+        return [page_url for page_url, _ in self._failed_pages]
+
+    def get_state(self) -> dict:
+        """
+        Get crawl progress to save in a checkpoint.
+
+        Returns:
+            dict: Seed urls, found article urls, listing pages to visit, failed
+                and already queued ones
+        """
+        return {'seed_urls': list(self.get_search_urls()),
+                'urls': list(self.urls),
+                'frontier': [list(page) for page in self._frontier],
+                'failed_pages': [list(page) for page in self._failed_pages],
+                'seen_pages': list(self._seen_pages),
+                'pages_visited': self._pages_visited}
+
+    def restore_state(self, state: dict) -> None:
+        """
+        Continue crawl from progress saved in a checkpoint.
+
+        Listing pages that failed during the interrupted crawl are visited again.
+
+        Args:
+            state (dict): Crawl progress returned by get_state
+        """
+        failed_pages = state.get('failed_pages', [])
+        self.urls = list(state['urls'])
+        self._seen_urls.update(self.urls)
+        self._frontier = deque((url, depth) for url, depth in state['frontier'] + failed_pages)
+        self._seen_pages.update(state['seen_pages'])
+        self._pages_visited = state['pages_visited'] - len(failed_pages)
 
     def get_search_urls(self) -> list:
         """
@@ -270,11 +762,50 @@ class Crawler:
         Returns:
             list: seed_urls param
         """
-        return self.config.get_seed_urls()
+        return self.site.seed_urls
+
+
+@lru_cache
+def make_strainer(selectors: tuple[str, ...]) -> SoupStrainer:
+    """
+    Build a strainer keeping only subtrees that CSS selectors can match in.
+
+    A subtree is kept when its root matches the first compound selector,
+    e.g. "main" for "main p" or "div.content" for "div.content > p".
+
+    Args:
+        selectors (tuple[str, ...]): CSS selectors used by the parser
+
+    Returns:
+        bs4.SoupStrainer: Strainer for partial parsing
+    """
+    roots = []
+    for selector in selectors:
+        compound = re.split(r'\s*[\s>+~]\s*', selector.strip())[0]
+        name = re.match(r'[a-zA-Z][\w-]*', compound)
+        roots.append((name.group() if name else None,
+                      set(re.findall(r'\.([\w-]+)', compound)),
+                      re.findall(r'#([\w-]+)', compound)))
+
+    def is_needed(name: str, attrs: dict) -> bool:
+        """
+        Check whether a tag is a root of a needed subtree.
+
+        Args:
+            name (str): Tag name
+            attrs (dict): Tag attributes
 
+        Returns:
+            bool: Whether the tag and its children should be kept in HTML tree
+        """
+        classes = attrs.get('class') or ''
+        if isinstance(classes, str):
+            classes = classes.split()
+        return any((root_name in (None, name)) and root_classes.issubset(classes)
+                   and all(attrs.get('id') == root_id for root_id in root_ids)
+                   for root_name, root_classes, root_ids in roots)
 
-# 10
-# 4, 6, 8, 10
+    return SoupStrainer(is_needed)  # type: ignore[arg-type]
 
 
 class HTMLParser:
@@ -294,6 +825,7 @@ class HTMLParser:
         self.full_url = full_url
         self.article_id = article_id
         self.config = config
+        self.site = config.get_site(full_url)
         self.article = Article(self.full_url, self.article_id)
 
     def _fill_article_with_text(self, article_soup: BeautifulSoup) -> None:
@@ -303,12 +835,8 @@ class HTMLParser:
         Args:
             article_soup (bs4.BeautifulSoup): BeautifulSoup instance
         """
-        main_block = article_soup.find("main")
-        full_text = ""
-        all_p_tags = main_block.find_all("p")
-        for p_tag in all_p_tags:
-            full_text += p_tag.text + "\n"
-        self.article.text = full_text
+        blocks = article_soup.select(', '.join(self.site.text_selectors))
+        self.article.text = ''.join([f'{block.get_text()}\n' for block in blocks])
 
     def _fill_article_with_meta_information(self, article_soup: BeautifulSoup) -> None:
         """
@@ -317,12 +845,14 @@ class HTMLParser:
         Args:
             article_soup (bs4.BeautifulSoup): BeautifulSoup instance
         """
-        self.article.title = article_soup.find('h1').text
-
-        author = article_soup.find(class_="author").text
-        if not isinstance(author, str) or not author:
-            author = 'NOT FOUND'
-        self.article.author = [author[7:-5:]]
+        title = article_soup.select_one(self.site.title_selector)
+        if title:
+            self.article.title = title.get_text(strip=True)
+        author_tag = article_soup.select_one(self.site.author_selector)
+        author = author_tag.get_text(strip=True) if author_tag else ''
+        if self.site.author_prefix and author.startswith(self.site.author_prefix):
+            author = author[len(self.site.author_prefix):].strip()
+        self.article.author = [author or 'NOT FOUND']
 
     def unify_date_format(self, date_str: str) -> datetime.datetime:
         """
@@ -341,46 +871,88 @@ class HTMLParser:
         Parse each article.
 
         Returns:
-            Union[Article, bool, list]: Article instance
+            Union[Article, bool, list]: Article instance, False if the page is not downloaded
         """
         response = make_request(self.full_url, self.config)
-        if response.ok:
-            article_bs = BeautifulSoup(response.text, 'lxml')
+        if not response.ok:
+            return False
+        return self.parse_html(response.text)
+
+    def parse_html(self, html: str) -> Article:
+        """
+        Fill article with information from already downloaded page.
+
+        Args:
+            html (str): Article page
+
+        Returns:
+            Article: Article instance
+        """
+        with self.config.get_crawl_stats().measure('parse'):
+            if self.config.get_partial_parsing():
+                strainer = make_strainer((*self.site.text_selectors, self.site.title_selector,
+                                          self.site.author_selector))
+                article_bs = BeautifulSoup(html, 'lxml', parse_only=strainer)
+            else:
+                article_bs = BeautifulSoup(html, 'lxml')
             self._fill_article_with_text(article_bs)
             self._fill_article_with_meta_information(article_bs)
-
         return self.article
 
 
-def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
+def prepare_environment(base_path: Union[pathlib.Path, str], incremental: bool = False) -> None:
     """
     Create ASSETS_PATH folder if no created and remove existing folder.
 
     Args:
         base_path (Union[pathlib.Path, str]): Path where articles stores
+        incremental (bool): Keep files collected during previous runs
     """
+    base_path = pathlib.Path(base_path)
     base_path.mkdir(parents=True, exist_ok=True)
+    if incremental:
+        return
 
     for file in base_path.iterdir():
-        file.unlink(missing_ok=True)
+        if file.is_dir():
+            shutil.rmtree(file)
+        else:
+            file.unlink(missing_ok=True)
+
+
+def load_stored_articles(base_path: Union[pathlib.Path, str]) -> tuple[dict[str, int], int]:
+    """
+    Collect urls of articles saved during previous runs.
+
+    Args:
+        base_path (Union[pathlib.Path, str]): Path where articles stores
+
+    Returns:
+        tuple[dict[str, int], int]: Mapping of stored urls to article ids and the largest id used
+    """
+    stored_urls = {}
+    max_id = 0
+    for file in pathlib.Path(base_path).iterdir():
+        if not file.name.endswith(('_raw.txt', '_meta.json')):
+            continue
+        article_id = get_article_id_from_filepath(file)
+        max_id = max(max_id, article_id)
+        if file.name.endswith('_meta.json'):
+            with open(file, 'r', encoding='utf-8') as meta_file:
+                url = json.load(meta_file).get('url')
+            if url:
+                stored_urls[url] = article_id
+    return stored_urls, max_id
 
 
 def main() -> None:
     """
     Entrypoint for scrapper module.
     """
-    configuration = Config(path_to_config=constants.CRAWLER_CONFIG_PATH)
-    crawler = Crawler(configuration)
-    base_path = constants.ASSETS_PATH
-    prepare_environment(base_path)
-    crawler.find_articles()
-
-    for index, full_url in enumerate(crawler.urls):
-        parser = HTMLParser(full_url=full_url, article_id=index+1, config=configuration)
-        article = parser.parse()
-        if isinstance(article, Article):
-            to_raw(article)
-            to_meta(article)
+    # collection builds on the crawler and the parser of this module, so it is imported on call
+    # pylint: disable-next=import-outside-toplevel, cyclic-import
+    from lab_5_scrapper.collection import collect_articles
+    collect_articles(constants.CRAWLER_CONFIG_PATH)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+"""
+Article collection order validation.
+"""
+import shutil
+import time
+import unittest
+from concurrent.futures import Future
+from typing import Any, Optional
+from unittest import mock
+
+import pytest
+import requests
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.article.article import Article
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.collection import ArticleCollection, crawl
+
+#: Urls of articles in the crawl order
+URLS = [f'https://www.nkj.ru/news/{article_id}/' for article_id in range(1, 7)]
+
+
+class ArticleCollectionTest(unittest.TestCase):
+    """
+    Tests for saving articles in the crawl order whatever order they are collected in.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ArticleCollectionTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.saved: list[tuple[int, Optional[str]]] = []
+
+    def _save(self, article: Article, *_: Any) -> None:
+        """
+        Record the id and the url of a saved article instead of writing it.
+
+        Args:
+            article (Article): Saved article
+            *_ (Any): Configuration
+        """
+        self.saved.append((article.article_id, article.url))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_articles_finished_out_of_order_get_ids_in_crawl_order(self) -> None:
+        """
+        Ensure an article is saved only after all articles handed out before it
+        and failed or missing articles leave no gaps between ids.
+        """
+        collection = ArticleCollection(make_config(TEST_PATH, sites=[]), first_article_id=1)
+        futures: list[Future] = [Future() for _ in URLS]
+        with mock.patch('lab_5_scrapper.collection.save_article', side_effect=self._save):
+            for url, future in zip(URLS, futures):
+                collection.add(url, future)
+            for index in (5, 3, 4):
+                futures[index].set_result(Article(URLS[index], 0))
+            futures[2].set_result(None)
+            collection.save_collected()
+            self.assertEqual(self.saved, [])
+
+            futures[1].set_exception(requests.ConnectionError('timeout'))
+            futures[0].set_result(Article(URLS[0], 0))
+            collection.save_collected()
+
+        self.assertEqual(self.saved, [(1, URLS[0]), (2, URLS[3]), (3, URLS[4]), (4, URLS[5])])
+        self.assertEqual(collection.failed_urls, [URLS[1]])
+        self.assertEqual(collection.dropped_urls, [URLS[2]])
+        self.assertEqual(collection.next_article_id, 5)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_saves_slower_earlier_articles_first(self) -> None:
+        """
+        Ensure worker threads finishing later articles first do not change their ids.
+        """
+        def collect_article(full_url: str, *_: Any) -> Article:
+            """
+            Collect an article the slower the earlier it was found.
+
+            Args:
+                full_url (str): Article url
+                *_ (Any): Configuration and parsing pool
+
+            Returns:
+                Article: Article with id 0
+            """
+            time.sleep(0.05 * (len(URLS) - URLS.index(full_url)))
+            finished.append(full_url)
+            return Article(full_url, 0)
+
+        finished: list[str] = []
+        crawler = mock.Mock()
+        crawler.discover_urls.return_value = iter(URLS)
+        crawler.get_failed_pages.return_value = []
+        config = make_config(TEST_PATH, num_workers=len(URLS), parsing_processes=0, sites=[])
+        with mock.patch('lab_5_scrapper.collection.collect_article', side_effect=collect_article), \
+                mock.patch('lab_5_scrapper.collection.save_article', side_effect=self._save):
+            crawl(crawler, config, first_article_id=11)
+
+        self.assertEqual(finished[0], URLS[-1])
+        self.assertEqual(self.saved, list(enumerate(URLS, start=11)))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ArticleCollectionTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
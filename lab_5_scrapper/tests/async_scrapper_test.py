@@ -0,0 +1,131 @@
+"""
+Asynchronous crawler validation.
+"""
+import asyncio
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils import constants
+from core_utils.article import article
+from lab_5_scrapper.async_scrapper import AsyncCrawler, AsyncHTMLParser, main, open_client_session
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.replay import FixtureStore, ReplayServer
+from lab_5_scrapper.scrapper import load_stored_articles
+
+
+class AsyncScrapperTest(unittest.TestCase):
+    """
+    Tests for AsyncCrawler and AsyncHTMLParser.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for AsyncScrapperTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.fixtures_path = TEST_PATH / 'fixtures'
+        store = FixtureStore(self.fixtures_path)
+        for page in (1, 2):
+            article_ids = (1, 2) if page == 1 else (3, 404, 4)
+            links = ''.join(f'<article><h2><a href="/news/{article_id}/">{article_id}</a></h2>'
+                            f'</article>' for article_id in article_ids)
+            next_page = (f'<div class="pagination"><a class="modern-page-next" '
+                         f'href="/news/?PAGEN_1={page + 1}">next</a></div>' if page == 1 else '')
+            store.save(f'https://www.nkj.ru/news/?PAGEN_1={page}', 200, 'text/html; charset=utf-8',
+                       f'<html><body><div class="news-list">{links}</div>{next_page}'
+                       f'</body></html>'.encode('utf-8'))
+        for article_id in (1, 2, 3, 4):
+            store.save(f'https://www.nkj.ru/news/{article_id}/', 200, 'text/html; charset=utf-8',
+                       f'<html><body><main><h1>Статья {article_id}</h1>'
+                       f'<div class="author">Автор: Иван Иванов</div><p>Текст.</p></main>'
+                       f'</body></html>'.encode('utf-8'))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_crawler_and_parser_run_against_replay_server(self) -> None:
+        """
+        Ensure the asynchronous crawler follows listing pages in order
+        and the asynchronous parser parses recorded articles through the server.
+        """
+        with ReplayServer(self.fixtures_path, 'https://www.nkj.ru', latency=0.01) as server:
+            seed_url = server.to_local_url('https://www.nkj.ru/news/?PAGEN_1=1')
+            config = make_config(TEST_PATH, seed_urls=[seed_url],
+                                 total_articles_to_find_and_parse=5, respect_crawl_delay=False,
+                                 requests_per_second=100, burst_size=100, max_retries=0,
+                                 use_http_cache=False, sites=[])
+
+            async def crawl() -> tuple[list[str], list]:
+                """
+                Find articles and parse the found ones.
+
+                Returns:
+                    tuple[list[str], list]: Found urls and parsing results
+                """
+                async with open_client_session(config) as session:
+                    crawler = AsyncCrawler(config, session)
+                    urls = [url async for url in crawler.discover_urls()]
+                    articles = await asyncio.gather(
+                        *(AsyncHTMLParser(url, article_id, config, session).parse()
+                          for article_id, url in enumerate(urls, start=1)))
+                return urls, articles
+
+            urls, articles = asyncio.run(crawl())
+        self.assertEqual(urls, [f'{server.base_url}/news/{article_id}/'
+                                for article_id in (1, 2, 3, 404, 4)])
+        parsed = [articles[index] for index in (0, 1, 2, 4)]
+        self.assertEqual([article.title for article in parsed],
+                         [f'Статья {article_id}' for article_id in (1, 2, 3, 4)])
+        self.assertEqual([article.article_id for article in parsed], [1, 2, 3, 5])
+        self.assertIs(articles[3], False)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_main_saves_articles_with_consecutive_ids_in_crawl_order(self) -> None:
+        """
+        Ensure an incremental asynchronous crawl skips stored articles, gives new ones ids
+        in the crawl order when they are saved, so a missing article leaves no gap,
+        and removes the checkpoint of a finished crawl.
+        """
+        assets_path = TEST_PATH / 'articles'
+        assets_path.mkdir()
+        checkpoint_path = TEST_PATH / 'checkpoint.json'
+        with ReplayServer(self.fixtures_path, 'https://www.nkj.ru', latency=0.01) as server:
+            (assets_path / '1_raw.txt').write_text('Текст.', encoding='utf-8')
+            with open(assets_path / '1_meta.json', 'w', encoding='utf-8') as meta_file:
+                json.dump({'id': 1, 'url': f'{server.base_url}/news/1/'}, meta_file)
+            config = make_config(TEST_PATH,
+                                 seed_urls=[server.to_local_url(
+                                     'https://www.nkj.ru/news/?PAGEN_1=1')],
+                                 total_articles_to_find_and_parse=4, incremental=True,
+                                 respect_crawl_delay=False, requests_per_second=100,
+                                 burst_size=100, max_retries=0, use_http_cache=False,
+                                 use_checkpoints=True, collect_stats=False, sites=[])
+            with mock.patch.object(constants, 'CRAWLER_CONFIG_PATH', config.path_to_config), \
+                    mock.patch.object(constants, 'ASSETS_PATH', assets_path), \
+                    mock.patch.object(constants, 'CRAWL_CHECKPOINT_PATH', checkpoint_path), \
+                    mock.patch.object(article, 'ASSETS_PATH', assets_path):
+                asyncio.run(main())
+        stored_urls, max_id = load_stored_articles(assets_path)
+        self.assertEqual(stored_urls, {f'{server.base_url}/news/{article_id}/': article_id
+                                       for article_id in (1, 2, 3, 4)})
+        self.assertEqual(max_id, 4)
+        self.assertFalse(checkpoint_path.exists())
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for AsyncScrapperTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
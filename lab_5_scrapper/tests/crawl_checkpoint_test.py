@@ -0,0 +1,78 @@
+"""
+Crawl checkpoint validation.
+"""
+import shutil
+import unittest
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.crawler_utils import CrawlCheckpoint
+
+
+class CrawlCheckpointTest(unittest.TestCase):
+    """
+    Tests for CrawlCheckpoint.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CrawlCheckpointTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_path = TEST_PATH / 'crawl_checkpoint.json'
+        self.crawler_state = {'seed_urls': ['https://www.nkj.ru/news/'],
+                              'urls': ['https://www.nkj.ru/news/1/',
+                                       'https://www.nkj.ru/news/2/'],
+                              'frontier': [['https://www.nkj.ru/news/?PAGEN_1=2', 1]],
+                              'seen_pages': ['https://www.nkj.ru/news'],
+                              'pages_visited': 1}
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_checkpoint_is_restored(self) -> None:
+        """
+        Ensure a new checkpoint restores crawler state and unsaved articles in their order.
+        """
+        checkpoint = CrawlCheckpoint(self.checkpoint_path)
+        checkpoint.start('https://www.nkj.ru/news/3/')
+        checkpoint.start('https://www.nkj.ru/news/1/')
+        checkpoint.start('https://www.nkj.ru/news/2/')
+        checkpoint.finish('https://www.nkj.ru/news/1/')
+        checkpoint.save(self.crawler_state)
+
+        restored = CrawlCheckpoint(self.checkpoint_path)
+        self.assertTrue(restored.load())
+        self.assertEqual(restored.crawler_state, self.crawler_state)
+        self.assertEqual(restored.get_pending(), ['https://www.nkj.ru/news/3/',
+                                                  'https://www.nkj.ru/news/2/'])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_missing_or_corrupt_checkpoint_is_not_loaded(self) -> None:
+        """
+        Ensure a crawl starts from scratch without a readable checkpoint.
+        """
+        self.assertFalse(CrawlCheckpoint(self.checkpoint_path).load())
+
+        self.checkpoint_path.write_text('{"crawler": ', encoding='utf-8')
+        self.assertFalse(CrawlCheckpoint(self.checkpoint_path).load())
+
+        checkpoint = CrawlCheckpoint(self.checkpoint_path)
+        checkpoint.save(self.crawler_state)
+        checkpoint.remove()
+        self.assertFalse(self.checkpoint_path.exists())
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CrawlCheckpointTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
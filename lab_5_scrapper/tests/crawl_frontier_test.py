@@ -0,0 +1,93 @@
+"""
+Listing page frontier validation.
+"""
+import shutil
+import unittest
+from typing import Any
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import generate_fixtures, make_config, SYNTHETIC_ORIGIN
+from lab_5_scrapper.replay import ReplayServer
+from lab_5_scrapper.scrapper import Crawler, make_request
+
+
+class CrawlFrontierTest(unittest.TestCase):
+    """
+    Tests for breadth-first discovery of articles on chained listing pages.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CrawlFrontierTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.fixtures_path = TEST_PATH / 'fixtures'
+        generate_fixtures(self.fixtures_path, listing_pages=4, articles_per_page=3)
+
+    def _crawl(self, pages: tuple[int, ...], **overrides: Any) -> tuple[list[int], list[int]]:
+        """
+        Find articles of the synthetic site starting from given listing pages.
+
+        Args:
+            pages (tuple[int, ...]): Numbers of listing pages used as seed urls
+            **overrides (Any): Configuration parameters to replace
+
+        Returns:
+            tuple[list[int], list[int]]: Numbers of requested listing pages
+                and ids of found articles, in the order they were visited and found
+        """
+        with ReplayServer(self.fixtures_path, SYNTHETIC_ORIGIN) as server:
+            seed_urls = [server.to_local_url(f'{SYNTHETIC_ORIGIN}/news/?PAGEN_1={page}')
+                         for page in pages]
+            config = make_config(TEST_PATH, seed_urls=seed_urls, respect_crawl_delay=False,
+                                 requests_per_second=100, burst_size=100, max_retries=0,
+                                 use_http_cache=False, sites=[], **overrides)
+            crawler = Crawler(config)
+            with mock.patch('lab_5_scrapper.scrapper.make_request',
+                            side_effect=make_request) as request:
+                urls = list(crawler.discover_urls())
+        self.assertEqual(urls, crawler.urls)
+        return ([int(call.args[0].rsplit('=', 1)[1]) for call in request.call_args_list],
+                [int(url.rstrip('/').rsplit('/', 1)[1]) for url in urls])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_pages_are_visited_breadth_first_once(self) -> None:
+        """
+        Ensure seed pages are visited before the pages they link to
+        and a listing page linked from several pages is visited once.
+        """
+        pages, article_ids = self._crawl((1, 3), total_articles_to_find_and_parse=150)
+        self.assertEqual(pages, [1, 3, 2, 4])
+        self.assertEqual(article_ids, [page * 1000 + i for page in (1, 3, 2, 4) for i in range(3)])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_stops_at_limits(self) -> None:
+        """
+        Ensure "next page" links are followed only up to max_depth,
+        no more than max_pages are visited and no more than the wanted number of articles is found.
+        """
+        self.assertEqual(self._crawl((1,), total_articles_to_find_and_parse=150, max_depth=1),
+                         ([1, 2], [page * 1000 + i for page in (1, 2) for i in range(3)]))
+        self.assertEqual(self._crawl((1,), total_articles_to_find_and_parse=150, max_pages=3),
+                         ([1, 2, 3], [page * 1000 + i for page in (1, 2, 3) for i in range(3)]))
+        self.assertEqual(self._crawl((1,), total_articles_to_find_and_parse=5),
+                         ([1, 2], [1000, 1001, 1002, 2000, 2001]))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CrawlFrontierTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
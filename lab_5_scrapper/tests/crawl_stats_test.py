@@ -0,0 +1,79 @@
+"""
+Crawl statistics validation.
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.crawler_utils import CrawlStats
+
+
+class CrawlStatsTest(unittest.TestCase):
+    """
+    Tests for CrawlStats.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_stage_histograms_and_throughput_are_summarized(self) -> None:
+        """
+        Ensure stage measurements are aggregated into histograms, percentiles and throughput.
+        """
+        with mock.patch('lab_5_scrapper.crawler_utils.perf_counter', return_value=0.0):
+            stats = CrawlStats()
+        for seconds in (0.003, 0.004, 0.03, 0.3):
+            stats.record('download', seconds, size=1000)
+        stats.record('parse', 0.001)
+        stats.count_article()
+        stats.count_article()
+
+        with mock.patch('lab_5_scrapper.crawler_utils.perf_counter', return_value=4.0):
+            summary = stats.summary()
+        self.assertEqual(summary['articles_per_second'], 0.5)
+        self.assertEqual(summary['bytes_downloaded'], 4000)
+        download = summary['stages']['download']
+        self.assertEqual(download['count'], 4)
+        self.assertEqual(download['histogram_ms']['<=5'], 2)
+        self.assertEqual(download['histogram_ms']['<=50'], 1)
+        self.assertEqual(download['histogram_ms']['<=500'], 1)
+        self.assertEqual(download['p50_ms'], 5.0)
+        self.assertEqual(download['p95_ms'], 300.0)
+        self.assertEqual(summary['stages']['parse']['histogram_ms']['<=1'], 1)
+        self.assertTrue(stats.format_report().endswith('Slowest stage: download (100% '
+                                                       'of measured time)'))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_measure_records_failed_stage_and_disabled_stats_ignore_it(self) -> None:
+        """
+        Ensure a failing block is still measured and disabled statistics stay empty.
+        """
+        stats = CrawlStats()
+        disabled_stats = CrawlStats(enabled=False)
+        for crawl_stats in (stats, disabled_stats):
+            with self.assertRaises(ValueError), crawl_stats.measure('parse'):
+                raise ValueError
+        self.assertEqual(stats.summary()['stages']['parse']['count'], 1)
+        self.assertEqual(disabled_stats.summary()['stages'], {})
+
+        stats.save(TEST_PATH / 'crawl_stats.json')
+        with open(TEST_PATH / 'crawl_stats.json', 'r', encoding='utf-8') as stats_file:
+            self.assertIn('parse', json.load(stats_file)['stages'])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CrawlStatsTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
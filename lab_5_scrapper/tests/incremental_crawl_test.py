@@ -0,0 +1,119 @@
+"""
+Incremental crawl validation.
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils import constants
+from core_utils.article import article
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.replay import FixtureStore, ReplayServer
+from lab_5_scrapper.scrapper import load_stored_articles, main
+
+
+class IncrementalCrawlTest(unittest.TestCase):
+    """
+    Tests for crawling only articles that are not stored yet.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for IncrementalCrawlTest class.
+        """
+        self.assets_path = TEST_PATH / 'articles'
+        self.assets_path.mkdir(parents=True, exist_ok=True)
+        self.fixtures_path = TEST_PATH / 'fixtures'
+        store = FixtureStore(self.fixtures_path)
+        links = ''.join(f'<article><h2><a href="/news/{article_id}/">{article_id}</a></h2></article>'
+                        for article_id in (1, 2, 3, 404, 4, 5))
+        store.save('https://www.nkj.ru/news/?PAGEN_1=1', 200, 'text/html; charset=utf-8',
+                   f'<html><body><div class="news-list">{links}</div></body></html>'
+                   .encode('utf-8'))
+        for article_id in (1, 2, 3, 4, 5):
+            store.save(f'https://www.nkj.ru/news/{article_id}/', 200, 'text/html; charset=utf-8',
+                       f'<html><body><main><h1>Статья {article_id}</h1>'
+                       f'<div class="author">Автор: Иван Иванов</div><p>Текст.</p></main>'
+                       f'</body></html>'.encode('utf-8'))
+
+    def _store_article(self, article_id: int, url: str) -> None:
+        """
+        Write an article as if it was collected by a previous run.
+
+        Args:
+            article_id (int): Article id
+            url (str): Article url
+        """
+        (self.assets_path / f'{article_id}_raw.txt').write_text('Текст.', encoding='utf-8')
+        with open(self.assets_path / f'{article_id}_meta.json', 'w',
+                  encoding='utf-8') as meta_file:
+            json.dump({'id': article_id, 'url': url}, meta_file)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_load_stored_articles_reads_urls_and_largest_id(self) -> None:
+        """
+        Ensure urls of stored articles and the largest stored id are found.
+        """
+        self._store_article(1, 'https://www.nkj.ru/news/1/')
+        self._store_article(2, 'https://www.nkj.ru/news/2/')
+        (self.assets_path / '3_raw.txt').write_text('Текст.', encoding='utf-8')
+        (self.assets_path / '7_cleaned.txt').write_text('текст', encoding='utf-8')
+
+        stored_urls, max_id = load_stored_articles(self.assets_path)
+        self.assertEqual(stored_urls, {'https://www.nkj.ru/news/1/': 1,
+                                       'https://www.nkj.ru/news/2/': 2})
+        self.assertEqual(max_id, 3)
+        self.assertEqual(load_stored_articles(str(self.assets_path)), (stored_urls, max_id))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_incremental_run_collects_only_new_articles(self) -> None:
+        """
+        Ensure stored articles are skipped, new ones continue their ids without gaps
+        and an article that was found but not saved is found again by the next run.
+        """
+        with ReplayServer(self.fixtures_path, 'https://www.nkj.ru') as server:
+            self._store_article(1, f'{server.base_url}/news/1/')
+            self._store_article(2, f'{server.base_url}/news/2/')
+            config = make_config(TEST_PATH,
+                                 seed_urls=[server.to_local_url(
+                                     'https://www.nkj.ru/news/?PAGEN_1=1')],
+                                 total_articles_to_find_and_parse=3, incremental=True,
+                                 respect_crawl_delay=False, requests_per_second=100,
+                                 burst_size=100, max_retries=0, use_http_cache=False,
+                                 use_checkpoints=False, collect_stats=False, sites=[])
+            with mock.patch.object(constants, 'CRAWLER_CONFIG_PATH', config.path_to_config), \
+                    mock.patch.object(constants, 'ASSETS_PATH', self.assets_path), \
+                    mock.patch.object(article, 'ASSETS_PATH', self.assets_path):
+                main()
+                stored_urls, max_id = load_stored_articles(self.assets_path)
+                self.assertEqual(stored_urls, {f'{server.base_url}/news/{article_id}/': article_id
+                                               for article_id in (1, 2, 3, 4)})
+                self.assertEqual(max_id, 4)
+
+                (self.assets_path / '4_raw.txt').unlink()
+                (self.assets_path / '4_meta.json').unlink()
+                main()
+        stored_urls, max_id = load_stored_articles(self.assets_path)
+        self.assertEqual(stored_urls, {f'{server.base_url}/news/{article_id}/': article_id
+                                       for article_id in (1, 2, 3, 4, 5)})
+        self.assertEqual(max_id, 5)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for IncrementalCrawlTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,171 @@
+"""
+Page body download validation.
+"""
+import gzip
+import shutil
+import threading
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+import requests
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.crawler_utils import apply_encoding, read_body, ResponseTooLargeError
+from lab_5_scrapper.fetching import download
+
+TEXT = '<html><body><p>Наука и жизнь</p></body></html>'
+
+#: Content-Type, Content-Encoding, body and whether Content-Length is sent for every page
+PAGES: dict[str, tuple[str, str, bytes, bool]] = {
+    '/gzip': ('text/html', 'gzip', gzip.compress(TEXT.encode('utf-8')), True),
+    '/deflate': ('text/html', 'deflate', zlib.compress(TEXT.encode('utf-8')), True),
+    '/bomb': ('text/html', 'gzip', gzip.compress(b'0' * 1024 * 1024), True),
+    '/large': ('text/html', '', b'0' * 4096, True),
+    '/unsized': ('text/html', '', b'0' * 4096, False),
+    '/cp1251': ('text/html; charset=windows-1251', '', TEXT.encode('cp1251'), True),
+    '/koi8': ('text/html', '', TEXT.encode('koi8-r'), True),
+}
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """
+    Handler serving compressed and encoded pages.
+    """
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Serve a page.
+        """
+        content_type, content_encoding, body, sized = PAGES[self.path]
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if content_encoding:
+            self.send_header('Content-Encoding', content_encoding)
+        if sized:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """
+        Keep test output free of request logs.
+
+        Args:
+            format (str): Message format
+            *args (Any): Message arguments
+        """
+
+
+class PageBodyTest(unittest.TestCase):
+    """
+    Tests for read_body and apply_encoding.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for PageBodyTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def _get(self, path: str) -> requests.models.Response:
+        """
+        Request a page without reading its body.
+
+        Args:
+            path (str): Page path
+
+        Returns:
+            requests.models.Response: Streamed response
+        """
+        return requests.get(f'{self.base_url}{path}', stream=True, timeout=5)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_compressed_body_is_decompressed_while_read(self) -> None:
+        """
+        Ensure gzip and deflate bodies are decompressed while they are read.
+        """
+        for path in ('/gzip', '/deflate'):
+            response = self._get(path)
+            read_body(response, 1024)
+            self.assertEqual(response.content, TEXT.encode('utf-8'))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_size_is_capped_by_content_length(self) -> None:
+        """
+        Ensure a page declaring a larger size is refused before its body is read.
+        """
+        response = self._get('/large')
+        with self.assertRaises(ResponseTooLargeError):
+            read_body(response, 1024)
+        self.assertTrue(response.raw.closed)
+        self.assertEqual(response.raw.tell(), 0)
+
+        response = self._get('/large')
+        read_body(response, 4096)
+        self.assertEqual(len(response.content), 4096)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_size_is_capped_while_streaming(self) -> None:
+        """
+        Ensure reading stops once the decompressed body exceeds the limit,
+        also when the declared compressed size is small or there is none.
+        """
+        for path in ('/bomb', '/unsized'):
+            response = self._get(path)
+            with self.assertRaises(ResponseTooLargeError):
+                read_body(response, 1024)
+            self.assertTrue(response.raw.closed)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_header_charset_wins_over_configured_encoding(self) -> None:
+        """
+        Ensure text is decoded with the charset of Content-Type
+        and with the configured encoding only when there is no charset.
+        """
+        response = requests.models.Response()
+        response.headers['Content-Type'] = 'text/html; charset=Windows-1251'
+        apply_encoding(response, 'utf-8')
+        self.assertEqual(response.encoding, 'Windows-1251')
+        response.headers['Content-Type'] = 'text/html'
+        apply_encoding(response, 'koi8-r')
+        self.assertEqual(response.encoding, 'koi8-r')
+
+        config = make_config(TEST_PATH, seed_urls=[f'{self.base_url}/'], encoding='koi8-r',
+                             fixtures_path='', sites=[])
+        for path in ('/cp1251', '/koi8'):
+            self.assertEqual(download(f'{self.base_url}{path}', config).text, TEXT)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for PageBodyTest class.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,93 @@
+"""
+Parsing process pool validation.
+"""
+import multiprocessing
+import pickle
+import shutil
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import generate_fixtures, make_config, SYNTHETIC_ORIGIN
+from lab_5_scrapper.collection import collect_article, make_parsing_pool
+from lab_5_scrapper.replay import ReplayServer
+
+#: Article fields filled by HTMLParser
+FIELDS = ('url', 'article_id', 'title', 'author', 'date', 'topics', 'text')
+
+
+class ParsingPoolTest(unittest.TestCase):
+    """
+    Tests for parsing downloaded pages in a process pool.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ParsingPoolTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.fixtures_path = TEST_PATH / 'fixtures'
+        generate_fixtures(self.fixtures_path, listing_pages=1, articles_per_page=3)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_config_is_sent_without_process_bound_objects(self) -> None:
+        """
+        Ensure a pickled configuration keeps its parameters
+        and creates its own session, rate limiter and statistics.
+        """
+        config = make_config(TEST_PATH, parsing_processes=2, sites=[])
+        session = config.get_session()
+        rate_limiter = config.get_rate_limiter()
+        config.get_crawl_stats().record('parse', 1.0)
+
+        restored = pickle.loads(pickle.dumps(config))
+        for getter in ('get_seed_urls', 'get_headers', 'get_partial_parsing', 'get_sites',
+                       'get_parsing_processes', 'get_timeout'):
+            self.assertEqual(repr(getattr(restored, getter)()), repr(getattr(config, getter)()))
+        self.assertIsNot(restored.get_session(), session)
+        self.assertIsNot(restored.get_rate_limiter(), rate_limiter)
+        self.assertEqual(restored.get_crawl_stats().summary()['stages'], {})
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_pool_parses_articles_as_inline_parsing(self) -> None:
+        """
+        Ensure articles parsed in the process pool are filled
+        as those parsed in the downloading thread.
+        """
+        with ReplayServer(self.fixtures_path, SYNTHETIC_ORIGIN) as server:
+            config = make_config(TEST_PATH, seed_urls=[f'{server.base_url}/news/?PAGEN_1=1'],
+                                 parsing_processes=2, respect_crawl_delay=False,
+                                 requests_per_second=100, burst_size=100, max_retries=0,
+                                 use_http_cache=False, sites=[])
+            urls = [server.to_local_url(f'{SYNTHETIC_ORIGIN}/news/{article_id}/')
+                    for article_id in (1000, 1001, 1002)]
+            with make_parsing_pool(config) as parsing_pool:
+                self.assertIsInstance(parsing_pool, ProcessPoolExecutor)
+                if 'forkserver' in multiprocessing.get_all_start_methods():
+                    context = parsing_pool._mp_context  # pylint: disable=protected-access
+                    self.assertEqual(context.get_start_method(), 'forkserver')
+                pooled = [collect_article(url, config, parsing_pool) for url in urls]
+            inline = [collect_article(url, config) for url in urls]
+
+        for pooled_article, inline_article in zip(pooled, inline):
+            self.assertEqual({field: getattr(pooled_article, field) for field in FIELDS},
+                             {field: getattr(inline_article, field) for field in FIELDS})
+        self.assertTrue(all(article.text for article in pooled))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ParsingPoolTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,101 @@
+"""
+Partial parsing validation.
+"""
+import shutil
+import unittest
+from typing import Any
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import generate_article_page, make_config
+from lab_5_scrapper.scrapper import HTMLParser
+
+#: Article fields filled by HTMLParser
+FIELDS = ('title', 'author', 'date', 'topics', 'text')
+
+
+class PartialParsingTest(unittest.TestCase):
+    """
+    Tests for parsing only the parts of article pages that selectors can match in.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for PartialParsingTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+
+    def _parse(self, url: str, html: str, **overrides: Any) -> tuple[dict, dict]:
+        """
+        Parse a page fully and partially.
+
+        Args:
+            url (str): Article url
+            html (str): Article page
+            **overrides (Any): Configuration parameters to replace
+
+        Returns:
+            tuple[dict, dict]: Filled article fields after full and after partial parsing
+        """
+        fields = []
+        for partial_parsing in (False, True):
+            config = make_config(TEST_PATH, partial_parsing=partial_parsing, **overrides)
+            article = HTMLParser(full_url=url, article_id=1, config=config).parse_html(html)
+            fields.append({field: getattr(article, field) for field in FIELDS})
+        return fields[0], fields[1]
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scrapper
+    def test_partial_parsing_fills_article_as_full_parsing(self) -> None:
+        """
+        Ensure articles of the default site are filled equally with and without partial parsing.
+        """
+        pages = (generate_article_page(),
+                 generate_article_page(paragraphs=1, noise_blocks=0),
+                 '<html><body><main><h1>Статья 1</h1><div class="author">Автор: Иван Иванов'
+                 '</div><p>Текст.</p></main><p>Подвал.</p></body></html>',
+                 '<html><body><p>Без основной части.</p></body></html>')
+        parsed = [self._parse('https://www.nkj.ru/news/1/', html, sites=[]) for html in pages]
+        for full, partial in parsed:
+            self.assertEqual(full, partial)
+        self.assertEqual(parsed[0][1]['title'], 'Заголовок статьи')
+        self.assertEqual(parsed[0][1]['text'].count('\n'), 30)
+        self.assertEqual(parsed[3][1]['text'], '')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scrapper
+    def test_partial_parsing_follows_site_selectors(self) -> None:
+        """
+        Ensure selectors with classes, ids and child combinators
+        keep the same parts of a page as the full tree gives.
+        """
+        site = {'name': 'example', 'base_url': 'https://example.com',
+                'seed_urls': ['https://example.com/news/'], 'total_articles': 1,
+                'title_selector': '#article-title', 'author_selector': 'span.byline',
+                'author_prefix': 'Автор:',
+                'text_selectors': ['div.content > p', 'blockquote']}
+        html = ('<html><body><h1>Меню</h1><h1 id="article-title"> Заголовок </h1>'
+                '<span class="byline wide">Автор: Анна Смирнова</span>'
+                '<div class="content wide"><p>Первый абзац.</p><div><p>Вложенный.</p></div>'
+                '<p>Второй абзац.</p></div><blockquote>Цитата.</blockquote>'
+                '<div class="sidebar"><p>Реклама.</p></div></body></html>')
+        full, partial = self._parse('https://example.com/news/1/', html, sites=[site])
+        self.assertEqual(full, partial)
+        self.assertEqual(partial['title'], 'Заголовок')
+        self.assertEqual(partial['author'], ['Анна Смирнова'])
+        self.assertEqual(partial['text'], 'Первый абзац.\nВторой абзац.\nЦитата.\n')
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for PartialParsingTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
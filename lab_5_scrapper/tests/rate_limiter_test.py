@@ -0,0 +1,296 @@
+"""
+Rate limit validation.
+"""
+import shutil
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import pytest
+import requests
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.crawler_utils import RateLimiter
+from lab_5_scrapper.fetching import respect_retry_after
+from lab_5_scrapper.scrapper import Config
+
+
+def _make_response(status_code: int, retry_after: str) -> requests.models.Response:
+    """
+    Make a response asking to retry later.
+
+    Args:
+        status_code (int): Response status
+        retry_after (str): Value of Retry-After header
+
+    Returns:
+        requests.models.Response: Response
+    """
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.headers['Retry-After'] = retry_after
+    return response
+
+
+def _make_robots_response(status_code: int, robots: str) -> requests.models.Response:
+    """
+    Make a response to a robots.txt request.
+
+    Args:
+        status_code (int): Response status
+        robots (str): Content of robots.txt
+
+    Returns:
+        requests.models.Response: Response
+    """
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = robots.encode('utf-8')  # pylint: disable=protected-access
+    response.encoding = 'utf-8'
+    return response
+
+
+class RateLimiterTest(unittest.TestCase):
+    """
+    Tests for RateLimiter.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_burst_is_free_and_further_requests_wait_for_tokens(self) -> None:
+        """
+        Ensure a burst of requests is not delayed, the next ones are spaced by the rate
+        and the bucket refills with time.
+        """
+        limiter = RateLimiter(requests_per_second=2, burst_size=3)
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            self.assertEqual([limiter.reserve('www.nkj.ru') for _ in range(5)],
+                             [0.0, 0.0, 0.0, 0.5, 1.0])
+            self.assertEqual(limiter.reserve('example.com'), 0.0,
+                             'Other hosts must have their own buckets')
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=101.0):
+            self.assertEqual(limiter.reserve('www.nkj.ru'), 0.5)
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=110.0):
+            self.assertEqual([limiter.reserve('www.nkj.ru') for _ in range(4)],
+                             [0.0, 0.0, 0.0, 0.5])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_acquire_sleeps_for_reserved_time(self) -> None:
+        """
+        Ensure acquire sleeps only when the request has to wait.
+        """
+        limiter = RateLimiter(requests_per_second=4, burst_size=1)
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0), \
+                mock.patch('lab_5_scrapper.crawler_utils.sleep') as sleep:
+            limiter.acquire('www.nkj.ru')
+            sleep.assert_not_called()
+            limiter.acquire('www.nkj.ru')
+            sleep.assert_called_once_with(0.25)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_paused_host_waits_until_pause_ends(self) -> None:
+        """
+        Ensure a pause delays requests to the host even if it has tokens, and only to it.
+        """
+        limiter = RateLimiter(requests_per_second=1, burst_size=5,
+                              host_limits={'example.com': (10, 1)})
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            limiter.pause('www.nkj.ru', 10)
+            limiter.pause('www.nkj.ru', 3)
+            self.assertEqual(limiter.reserve('www.nkj.ru'), 10.0)
+            self.assertEqual([limiter.reserve('example.com') for _ in range(2)], [0.0, 0.1])
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=110.0):
+            self.assertEqual(limiter.reserve('www.nkj.ru'), 0.0)
+
+
+class CrawlDelayTest(unittest.TestCase):
+    """
+    Tests for limits set by robots.txt and Retry-After.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CrawlDelayTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+
+    def _make_config(self, respect_crawl_delay: bool) -> Config:
+        """
+        Create configuration with a fast rate limit.
+
+        Args:
+            respect_crawl_delay (bool): Whether to follow robots.txt delays
+
+        Returns:
+            Config: Configuration
+        """
+        return make_config(TEST_PATH, seed_urls=['https://www.nkj.ru/news/'],
+                           respect_crawl_delay=respect_crawl_delay, requests_per_second=100,
+                           burst_size=1, sites=[])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_robots_delay_caps_request_rate(self) -> None:
+        """
+        Ensure the larger of Crawl-delay and Request-rate of robots.txt caps the rate of a host.
+        """
+        for robots, expected_wait in (('User-agent: *\nCrawl-delay: 2\n', 2.0),
+                                      ('User-agent: *\nCrawl-delay: 2\nRequest-rate: 1/5\n', 5.0),
+                                      ('User-agent: *\nDisallow: /admin/\n', 0.01)):
+            config = self._make_config(respect_crawl_delay=True)
+            with mock.patch('lab_5_scrapper.fetching.download',
+                            return_value=_make_robots_response(200, robots)) as download, \
+                    mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+                limiter = config.get_rate_limiter()
+                self.assertEqual(limiter.reserve('www.nkj.ru'), 0.0)
+                self.assertAlmostEqual(limiter.reserve('www.nkj.ru'), expected_wait)
+            download.assert_called_once_with('https://www.nkj.ru/robots.txt', config)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_robots_is_retried_after_transient_failures(self) -> None:
+        """
+        Ensure robots.txt is requested again after a timeout or a 5xx answer
+        up to max_retries times and is ignored if it is still unavailable.
+        """
+        config = self._make_config(respect_crawl_delay=True)
+        robots = _make_robots_response(200, 'User-agent: *\nCrawl-delay: 2\n')
+        unavailable = _make_robots_response(503, '')
+        with mock.patch('lab_5_scrapper.fetching.download',
+                        side_effect=[requests.Timeout(), unavailable, robots]) as download, \
+                mock.patch('lab_5_scrapper.fetching.sleep') as sleep, \
+                mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            limiter = config.get_rate_limiter()
+            self.assertEqual([limiter.reserve('www.nkj.ru') for _ in range(2)], [0.0, 2.0])
+        self.assertEqual(download.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+        config = self._make_config(respect_crawl_delay=True)
+        with mock.patch('lab_5_scrapper.fetching.download',
+                        side_effect=[unavailable, requests.ConnectionError(),
+                                     unavailable]) as download, \
+                mock.patch('lab_5_scrapper.fetching.sleep'), \
+                mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            limiter = config.get_rate_limiter()
+            self.assertEqual([limiter.reserve('www.nkj.ru') for _ in range(2)], [0.0, 0.01])
+        self.assertEqual(download.call_count, config.get_max_retries() + 1)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_slow_robots_does_not_hold_up_other_hosts(self) -> None:
+        """
+        Ensure requests to other hosts are scheduled while robots.txt of a host is read
+        and robots.txt is read once for all requests waiting for it.
+        """
+        robots_requested = threading.Event()
+        robots_released = threading.Event()
+        requested_hosts = []
+
+        def get_crawl_delay(host: str) -> None:
+            """
+            Read robots.txt of slow.example.com only when it is released.
+
+            Args:
+                host (str): Host name
+            """
+            requested_hosts.append(host)
+            if host == 'slow.example.com':
+                robots_requested.set()
+                robots_released.wait(timeout=5)
+
+        limiter = RateLimiter(requests_per_second=100, burst_size=10,
+                              crawl_delay_getter=get_crawl_delay)
+        slow_requests = [threading.Thread(target=limiter.reserve, args=('slow.example.com',))
+                         for _ in range(2)]
+        for slow_request in slow_requests:
+            slow_request.start()
+        robots_requested.wait(timeout=5)
+        fast_request = threading.Thread(target=limiter.reserve, args=('fast.example.com',))
+        fast_request.start()
+        fast_request.join(timeout=2)
+        self.assertFalse(fast_request.is_alive())
+        self.assertNotIn('slow.example.com', limiter)
+
+        robots_released.set()
+        for slow_request in slow_requests:
+            slow_request.join(timeout=5)
+        self.assertIn('slow.example.com', limiter)
+        self.assertEqual(sorted(requested_hosts), ['fast.example.com', 'slow.example.com'])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_robots_is_not_read_when_delay_is_ignored(self) -> None:
+        """
+        Ensure robots.txt is neither requested nor followed if respect_crawl_delay is off.
+        """
+        config = self._make_config(respect_crawl_delay=False)
+        with mock.patch('lab_5_scrapper.fetching.download') as download, \
+                mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            limiter = config.get_rate_limiter()
+            self.assertEqual([limiter.reserve('www.nkj.ru') for _ in range(2)], [0.0, 0.01])
+        download.assert_not_called()
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_retry_after_pauses_host(self) -> None:
+        """
+        Ensure Retry-After in seconds and as an HTTP date pauses the host for that time.
+        """
+        retry_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30),
+                                     usegmt=True)
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            limiter = RateLimiter(requests_per_second=100, burst_size=10)
+            respect_retry_after(_make_response(429, '20'), 'www.nkj.ru', limiter)
+            self.assertEqual(limiter.reserve('www.nkj.ru'), 20.0)
+
+            limiter = RateLimiter(requests_per_second=100, burst_size=10)
+            respect_retry_after(_make_response(503, retry_date), 'www.nkj.ru', limiter)
+            self.assertTrue(28 < limiter.reserve('www.nkj.ru') <= 30)
+
+            limiter = RateLimiter(requests_per_second=100, burst_size=10)
+            for response in (_make_response(200, '20'), _make_response(429, 'soon')):
+                respect_retry_after(response, 'www.nkj.ru', limiter)
+            self.assertEqual(limiter.reserve('www.nkj.ru'), 0.0)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CrawlDelayTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
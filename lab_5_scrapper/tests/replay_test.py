@@ -0,0 +1,84 @@
+"""
+Offline replay validation.
+"""
+import shutil
+import unittest
+
+import pytest
+import requests
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.replay import FixtureStore, ReplayServer
+from lab_5_scrapper.scrapper import Crawler, HTMLParser
+
+
+class ReplayTest(unittest.TestCase):
+    """
+    Tests for FixtureStore and ReplayServer.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ReplayTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.fixtures_path = TEST_PATH / 'fixtures'
+        store = FixtureStore(self.fixtures_path)
+        store.save('https://www.nkj.ru/news/?PAGEN_1=1', 200, 'text/html; charset=utf-8',
+                   '<html><body><div class="news-list">'
+                   '<article><h2><a href="/news/1/">1</a></h2></article>'
+                   '<article><h2><a href="https://www.nkj.ru/news/2/">2</a></h2></article>'
+                   '</div></body></html>'.encode('utf-8'))
+        for article_id in (1, 2):
+            store.save(f'https://www.nkj.ru/news/{article_id}/', 200, 'text/html; charset=utf-8',
+                       f'<html><body><main><h1>Статья {article_id}</h1>'
+                       f'<div class="author">Автор: Иван Иванов</div><p>Текст.</p></main>'
+                       f'</body></html>'.encode('utf-8'))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_fixtures_are_reloaded_from_disk(self) -> None:
+        """
+        Ensure recorded responses survive reopening the fixture directory.
+        """
+        store = FixtureStore(self.fixtures_path)
+        self.assertEqual(len(store), 3)
+        status, content_type, body = store.load('https://www.nkj.ru/news/1/')
+        self.assertEqual((status, content_type), (200, 'text/html; charset=utf-8'))
+        self.assertIn('Статья 1', body.decode('utf-8'))
+        self.assertIsNone(store.load('https://www.nkj.ru/news/3/'))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawler_and_parser_run_against_replay_server(self) -> None:
+        """
+        Ensure the crawler finds and the parser parses recorded articles through the server.
+        """
+        with ReplayServer(self.fixtures_path, 'https://www.nkj.ru', latency=0.01) as server:
+            seed_url = server.to_local_url('https://www.nkj.ru/news/?PAGEN_1=1')
+            config = make_config(TEST_PATH, seed_urls=[seed_url],
+                                 total_articles_to_find_and_parse=2, respect_crawl_delay=False,
+                                 requests_per_second=100, burst_size=100, sites=[])
+            crawler = Crawler(config)
+            crawler.find_articles()
+            self.assertEqual(crawler.urls, [f'{server.base_url}/news/1/',
+                                            f'{server.base_url}/news/2/'])
+            article = HTMLParser(crawler.urls[1], 2, config).parse()
+            self.assertEqual(article.title, 'Статья 2')
+            self.assertEqual(requests.get(f'{server.base_url}/news/3/', timeout=5).status_code,
+                             404)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ReplayTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
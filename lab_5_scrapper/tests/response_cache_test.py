@@ -0,0 +1,232 @@
+"""
+Conditional-GET response cache validation.
+"""
+import shutil
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest import mock
+
+import pytest
+import requests
+from admin_utils.test_params import TEST_PATH
+
+from core_utils import constants
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.crawler_utils import ResponseCache
+from lab_5_scrapper.fetching import make_request
+from lab_5_scrapper.scrapper import Config
+
+
+class _ValidatingHandler(BaseHTTPRequestHandler):
+    """
+    Handler serving pages with validators and answering 304 to matching conditional requests.
+    """
+
+    #: Path, validators and answered status of every request
+    received: list[tuple[str, dict[str, str], int]] = []
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Serve a page or confirm that a cached one is not modified.
+        """
+        etag = f'"{self.path}"'
+        validators = {name: self.headers[name] for name in ('If-None-Match', 'If-Modified-Since')
+                      if name in self.headers}
+        status = 304 if validators.get('If-None-Match') == etag else 200
+        self.received.append((self.path, validators, status))
+        self.send_response(status)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', 'Wed, 21 Oct 2015 07:28:00 GMT')
+        if status == 304:
+            self.end_headers()
+            return
+        body = f'<html><body><h1>Страница {self.path}</h1></body></html>'.encode('utf-8')
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """
+        Keep test output free of request logs.
+
+        Args:
+            format (str): Message format
+            *args (Any): Message arguments
+        """
+
+
+def _make_response(body: bytes, etag: str) -> requests.models.Response:
+    """
+    Make a successful response with an ETag.
+
+    Args:
+        body (bytes): Response body
+        etag (str): Value of ETag header
+
+    Returns:
+        requests.models.Response: Response
+    """
+    response = requests.models.Response()
+    response.status_code = 200
+    response.headers['ETag'] = etag
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    response._content = body  # pylint: disable=protected-access
+    return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """
+    Tests for ResponseCache and conditional requests made by make_request.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ResponseCacheTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.cache_path = TEST_PATH / 'http_cache'
+        _ValidatingHandler.received = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _ValidatingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def _make_config(self) -> Config:
+        """
+        Create configuration with the response cache enabled.
+
+        Returns:
+            Config: Configuration
+        """
+        return make_config(TEST_PATH, seed_urls=[f'{self.base_url}/news/'], use_http_cache=True,
+                           respect_crawl_delay=False, requests_per_second=100, burst_size=100,
+                           max_retries=0, fixtures_path='', sites=[])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_not_modified_page_is_served_from_disk(self) -> None:
+        """
+        Ensure validators of a cached page are sent and a 304 answer is served as 200 from disk.
+        """
+        with mock.patch.object(constants, 'HTTP_CACHE_PATH', self.cache_path):
+            config = self._make_config()
+            first = make_request(f'{self.base_url}/news/1/', config)
+            second = make_request(f'{self.base_url}/news/1/', config)
+
+        self.assertEqual([(validators, status) for _, validators, status in
+                          _ValidatingHandler.received],
+                         [({}, 200),
+                          ({'If-None-Match': '"/news/1/"',
+                            'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}, 304)])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.headers['Content-Type'], 'text/html; charset=utf-8')
+        self.assertEqual(second.text, first.text)
+        self.assertIn('Страница /news/1/', second.text)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_evicted_page_is_downloaded_again(self) -> None:
+        """
+        Ensure a page whose body is evicted is downloaded again in full,
+        also when it is evicted after a conditional request is sent.
+        """
+        with mock.patch.object(constants, 'HTTP_CACHE_PATH', self.cache_path):
+            config = self._make_config()
+            make_request(f'{self.base_url}/news/1/', config)
+            for body_file in self.cache_path.glob('*.body'):
+                body_file.unlink()
+            evicted = make_request(f'{self.base_url}/news/1/', config)
+            with mock.patch.object(ResponseCache, 'load', return_value=None):
+                evicted_meanwhile = make_request(f'{self.base_url}/news/1/', config)
+
+        self.assertEqual([(bool(validators), status) for _, validators, status in
+                          _ValidatingHandler.received],
+                         [(False, 200), (False, 200), (True, 304), (False, 200)])
+        for response in (evicted, evicted_meanwhile):
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('Страница /news/1/', response.text)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_body_evicted_after_revalidation_is_not_restored(self) -> None:
+        """
+        Ensure a 304 answer is not filled when the body has been evicted meanwhile.
+        """
+        cache = ResponseCache(self.cache_path, max_size=100)
+        cache.store('https://www.nkj.ru/news/1/', _make_response(b'page', '"1"'))
+        self.assertEqual(cache.get_validators('https://www.nkj.ru/news/1/'),
+                         {'If-None-Match': '"1"'})
+        for body_file in self.cache_path.glob('*.body'):
+            body_file.unlink()
+
+        not_modified = requests.models.Response()
+        not_modified.status_code = 304
+        self.assertIsNone(cache.load('https://www.nkj.ru/news/1/', not_modified))
+        self.assertEqual(cache.get_validators('https://www.nkj.ru/news/1/'), {})
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_least_recently_used_bodies_are_evicted(self) -> None:
+        """
+        Ensure bodies exceeding max_size are evicted least recently used first, across reopening.
+        """
+        cache = ResponseCache(self.cache_path, max_size=10)
+        cache.store('https://www.nkj.ru/news/1/', _make_response(b'1111', '"1"'))
+        cache.store('https://www.nkj.ru/news/2/', _make_response(b'2222', '"2"'))
+        not_modified = requests.models.Response()
+        not_modified.status_code = 304
+        self.assertEqual(cache.load('https://www.nkj.ru/news/1/', not_modified).content, b'1111')
+        cache.store('https://www.nkj.ru/news/3/', _make_response(b'3333', '"3"'))
+
+        self.assertEqual(cache.get_validators('https://www.nkj.ru/news/2/'), {})
+        self.assertEqual(len(list(self.cache_path.glob('*.body'))), 2)
+
+        reopened = ResponseCache(self.cache_path, max_size=10)
+        reopened.store('https://www.nkj.ru/news/4/', _make_response(b'4444', '"4"'))
+        self.assertEqual(reopened.get_validators('https://www.nkj.ru/news/1/'), {})
+        for article_id in (3, 4):
+            self.assertEqual(reopened.get_validators(f'https://www.nkj.ru/news/{article_id}/'),
+                             {'If-None-Match': f'"{article_id}"'})
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_responses_without_validators_are_not_cached(self) -> None:
+        """
+        Ensure a response that cannot be revalidated is not kept.
+        """
+        cache = ResponseCache(self.cache_path, max_size=100)
+        response = _make_response(b'page', '"1"')
+        del response.headers['ETag']
+        cache.store('https://www.nkj.ru/news/1/', response)
+        self.assertEqual(cache.get_validators('https://www.nkj.ru/news/1/'), {})
+        self.assertFalse(list(self.cache_path.glob('*.body')))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ResponseCacheTest class.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
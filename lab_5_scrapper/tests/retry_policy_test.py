@@ -0,0 +1,79 @@
+"""
+Retry policy validation.
+"""
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_5_scrapper.crawler_utils import backoff_delay, CircuitBreaker
+
+
+class BackoffDelayTest(unittest.TestCase):
+    """
+    Tests for backoff_delay.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_backoff_delay_grows_exponentially_up_to_limit(self) -> None:
+        """
+        Ensure the delay bound doubles with every attempt and does not exceed the limit.
+        """
+        with mock.patch('lab_5_scrapper.crawler_utils.random.uniform',
+                        side_effect=lambda low, high: high):
+            self.assertEqual([backoff_delay(attempt, 0.5, 3.0) for attempt in range(5)],
+                             [0.5, 1.0, 2.0, 3.0, 3.0])
+        for attempt in range(5):
+            self.assertTrue(0 <= backoff_delay(attempt, 0.5, 3.0) <= 3.0)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """
+    Tests for CircuitBreaker.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_circuit_opens_after_threshold_failures(self) -> None:
+        """
+        Ensure a host is refused only after the given number of failures in a row.
+        """
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        breaker.record_failure('www.nkj.ru')
+        breaker.record_failure('www.nkj.ru')
+        breaker.record_success('www.nkj.ru')
+        breaker.record_failure('www.nkj.ru')
+        breaker.record_failure('www.nkj.ru')
+        self.assertTrue(breaker.allow('www.nkj.ru'))
+
+        breaker.record_failure('www.nkj.ru')
+        self.assertFalse(breaker.allow('www.nkj.ru'))
+        self.assertTrue(breaker.allow('example.com'), 'Other hosts must not be paused')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_circuit_lets_single_trial_request_after_timeout(self) -> None:
+        """
+        Ensure one trial request is allowed after reset timeout and success closes the circuit.
+        """
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=100.0):
+            breaker.record_failure('www.nkj.ru')
+        with mock.patch('lab_5_scrapper.crawler_utils.monotonic', return_value=161.0):
+            self.assertTrue(breaker.allow('www.nkj.ru'))
+            self.assertFalse(breaker.allow('www.nkj.ru'))
+        breaker.record_success('www.nkj.ru')
+        self.assertTrue(breaker.allow('www.nkj.ru'))
@@ -0,0 +1,86 @@
+"""
+Seen URL index validation.
+"""
+import unittest
+
+import pytest
+
+from lab_5_scrapper.crawler_utils import canonicalize_url, SeenURLIndex
+
+
+class CanonicalizeURLTest(unittest.TestCase):
+    """
+    Tests for URL canonicalization.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_canonicalize_url_ignores_cosmetic_differences(self) -> None:
+        """
+        Ensure urls of the same page are canonicalized equally.
+        """
+        reference = canonicalize_url('https://www.nkj.ru/news/12345/?a=1&b=2')
+        for url in ('https://www.nkj.ru/news/12345?a=1&b=2',
+                    'https://www.nkj.ru/news/12345/?b=2&a=1',
+                    'HTTPS://WWW.NKJ.RU/news/12345/?a=1&b=2#comments',
+                    'https://www.nkj.ru:443/news/12345/?a=1&b=2'):
+            self.assertEqual(reference, canonicalize_url(url),
+                             f'{url} must be canonicalized to {reference}')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_canonicalize_url_keeps_meaningful_differences(self) -> None:
+        """
+        Ensure urls of different pages stay different.
+        """
+        self.assertNotEqual(canonicalize_url('https://www.nkj.ru/news/1/'),
+                            canonicalize_url('https://www.nkj.ru/news/2/'))
+        self.assertNotEqual(canonicalize_url('https://www.nkj.ru/news/?PAGEN_1=2'),
+                            canonicalize_url('https://www.nkj.ru/news/?PAGEN_1=3'))
+
+
+class SeenURLIndexTest(unittest.TestCase):
+    """
+    Tests for SeenURLIndex.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_add_reports_new_urls_only(self) -> None:
+        """
+        Ensure add() returns True only for urls not seen before.
+        """
+        index = SeenURLIndex()
+        self.assertTrue(index.add('https://www.nkj.ru/news/1/'))
+        self.assertFalse(index.add('https://www.nkj.ru/news/1'))
+        self.assertIn('https://www.nkj.ru/news/1/#top', index)
+        self.assertEqual(len(index), 1)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_update_keeps_canonical_urls(self) -> None:
+        """
+        Ensure update() marks every url as seen and equivalent urls are kept once.
+        """
+        index = SeenURLIndex()
+        index.update(['https://www.nkj.ru/news/1/', 'https://www.nkj.ru/news/2',
+                      'https://www.nkj.ru/news/2/#comments'])
+        self.assertEqual(sorted(index), [canonicalize_url('https://www.nkj.ru/news/1/'),
+                                         canonicalize_url('https://www.nkj.ru/news/2/')])
+        self.assertFalse(index.add('https://www.nkj.ru/news/2/'))
@@ -0,0 +1,71 @@
+"""
+Shared HTTP session validation.
+"""
+import shutil
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.benchmark import make_config
+
+
+class SessionTest(unittest.TestCase):
+    """
+    Tests for the HTTP session of Config.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for SessionTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_session_is_created_once_and_shared_by_threads(self) -> None:
+        """
+        Ensure all threads get the same session.
+        """
+        config = make_config(TEST_PATH, sites=[])
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: config.get_session(), range(32)))
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+        self.assertIs(config.get_session(), sessions[0])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_session_follows_pool_and_header_parameters(self) -> None:
+        """
+        Ensure the connection pool has the configured sizes, blocks when exhausted
+        and the session sends configured headers, closing connections if keep_alive is off.
+        """
+        config = make_config(TEST_PATH, pool_connections=3, pool_maxsize=7, keep_alive=True,
+                             sites=[])
+        session = config.get_session()
+        for prefix in ('http://', 'https://'):
+            adapter = session.get_adapter(f'{prefix}www.nkj.ru/news/')
+            self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 7)
+            self.assertTrue(adapter.poolmanager.connection_pool_kw['block'])
+            self.assertEqual(adapter._pool_connections, 3)  # pylint: disable=protected-access
+        for name, value in config.get_headers().items():
+            self.assertEqual(session.headers[name], value)
+        self.assertNotEqual(session.headers.get('Connection'), 'close')
+
+        config = make_config(TEST_PATH, keep_alive=False, sites=[])
+        self.assertEqual(config.get_session().headers['Connection'], 'close')
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for SessionTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,199 @@
+"""
+Multi-site crawling validation.
+"""
+import json
+import shutil
+import threading
+import unittest
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_5_scrapper.collection import MultiSiteCrawler
+from lab_5_scrapper.config_validation import IncorrectSiteProfileError
+from lab_5_scrapper.scrapper import Config, Crawler, HTMLParser
+
+
+def _listing(links: list[str]) -> mock.Mock:
+    """
+    Make a response with a listing page of a site.
+
+    Args:
+        links (list[str]): Hrefs of article links
+
+    Returns:
+        mock.Mock: Response stand-in
+    """
+    items = ''.join(f'<li class="story"><a class="headline" href="{link}">x</a></li>'
+                    for link in links)
+    return mock.Mock(ok=True, text=f'<html><body><ul>{items}</ul></body></html>')
+
+
+class SiteProfileTest(unittest.TestCase):
+    """
+    Tests for crawling several sites with their own profiles.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for SiteProfileTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.config_content = {
+            'seed_urls': ['https://www.nkj.ru/news/'],
+            'total_articles_to_find_and_parse': 3,
+            'headers': {},
+            'encoding': 'utf-8',
+            'timeout': 5,
+            'should_verify_certificate': True,
+            'headless_mode': True,
+            'sites': [
+                {'name': 'first', 'base_url': 'https://first.example.com',
+                 'seed_urls': ['https://first.example.com/news/'], 'total_articles': 3,
+                 'article_link_selector': 'li.story a.headline', 'title_selector': 'h2.title',
+                 'author_selector': '.byline', 'author_prefix': 'By',
+                 'text_selectors': ['.body p'],
+                 'requests_per_second': 5, 'burst_size': 2},
+                {'name': 'second', 'base_url': 'https://second.example.com',
+                 'seed_urls': ['https://second.example.com/'], 'total_articles': 2,
+                 'article_link_selector': 'li.story a.headline'}
+            ]
+        }
+
+    def _make_config(self) -> Config:
+        """
+        Write config content to disk and read it.
+
+        Returns:
+            Config: Configuration
+        """
+        config_path = TEST_PATH / 'sites_config.json'
+        with open(config_path, 'w', encoding='utf-8') as config_file:
+            json.dump(self.config_content, config_file)
+        return Config(config_path)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_default_site_is_made_of_seed_urls(self) -> None:
+        """
+        Ensure a config without sites crawls seed urls with common settings.
+        """
+        del self.config_content['sites']
+        config = self._make_config()
+        site = config.get_sites()[0]
+        self.assertEqual(site.base_url, 'https://www.nkj.ru')
+        self.assertEqual(site.seed_urls, config.get_seed_urls())
+        self.assertEqual(site.total_articles, config.get_num_articles())
+        self.assertEqual(Crawler(config).get_search_urls(), config.get_seed_urls())
+
+        article = HTMLParser('https://www.nkj.ru/news/1/', 1, config).parse_html(
+            '<html><body><main><h1> Title </h1><div class="author">Автор: Иван Иванов     </div>'
+            '<p>Text.</p></main></body></html>')
+        self.assertEqual(article.title, 'Title')
+        self.assertEqual(article.author, ['Иван Иванов'])
+
+        for html in ('<html><body><main><h1>Title</h1><p>Text.</p></main></body></html>',
+                     '<html><body><main><div class="author">Автор: </div></main></body></html>'):
+            article = HTMLParser('https://www.nkj.ru/news/2/', 2, config).parse_html(html)
+            self.assertEqual(article.author, ['NOT FOUND'])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_sites_are_crawled_in_turn_within_budgets(self) -> None:
+        """
+        Ensure article urls of all sites are interleaved and each site keeps its own budget.
+        """
+        # the article of the first site found by the second one counts against its budget
+        self.config_content['sites'][1]['total_articles'] = 3
+        config = self._make_config()
+        pages = {'https://first.example.com/news/': _listing(['/a/1', '/a/2', '/a/3', '/a/4']),
+                 'https://second.example.com/': _listing(['b/1', 'https://first.example.com/a/1',
+                                                          'b/2'])}
+        with mock.patch('lab_5_scrapper.scrapper.make_request',
+                        side_effect=lambda url, _: pages[url]):
+            urls = list(MultiSiteCrawler(config).discover_urls())
+        self.assertEqual(urls, ['https://first.example.com/a/1', 'https://second.example.com/b/1',
+                                'https://first.example.com/a/2', 'https://first.example.com/a/3',
+                                'https://second.example.com/b/2'])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_slow_site_does_not_hold_up_others(self) -> None:
+        """
+        Ensure sites are crawled at once while their urls keep the merge order.
+        """
+        config = self._make_config()
+        second_site_visited = threading.Event()
+
+        def make_request(url: str, _: Config) -> mock.Mock:
+            if url.startswith('https://first.example.com'):
+                self.assertTrue(second_site_visited.wait(timeout=5))
+                return _listing(['/a/1'])
+            second_site_visited.set()
+            return _listing(['b/1', 'b/2'])
+
+        with mock.patch('lab_5_scrapper.scrapper.make_request', side_effect=make_request):
+            crawler = MultiSiteCrawler(config)
+            urls = list(crawler.discover_urls())
+        self.assertEqual(urls, ['https://first.example.com/a/1', 'https://second.example.com/b/1',
+                                'https://second.example.com/b/2'])
+        self.assertEqual(crawler.get_state()['sites']['second']['urls'], urls[1:])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scrapper
+    def test_parser_uses_selectors_of_article_site(self) -> None:
+        """
+        Ensure an article is parsed with selectors of the site it belongs to.
+        """
+        config = self._make_config()
+        parser = HTMLParser('https://first.example.com/a/1', 1, config)
+        article = parser.parse_html('<html><body><h1>Site</h1><h2 class="title">Title</h2>'
+                                    '<span class="byline"> By Jane Doe </span>'
+                                    '<div class="body"><p>Text.</p></div><p>Footer</p>'
+                                    '</body></html>')
+        self.assertEqual(article.title, 'Title')
+        self.assertEqual(article.author, ['Jane Doe'])
+        self.assertEqual(article.text, 'Text.\n')
+        self.assertEqual(config.get_site('https://second.example.com/b/1').name, 'second')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_sites_are_rejected(self) -> None:
+        """
+        Ensure sites without required fields, with unknown fields or repeated names are rejected.
+        """
+        sites = self.config_content['sites']
+        for incorrect_sites in ({'name': 'first'}, [{**sites[0], 'total_articles': 0}],
+                                [{**sites[0], 'selector': 'a'}], [sites[0], sites[0]],
+                                [{**sites[1], 'burst_size': True}],
+                                [{**sites[1], 'author_prefix': None}]):
+            self.config_content['sites'] = incorrect_sites
+            with self.assertRaises(IncorrectSiteProfileError):
+                self._make_config()
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for SiteProfileTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
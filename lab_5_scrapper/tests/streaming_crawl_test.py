@@ -0,0 +1,144 @@
+"""
+Streaming of discovered articles validation.
+"""
+import shutil
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.article.article import Article
+from lab_5_scrapper.benchmark import make_config
+from lab_5_scrapper.collection import crawl
+from lab_5_scrapper.scrapper import Crawler
+
+#: Articles linked from every listing page
+LISTING_PAGES = {1: (1, 2), 2: (3,), 3: (4,)}
+
+
+class _SlowListingHandler(BaseHTTPRequestHandler):
+    """
+    Handler serving listing pages that answer only after the first article is requested.
+    """
+
+    #: Set once the first article is requested
+    first_article_requested = threading.Event()
+
+    #: Whether the first article was requested before each listing page was answered
+    answered_after_first_article: list[bool] = []
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Serve a listing page or an article.
+        """
+        if 'PAGEN_1=' in self.path:
+            page = int(self.path.rsplit('=', 1)[1])
+            if page > 1:
+                self.answered_after_first_article.append(
+                    self.first_article_requested.wait(timeout=5))
+                time.sleep(0.2)
+            links = ''.join(f'<article><h2><a href="/news/{article_id}/">Статья</a></h2>'
+                            f'</article>' for article_id in LISTING_PAGES[page])
+            next_link = (f'<a class="modern-page-next" href="/news/?PAGEN_1={page + 1}">Далее</a>'
+                         if page + 1 in LISTING_PAGES else '')
+            body = f'<html><body><div class="news-list">{links}</div>{next_link}</body></html>'
+        else:
+            if self.path == '/news/1/':
+                self.first_article_requested.set()
+            body = (f'<html><body><main><h1>Статья {self.path}</h1><p>Текст.</p></main>'
+                    f'</body></html>')
+        content = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """
+        Keep test output free of request logs.
+
+        Args:
+            format (str): Message format
+            *args (Any): Message arguments
+        """
+
+
+class StreamingCrawlTest(unittest.TestCase):
+    """
+    Tests for collecting articles while listing pages are still being visited.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for StreamingCrawlTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        _SlowListingHandler.first_article_requested = threading.Event()
+        _SlowListingHandler.answered_after_first_article = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowListingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_articles_are_collected_while_listing_pages_are_slow(self) -> None:
+        """
+        Ensure the first article is downloaded while the next listing page is awaited
+        and saved before discovery of articles finishes.
+        """
+        config = make_config(TEST_PATH, seed_urls=[f'{self.base_url}/news/?PAGEN_1=1'],
+                             total_articles_to_find_and_parse=4, respect_crawl_delay=False,
+                             requests_per_second=100, burst_size=100, max_retries=0,
+                             use_http_cache=False, use_checkpoints=False, parsing_processes=0,
+                             fixtures_path='', sites=[])
+        crawler = Crawler(config)
+        discover_urls = crawler.discover_urls
+        events: list[str] = []
+
+        def record_discovery() -> Iterator[str]:
+            """
+            Find articles, recording when discovery finishes.
+
+            Yields:
+                str: Url of a newly found article
+            """
+            yield from discover_urls()
+            events.append('discovery finished')
+
+        def record_saving(article: Article, *_: Any) -> None:
+            """
+            Record a saved article instead of writing it.
+
+            Args:
+                article (Article): Saved article
+                *_ (Any): Configuration
+            """
+            events.append(f'saved {article.url}')
+
+        with mock.patch.object(crawler, 'discover_urls', side_effect=record_discovery), \
+                mock.patch('lab_5_scrapper.collection.save_article', side_effect=record_saving):
+            crawl(crawler, config, first_article_id=1)
+
+        self.assertEqual(_SlowListingHandler.answered_after_first_article, [True, True])
+        self.assertEqual(events[0], f'saved {self.base_url}/news/1/')
+        self.assertEqual(sorted(events[1:]), sorted(['discovery finished',
+                                                     *(f'saved {self.base_url}/news/{article_id}/'
+                                                       for article_id in (2, 3, 4))]))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for StreamingCrawlTest class.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,304 @@
+"""
+Benchmarks for the pipeline hot spots.
+"""
+import argparse
+import difflib
+import json
+import pathlib
+import tempfile
+from time import perf_counter
+
+from core_utils.article.article import get_article_id_from_filepath, split_by_sentence
+from core_utils.constants import UDPIPE_MODEL_PATH
+from lab_6_pipeline.pipeline import (CorpusManager, CorpusManifest, index_dataset,
+                                     split_into_chunks, UDPipeAnalyzer)
+
+
+def generate_corpus(path: pathlib.Path, articles: int) -> None:
+    """
+    Write a corpus of small raw texts and meta information.
+
+    Args:
+        path (pathlib.Path): Folder to write the corpus to
+        articles (int): Number of articles, each of them takes two files
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    for article_id in range(1, articles + 1):
+        (path / f'{article_id}_raw.txt').write_text(f'Текст статьи {article_id}.',
+                                                    encoding='utf-8')
+        with open(path / f'{article_id}_meta.json', 'w', encoding='utf-8') as meta_file:
+            json.dump({'id': article_id, 'url': None, 'title': '', 'date': None,
+                       'author': [], 'topics': []}, meta_file)
+
+
+def discover_by_globs(path: pathlib.Path) -> list[int]:
+    """
+    Find and validate dataset entries the way CorpusManager did before the single scan.
+
+    The folder is listed once, globbed three times and every raw and meta file is stat-ed.
+
+    Args:
+        path (pathlib.Path): Path to dataset folder
+
+    Returns:
+        list[int]: Article ids
+    """
+    if not list(path.iterdir()):
+        raise ValueError('Empty corpus')
+    raw_files = sorted(path.glob('*_raw.txt'), key=get_article_id_from_filepath)
+    meta_files = sorted(path.glob('*_meta.json'), key=get_article_id_from_filepath)
+    for index, (raw_file, meta_file) in enumerate(zip(raw_files, meta_files)):
+        if (index + 1 != get_article_id_from_filepath(raw_file)
+                or index + 1 != get_article_id_from_filepath(meta_file)
+                or not raw_file.stat().st_size or not meta_file.stat().st_size):
+            raise ValueError('Inconsistent corpus')
+    return [get_article_id_from_filepath(file) for file in path.glob('*_raw.txt')]
+
+
+def benchmark_corpus_scan(path: pathlib.Path, repeat: int) -> dict[str, float]:
+    """
+    Compare discovering a corpus with globs and with a single directory scan.
+
+    Reading the files from a manifest of the unchanged corpus is compared
+    with them, the manifest is written to CORPUS_MANIFESTS_PATH beforehand.
+    Opening the corpus with CorpusManager in lazy mode is timed as well:
+    it validates the scanned files and creates an article for each of them
+    without reading texts.
+
+    Args:
+        path (pathlib.Path): Path to dataset folder
+        repeat (int): Number of measurements, the best one is reported
+
+    Returns:
+        dict[str, float]: Seconds spent by each way of discovery
+    """
+    results = {}
+    CorpusManifest(path).update()
+    for mode, discover in (('globs', lambda: len(discover_by_globs(path))),
+                           ('scandir', lambda: len(index_dataset(path))),
+                           ('manifest', lambda: len(CorpusManifest(path).load() or {})),
+                           ('lazy corpus', lambda: len(CorpusManager(path, lazy=True)
+                                                       .get_articles())),
+                           ('lazy manifest', lambda: len(CorpusManager(path, lazy=True,
+                                                                       use_manifest=True)
+                                                         .get_articles()))):
+        timings = []
+        for _ in range(repeat):
+            start = perf_counter()
+            found = discover()
+            timings.append(perf_counter() - start)
+        if not found:
+            raise ValueError('No articles were found')
+        results[mode] = min(timings)
+    return results
+
+
+def load_sentences(path: pathlib.Path | None, count: int) -> list[str]:
+    """
+    Read sentences of corpus texts or make synthetic ones.
+
+    Args:
+        path (pathlib.Path | None): Path to dataset folder, synthetic sentences are made if None
+        count (int): Number of sentences
+
+    Returns:
+        list[str]: Sentences
+    """
+    if path is None:
+        return [f'Учёные института номер {index} опубликовали статью о новых свойствах '
+                f'материалов, которые применяются в медицине.' for index in range(count)]
+    sentences: list[str] = []
+    for raw_file in sorted(path.glob('*_raw.txt'), key=get_article_id_from_filepath):
+        sentences.extend(split_by_sentence(raw_file.read_text(encoding='utf-8')))
+        if len(sentences) >= count:
+            break
+    return sentences[:count]
+
+
+def benchmark_analysis(sentences: list[str], batch_sizes: list[int],
+                       n_process: int) -> dict[str, float]:
+    """
+    Compare analyzing sentences one by one and in batches with UDPipeAnalyzer.
+
+    Args:
+        sentences (list[str]): Sentences to analyze
+        batch_sizes (list[int]): Numbers of sentences passed through the model at once
+        n_process (int): Number of processes spaCy analyzes batches in
+
+    Returns:
+        dict[str, float]: Sentences analyzed per second in each mode
+    """
+    analyzer = UDPipeAnalyzer()
+    start = perf_counter()
+    reference = [document for sentence in sentences for document in analyzer.analyze([sentence])]
+    results = {'one by one': len(sentences) / (perf_counter() - start)}
+
+    for batch_size in batch_sizes:
+        analyzer = UDPipeAnalyzer(batch_size=batch_size, n_process=n_process)
+        start = perf_counter()
+        documents = analyzer.analyze(sentences)
+        results[f'batches of {batch_size}'] = len(sentences) / (perf_counter() - start)
+        if documents != reference:
+            raise ValueError('Batched analysis produced different markup')
+    return results
+
+
+def load_articles(path: pathlib.Path | None, count: int) -> list[str]:
+    """
+    Read corpus texts or make synthetic long articles.
+
+    Args:
+        path (pathlib.Path | None): Path to dataset folder, synthetic articles are made if None
+        count (int): Number of articles
+
+    Returns:
+        list[str]: Article texts
+    """
+    if path is not None:
+        raw_files = sorted(path.glob('*_raw.txt'), key=get_article_id_from_filepath)[:count]
+        return [raw_file.read_text(encoding='utf-8') for raw_file in raw_files]
+    return ['\n'.join(f'В {paragraph}-м разделе статьи {index} рассказано о работе лаборатории. '
+                      f'Сотрудники проверили {paragraph * 3} образцов и описали результаты. '
+                      f'Т. е. опыты подтвердили гипотезу, а новые измерения начнутся осенью!'
+                      for paragraph in range(1, 41))
+            for index in range(count)]
+
+
+def read_tokens(documents: list) -> tuple[int, list[tuple[str, str, str]]]:
+    """
+    Get sentences and tokens of CoNLL-U markup.
+
+    Args:
+        documents (list): CoNLL-U markup of analyzed texts
+
+    Returns:
+        tuple[int, list[tuple[str, str, str]]]: Number of sentences and form,
+            lemma and part of speech of every token
+    """
+    sentences = 0
+    tokens = []
+    for line in ''.join(documents).splitlines():
+        if line.startswith('# text'):
+            sentences += 1
+        elif not line.startswith('#') and len(token := line.split('\t')) == 10:
+            tokens.append((token[1], token[2], token[3]))
+    return sentences, tokens
+
+
+def benchmark_segmentation(articles: list[str], chunk_size: int) -> dict[str, dict[str, float]]:
+    """
+    Compare articles split into sentences with a regular expression and segmented by UDPipe.
+
+    There is no gold markup, so the markup of segmented articles is compared with
+    the one of split articles: tokens are aligned by their forms, and parts of speech
+    and lemmas of aligned tokens are checked.
+
+    Args:
+        articles (list[str]): Article texts
+        chunk_size (int): Maximum length of article pieces segmented by UDPipe
+
+    Returns:
+        dict[str, dict[str, float]]: Model calls, sentences and seconds for each way
+            of splitting, and shares of aligned tokens and of matching parts of speech and lemmas
+    """
+    analyzer = UDPipeAnalyzer()
+    results: dict[str, dict[str, float]] = {}
+    tokens: dict[str, list[list[tuple[str, str, str]]]] = {}
+    for mode, split in (('regex', split_by_sentence),
+                        ('udpipe', lambda text: split_into_chunks(text, chunk_size))):
+        results[mode] = {'model_calls': 0, 'sentences': 0, 'seconds': 0.0}
+        tokens[mode] = []
+        for text in articles:
+            texts = split(text)
+            start = perf_counter()
+            documents = analyzer.analyze(texts)
+            results[mode]['seconds'] += perf_counter() - start
+            sentences, article_tokens = read_tokens(documents)
+            results[mode]['model_calls'] += len(texts)
+            results[mode]['sentences'] += sentences
+            tokens[mode].append(article_tokens)
+
+    results['agreement'] = compare_tokens(tokens['regex'], tokens['udpipe'])
+    return results
+
+
+def compare_tokens(reference: list[list[tuple[str, str, str]]],
+                   compared: list[list[tuple[str, str, str]]]) -> dict[str, float]:
+    """
+    Align tokens of two markups of the same articles by their forms and compare them.
+
+    Args:
+        reference (list[list[tuple[str, str, str]]]): Tokens of each article in reference markup
+        compared (list[list[tuple[str, str, str]]]): Tokens of each article in compared markup
+
+    Returns:
+        dict[str, float]: Share of compared tokens aligned with reference ones and shares
+            of aligned tokens with the same part of speech and lemma
+    """
+    aligned = upos = lemmas = 0
+    for reference_tokens, compared_tokens in zip(reference, compared):
+        matcher = difflib.SequenceMatcher(a=[token[0] for token in reference_tokens],
+                                          b=[token[0] for token in compared_tokens],
+                                          autojunk=False)
+        for block in matcher.get_matching_blocks():
+            for reference_token, compared_token in zip(
+                    reference_tokens[block.a:block.a + block.size],
+                    compared_tokens[block.b:block.b + block.size]):
+                aligned += 1
+                lemmas += reference_token[1] == compared_token[1]
+                upos += reference_token[2] == compared_token[2]
+    return {'aligned_tokens': aligned / sum(len(tokens) for tokens in compared),
+            'upos': upos / aligned, 'lemma': lemmas / aligned}
+
+
+def main() -> None:
+    """
+    Entrypoint for pipeline benchmarks.
+    """
+    parser = argparse.ArgumentParser(description='Measures pipeline corpus discovery '
+                                                 'and analysis speed')
+    parser.add_argument('--corpus', type=pathlib.Path,
+                        help='folder with a corpus, a synthetic one is generated if omitted')
+    parser.add_argument('--articles', type=int, default=50000,
+                        help='number of articles in a synthetic corpus, two files each')
+    parser.add_argument('--repeat', type=int, default=3, help='number of measurements')
+    parser.add_argument('--sentences', type=int, default=2000,
+                        help='number of sentences analyzed by UDPipe, taken from --corpus if set')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[16, 256, 1000],
+                        help='numbers of sentences passed through UDPipe at once')
+    parser.add_argument('--n-process', type=int, default=1,
+                        help='number of processes spaCy analyzes batches in')
+    parser.add_argument('--documents', type=int, default=20,
+                        help='number of articles segmented by UDPipe, taken from --corpus if set')
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help='maximum length of article pieces segmented by UDPipe')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus_path = args.corpus
+        if corpus_path is None:
+            corpus_path = pathlib.Path(directory)
+            generate_corpus(corpus_path, args.articles)
+        for mode, seconds in benchmark_corpus_scan(corpus_path, args.repeat).items():
+            print(f'{mode:>14} discovery: {seconds * 1000:.0f} ms')
+        if args.corpus is None:
+            CorpusManifest(corpus_path).manifest_path.unlink(missing_ok=True)
+
+    if not UDPIPE_MODEL_PATH.exists():
+        print(f'UDPipe model is not found at {UDPIPE_MODEL_PATH}, analysis is not measured')
+        return
+    sentences = load_sentences(args.corpus, args.sentences)
+    for mode, speed in benchmark_analysis(sentences, args.batch_sizes, args.n_process).items():
+        print(f'{mode:>14} analysis: {speed:.0f} sentences per second')
+
+    results = benchmark_segmentation(load_articles(args.corpus, args.documents), args.chunk_size)
+    agreement = results.pop('agreement')
+    for mode, timings in results.items():
+        print(f"{mode:>14} segmentation: {timings['model_calls']:.0f} model calls, "
+              f"{timings['sentences']:.0f} sentences, {timings['seconds']:.2f} s")
+    print(f"{'agreement':>14}: {agreement['aligned_tokens']:.1%} tokens aligned, "
+          f"{agreement['upos']:.1%} parts of speech and {agreement['lemma']:.1%} lemmas match")
+
+
+if __name__ == "__main__":
+    main()
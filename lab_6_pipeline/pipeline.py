@@ -2,7 +2,15 @@
 Pipeline for CONLL-U formatting.
 """
 # pylint: disable=too-few-public-methods, unused-import, undefined-variable, too-many-nested-blocks
+# pylint: disable=too-many-arguments
+import hashlib
+import json
+import os
 import pathlib
+import pickle
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable, Iterator
 
 import spacy_udpipe
 
@@ -14,8 +22,8 @@ except ImportError:  # pragma: no cover
 
 from core_utils.article.article import (Article, ArtifactType, get_article_id_from_filepath,
                                         split_by_sentence)
-from core_utils.article.io import from_raw, to_cleaned
-from core_utils.constants import ASSETS_PATH, UDPIPE_MODEL_PATH
+from core_utils.article.io import ArticleTextCache, from_raw, LazyArticle, to_cleaned
+from core_utils.constants import ASSETS_PATH, CORPUS_MANIFESTS_PATH, UDPIPE_MODEL_PATH
 from core_utils.pipeline import (AbstractCoNLLUAnalyzer, CoNLLUDocument, LibraryWrapper,
                                  PipelineProtocol, StanzaDocument, TreeNode)
 
@@ -38,20 +46,192 @@ class EmptyFileError(Exception):
     """
 
 
+#: Name endings of dataset files after the article id and kinds of files they mark
+DATASET_FILE_KINDS = {
+    'raw.txt': 'raw',
+    'meta.json': 'meta',
+    f'{ArtifactType.CLEANED.value}.txt': ArtifactType.CLEANED.value,
+    f'{ArtifactType.UDPIPE_CONLLU.value}.conllu': ArtifactType.UDPIPE_CONLLU.value,
+    f'{ArtifactType.STANZA_CONLLU.value}.conllu': ArtifactType.STANZA_CONLLU.value,
+}
+_NAME_ENDINGS = {kind: name_ending for name_ending, kind in DATASET_FILE_KINDS.items()}
+
+
+@dataclass(slots=True)
+class DatasetFile:
+    """
+    File of a dataset entry found by a directory scan.
+    """
+
+    #: Path to the file, kept as a string since building a pathlib.Path for
+    #: every file of a large corpus costs more than the scan itself
+    path: str
+    #: Size of the file in bytes
+    size: int
+    #: Modification time of the file in nanoseconds
+    mtime_ns: int
+    #: SHA-1 of the file content, known only for files recorded in a corpus manifest
+    sha1: str | None = None
+
+
+def index_dataset(path: pathlib.Path) -> dict[int, dict[str, DatasetFile]]:
+    """
+    Find dataset files with a single directory scan.
+
+    Files that are not named as dataset files are skipped.
+
+    Args:
+        path (pathlib.Path): Path to dataset folder
+
+    Returns:
+        dict[int, dict[str, DatasetFile]]: Files of each article id by their kinds
+
+    Raises:
+        EmptyDirectoryError: The folder has no files except hidden ones
+    """
+    index: dict[int, dict[str, DatasetFile]] = {}
+    is_empty = True
+    with os.scandir(path) as entries:
+        for entry in entries:
+            is_empty = is_empty and entry.name.startswith('.')
+            article_id, _, name_ending = entry.name.partition('_')
+            kind = DATASET_FILE_KINDS.get(name_ending)
+            if kind is None or not (article_id.isascii() and article_id.isdigit()):
+                continue
+            stat = entry.stat()
+            index.setdefault(int(article_id), {})[kind] = DatasetFile(
+                entry.path, stat.st_size, stat.st_mtime_ns)
+    if is_empty:
+        raise EmptyDirectoryError
+    return index
+
+
+class CorpusManifest:
+    """
+    Record of dataset files stored outside the dataset folder.
+
+    The manifest keeps article ids, sizes, modification times and content
+    hashes of dataset files in columns by kind of the files, so the files of
+    a corpus are known without listing the folder. Manifests of all corpora
+    live in one folder, named after a hash of the dataset folder path, so
+    the dataset folder holds nothing but articles and its modification time
+    changes only when files are added, removed or renamed there. While that
+    time is the recorded one, the manifest is trusted as is, so files edited
+    in place are only noticed by update.
+    """
+
+    def __init__(self, path: pathlib.Path, manifests_path: pathlib.Path | None = None) -> None:
+        """
+        Initialize an instance of the CorpusManifest class.
+
+        Args:
+            path (pathlib.Path): Path to dataset folder
+            manifests_path (pathlib.Path | None): Folder keeping manifests of corpora,
+                CORPUS_MANIFESTS_PATH if None
+        """
+        self.path = path
+        folder_hash = hashlib.md5(str(path.resolve()).encode('utf-8'),
+                                  usedforsecurity=False).hexdigest()
+        self.manifest_path = (manifests_path or CORPUS_MANIFESTS_PATH) / f'{folder_hash}.json'
+        self._columns: dict[str, dict[str, list]] = {}
+        self._directory_mtime_ns: int | None = None
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+            self._columns = manifest['files']
+            self._directory_mtime_ns = manifest['directory_mtime_ns']
+
+    def load(self) -> dict[int, dict[str, DatasetFile]] | None:
+        """
+        Get recorded dataset files if the folder has not changed since the recording.
+
+        Returns:
+            dict[int, dict[str, DatasetFile]] | None: Files of each article id by their kinds,
+                None if there is no manifest or it is outdated
+        """
+        if self._directory_mtime_ns != os.stat(self.path).st_mtime_ns:
+            return None
+        prefix = os.path.join(self.path, '')
+        index: dict[int, dict[str, DatasetFile]] = {}
+        for kind, columns in self._columns.items():
+            name_ending = _NAME_ENDINGS[kind]
+            for article_id, size, mtime_ns, sha1 in zip(columns['ids'], columns['sizes'],
+                                                        columns['mtimes_ns'], columns['sha1']):
+                index.setdefault(article_id, {})[kind] = DatasetFile(
+                    f'{prefix}{article_id}_{name_ending}', size, mtime_ns, sha1)
+        return index
+
+    def update(self) -> dict[int, dict[str, DatasetFile]]:
+        """
+        Scan the dataset folder and record its files.
+
+        Only files that are new or whose size or modification time differ
+        from the recorded ones are hashed.
+
+        Returns:
+            dict[int, dict[str, DatasetFile]]: Files of each article id by their kinds
+        """
+        recorded = {
+            (article_id, kind): (size, mtime_ns, sha1)
+            for kind, columns in self._columns.items()
+            for article_id, size, mtime_ns, sha1 in zip(columns['ids'], columns['sizes'],
+                                                        columns['mtimes_ns'], columns['sha1'])
+        }
+        directory_mtime_ns = os.stat(self.path).st_mtime_ns
+        index = index_dataset(self.path)
+
+        self._columns = {}
+        for article_id in sorted(index):
+            for kind, file in index[article_id].items():
+                size, mtime_ns, sha1 = recorded.get((article_id, kind), (None, None, None))
+                if (size, mtime_ns) == (file.size, file.mtime_ns):
+                    file.sha1 = sha1
+                else:
+                    with open(file.path, 'rb') as dataset_file:
+                        file.sha1 = hashlib.sha1(dataset_file.read()).hexdigest()
+                columns = self._columns.setdefault(
+                    kind, {'ids': [], 'sizes': [], 'mtimes_ns': [], 'sha1': []})
+                columns['ids'].append(article_id)
+                columns['sizes'].append(file.size)
+                columns['mtimes_ns'].append(file.mtime_ns)
+                columns['sha1'].append(file.sha1)
+        self._directory_mtime_ns = directory_mtime_ns
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(f'{self.manifest_path.name}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump({'directory_mtime_ns': directory_mtime_ns, 'files': self._columns},
+                      manifest_file, separators=(',', ':'))
+        tmp_path.replace(self.manifest_path)
+        return index
+
+
 class CorpusManager:
     """
     Work with articles and store them.
     """
 
-    def __init__(self, path_to_raw_txt_data: pathlib.Path) -> None:
+    def __init__(self, path_to_raw_txt_data: pathlib.Path, lazy: bool = False,
+                 cache_size: int | None = None, use_manifest: bool = False) -> None:
         """
         Initialize an instance of the CorpusManager class.
 
         Args:
             path_to_raw_txt_data (pathlib.Path): Path to raw txt data
+            lazy (bool): Whether articles read their files on first access
+                instead of all texts being loaded up front
+            cache_size (int | None): Number of texts lazy articles keep in memory,
+                unlimited if None
+            use_manifest (bool): Whether dataset files are taken from a manifest
+                kept in CORPUS_MANIFESTS_PATH instead of scanning the folder on every start
         """
         self.path_to_raw_txt_data = path_to_raw_txt_data
         self._storage = {}
+        self._lazy = lazy
+        self._text_cache = ArticleTextCache(cache_size) if lazy and cache_size else None
+        self._index: dict[int, dict[str, DatasetFile]] = {}
+        self._manifest: CorpusManifest | None = None
+        self._use_manifest = use_manifest
 
         self._validate_dataset()
         self._scan_dataset()
@@ -66,30 +246,34 @@ class CorpusManager:
         if not self.path_to_raw_txt_data.is_dir():
             raise NotADirectoryError
 
-        if not list(self.path_to_raw_txt_data.iterdir()):
-            raise EmptyDirectoryError
+        if self._use_manifest:
+            self._manifest = CorpusManifest(self.path_to_raw_txt_data)
+            self._index = self._manifest.load() or self._manifest.update()
+        else:
+            self._index = index_dataset(self.path_to_raw_txt_data)
 
-        raw_files = list(self.path_to_raw_txt_data.glob('*_raw.txt'))
-        meta_files = list(self.path_to_raw_txt_data.glob('*_meta.json'))
-        if len(meta_files) != len(raw_files):
+        raw_ids = {article_id for article_id, files in self._index.items() if 'raw' in files}
+        meta_ids = {article_id for article_id, files in self._index.items() if 'meta' in files}
+        if raw_ids != meta_ids or raw_ids != set(range(1, len(raw_ids) + 1)):
             raise InconsistentDatasetError
 
-        sorted_raw_files = sorted(raw_files, key=lambda file: get_article_id_from_filepath(file))
-        sorted_meta_files = sorted(meta_files, key=lambda file: get_article_id_from_filepath(file))
-
-        for index, (raw_file, meta_file) in enumerate(zip(sorted_raw_files, sorted_meta_files)):
-            if (index + 1 != get_article_id_from_filepath(raw_file) or index + 1 != get_article_id_from_filepath(
-                    meta_file)
-                    or raw_file.stat().st_size == 0 or meta_file.stat().st_size == 0):
+        for article_id in raw_ids:
+            if not self._index[article_id]['raw'].size or not self._index[article_id]['meta'].size:
                 raise InconsistentDatasetError
 
     def _scan_dataset(self) -> None:
         """
         Register each dataset entry.
         """
-        for file in list(self.path_to_raw_txt_data.glob("*_raw.txt")):
-            index = get_article_id_from_filepath(file)
-            self._storage[index] = from_raw(file, Article(None, index))
+        for index in sorted(self._index):
+            raw_file = self._index[index].get('raw')
+            if raw_file is None:
+                continue
+            if self._lazy:
+                self._storage[index] = LazyArticle(
+                    index, raw_file.path, self._index[index]['meta'].path, self._text_cache)
+            else:
+                self._storage[index] = from_raw(raw_file.path, Article(None, index))
 
     def get_articles(self) -> dict:
         """
@@ -100,6 +284,100 @@ class CorpusManager:
         """
         return self._storage
 
+    def get_index(self) -> dict[int, dict[str, DatasetFile]]:
+        """
+        Get dataset files found when the corpus was opened.
+
+        Returns:
+            dict[int, dict[str, DatasetFile]]: Files of each article id by their kinds
+        """
+        return self._index
+
+    def update_manifest(self) -> None:
+        """
+        Record current dataset files, e.g. after artifacts of articles are written.
+        """
+        if self._manifest is not None:
+            self._index = self._manifest.update()
+
+
+#: Analyzer of a worker process of a parallel text processing pipeline
+_worker_state: dict[str, LibraryWrapper] = {}
+
+
+def _init_worker_analyzer(pickled_analyzer: bytes) -> None:
+    """
+    Restore the analyzer in a worker process and keep it for all its articles.
+
+    The analyzer is passed pickled even to forked workers, so each of them
+    bootstraps its own model instead of using a copy of the parent's one.
+
+    Args:
+        pickled_analyzer (bytes): Analyzer bootstrapped in the worker process when unpickled
+    """
+    _worker_state['analyzer'] = pickle.loads(pickled_analyzer)
+
+
+def split_into_chunks(text: str, chunk_size: int) -> list[str]:
+    """
+    Split text into pieces of whole paragraphs to be segmented into sentences by an analyzer.
+
+    Paragraphs are separated by empty lines in pieces, so that an analyzer does
+    not join the last sentence of a paragraph with the first one of the next.
+
+    Args:
+        text (str): Text to split
+        chunk_size (int): Maximum length of a piece, a longer paragraph makes a piece of its own
+
+    Returns:
+        list[str]: Pieces of text
+    """
+    chunks: list[str] = []
+    paragraphs: list[str] = []
+    length = 0
+    for paragraph in text.split('\n'):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if paragraphs and length + len(paragraph) > chunk_size:
+            chunks.append('\n\n'.join(paragraphs))
+            paragraphs, length = [], 0
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    if paragraphs:
+        chunks.append('\n\n'.join(paragraphs))
+    return chunks
+
+
+def _split_for_analysis(text: str, chunk_size: int | None) -> list[str]:
+    """
+    Split text into sentences or into pieces an analyzer segments itself.
+
+    Args:
+        text (str): Article text
+        chunk_size (int | None): Maximum length of a piece, text is split into sentences if None
+
+    Returns:
+        list[str]: Texts to analyze
+    """
+    if chunk_size is None:
+        return split_by_sentence(text)
+    return split_into_chunks(text, chunk_size)
+
+
+def _analyze_text(text: str, chunk_size: int | None) -> list[StanzaDocument | str]:
+    """
+    Split text and analyze it with the analyzer of the worker process.
+
+    Args:
+        text (str): Article text
+        chunk_size (int | None): Maximum length of a piece, text is split into sentences if None
+
+    Returns:
+        list[StanzaDocument | str]: List of documents
+    """
+    return _worker_state['analyzer'].analyze(_split_for_analysis(text, chunk_size))
+
 
 class TextProcessingPipeline(PipelineProtocol):
     """
@@ -107,7 +385,8 @@ class TextProcessingPipeline(PipelineProtocol):
     """
 
     def __init__(
-        self, corpus_manager: CorpusManager, analyzer: LibraryWrapper | None = None
+        self, corpus_manager: CorpusManager, analyzer: LibraryWrapper | None = None,
+        workers: int = 1, ordered: bool = True, chunk_size: int | None = None
     ) -> None:
         """
         Initialize an instance of the TextProcessingPipeline class.
@@ -115,22 +394,96 @@ class TextProcessingPipeline(PipelineProtocol):
         Args:
             corpus_manager (CorpusManager): CorpusManager instance
             analyzer (LibraryWrapper | None): Analyzer instance
+            workers (int): Number of processes analyzing articles,
+                articles are analyzed in the current process if 1
+            ordered (bool): Whether annotations are written in the order of articles
+                instead of as soon as they are ready
+            chunk_size (int | None): Maximum length of article pieces the analyzer
+                segments into sentences itself, articles are split into sentences with
+                a regular expression if None; a piece is never shorter than a paragraph
         """
         self._corpus_manager = corpus_manager
         self._analyzer = analyzer
+        self._workers = workers
+        self._ordered = ordered
+        self._chunk_size = chunk_size
 
     def run(self) -> None:
         """
         Perform basic preprocessing and write processed text to files.
         """
         articles = self._corpus_manager.get_articles().values()
+        if not self._analyzer:
+            for article in articles:
+                to_cleaned(article)
+            return
+
+        analyzed_articles = (self._analyze_in_processes(articles) if self._workers > 1
+                             else self._analyze(articles))
+        for article, analyzed_texts in analyzed_articles:
+            article.set_conllu_info(analyzed_texts)
+            self._analyzer.to_conllu(article)
+
+    def _analyze(self, articles: Iterable[Article]) -> Iterator[tuple[Article, list]]:
+        """
+        Clean and analyze articles one by one.
+
+        Args:
+            articles (Iterable[Article]): Articles to process
+
+        Yields:
+            tuple[Article, list]: Article and its analyzed sentences
+        """
         for article in articles:
             to_cleaned(article)
-            if self._analyzer:
-                texts_articles = split_by_sentence(article.text)
-                analyzed_texts = self._analyzer.analyze(texts_articles)
-                article.set_conllu_info(analyzed_texts)
-                self._analyzer.to_conllu(article)
+            texts_articles = _split_for_analysis(article.text, self._chunk_size)
+            yield article, self._analyzer.analyze(texts_articles)
+
+    def _analyze_in_processes(self, articles: Iterable[Article]
+                              ) -> Iterator[tuple[Article, list]]:
+        """
+        Clean articles and analyze them in worker processes.
+
+        Every worker gets a copy of the analyzer once, when it starts, and
+        analyzes texts of the articles it takes one after another. Only a few
+        articles per worker are in flight, so texts of a lazily loaded corpus
+        are not all read into memory at once.
+
+        Args:
+            articles (Iterable[Article]): Articles to process
+
+        Yields:
+            tuple[Article, list]: Article and its analyzed sentences
+        """
+        futures: dict[Future, Article] = {}
+        with ProcessPoolExecutor(max_workers=self._workers, initializer=_init_worker_analyzer,
+                                 initargs=(pickle.dumps(self._analyzer),)) as pool:
+            for article in articles:
+                to_cleaned(article)
+                futures[pool.submit(_analyze_text, article.text, self._chunk_size)] = article
+                yield from self._collect_analyzed(futures, keep=self._workers * 4)
+            yield from self._collect_analyzed(futures, keep=0)
+
+    def _collect_analyzed(self, futures: dict[Future, Article],
+                          keep: int) -> Iterator[tuple[Article, list]]:
+        """
+        Wait for articles analyzed in worker processes until only a given number is left.
+
+        Args:
+            futures (dict[Future, Article]): Analyzed articles by their futures,
+                in the order of articles
+            keep (int): Number of articles that may stay in flight
+
+        Yields:
+            tuple[Article, list]: Article and its analyzed sentences
+        """
+        while len(futures) > keep:
+            if self._ordered:
+                done = set(list(futures)[:1])
+            else:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield futures.pop(future), future.result()
 
 
 class UDPipeAnalyzer(LibraryWrapper):
@@ -140,10 +493,42 @@ class UDPipeAnalyzer(LibraryWrapper):
 
     _analyzer: AbstractCoNLLUAnalyzer
 
-    def __init__(self) -> None:
+    def __init__(self, batch_size: int = 256, n_process: int = 1, lazy: bool = False) -> None:
         """
         Initialize an instance of the UDPipeAnalyzer class.
+
+        Args:
+            batch_size (int): Number of texts passed through the model at once
+            n_process (int): Number of processes spaCy analyzes texts in
+            lazy (bool): Load the model only when texts are first analyzed,
+                so that an analyzer sent to worker processes is not loaded in the parent
+        """
+        self._batch_size = batch_size
+        self._n_process = n_process
+        if not lazy:
+            self._analyzer = self._bootstrap()
+
+    def __getstate__(self) -> dict:
+        """
+        Get analyzer state for sending it to another process.
+
+        The model is not sent, another process loads its own one.
+
+        Returns:
+            dict: Picklable state
+        """
+        state = self.__dict__.copy()
+        state.pop('_analyzer', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore analyzer received from another process.
+
+        Args:
+            state (dict): Picklable state
         """
+        self.__dict__.update(state)
         self._analyzer = self._bootstrap()
 
     def _bootstrap(self) -> AbstractCoNLLUAnalyzer:
@@ -174,13 +559,13 @@ class UDPipeAnalyzer(LibraryWrapper):
         Returns:
             list[StanzaDocument | str]: List of documents
         """
-        documents = []
-        for text in texts:
-            analyzed_text = self._analyzer(text)
-            conllu_annotation = analyzed_text._.conll_str
-            documents.append(conllu_annotation)
-
-        return documents
+        if not hasattr(self, '_analyzer'):
+            self._analyzer = self._bootstrap()
+        # UDPipe itself runs in the tokenizer of the pipeline, so each text still goes
+        # through the model separately, but without the overhead of a pipeline call per text
+        analyzed_texts = self._analyzer.pipe(texts, batch_size=self._batch_size,
+                                             n_process=self._n_process)
+        return [analyzed_text._.conll_str for analyzed_text in analyzed_texts]
 
     def to_conllu(self, article: Article) -> None:
         """
@@ -335,14 +720,19 @@ class PatternSearchPipeline(PipelineProtocol):
         """
 
 
-def main() -> None:
+def main(workers: int = 2) -> None:
     """
     Entrypoint for pipeline module.
+
+    Args:
+        workers (int): Number of processes analyzing articles, each loads its own model
     """
-    corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH)
-    udpipe_analyzer = UDPipeAnalyzer()
-    pipeline = TextProcessingPipeline(corpus_manager, udpipe_analyzer)
+    corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH, lazy=True, cache_size=100,
+                                   use_manifest=True)
+    udpipe_analyzer = UDPipeAnalyzer(lazy=workers > 1)
+    pipeline = TextProcessingPipeline(corpus_manager, udpipe_analyzer, workers=workers)
     pipeline.run()
+    corpus_manager.update_manifest()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+"""
+Tests for the corpus manifest.
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_6_pipeline import pipeline
+from lab_6_pipeline.pipeline import CorpusManager
+
+
+class CorpusManifestTest(unittest.TestCase):
+    """
+    Tests for opening a corpus from its manifest.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusManifestTest class.
+        """
+        self.corpus_path = TEST_PATH / 'articles'
+        self.corpus_path.mkdir(parents=True, exist_ok=True)
+        for article_id in (1, 2):
+            (self.corpus_path / f'{article_id}_raw.txt').write_text(
+                f'Текст статьи {article_id}.', encoding='utf-8')
+            (self.corpus_path / f'{article_id}_meta.json').write_text(
+                f'{{"id": {article_id}}}', encoding='utf-8')
+        (self.corpus_path / '1_cleaned.txt').write_text('текст статьи 1', encoding='utf-8')
+        self.manifests_patch = mock.patch.object(pipeline, 'CORPUS_MANIFESTS_PATH',
+                                                 TEST_PATH / 'manifests')
+        self.manifests_patch.start()
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_unchanged_corpus_is_opened_without_scan(self) -> None:
+        """
+        Ensure the manifest records files and is trusted while the folder is unchanged.
+        """
+        CorpusManager(self.corpus_path, use_manifest=True)
+        self.assertEqual(len(list(self.corpus_path.iterdir())), 5)
+        manifest_paths = list((TEST_PATH / 'manifests').iterdir())
+        self.assertEqual(len(manifest_paths), 1)
+        with open(manifest_paths[0], 'r', encoding='utf-8') as manifest_file:
+            recorded = json.load(manifest_file)['files']
+        self.assertEqual(sorted(recorded), ['cleaned', 'meta', 'raw'])
+        self.assertEqual(recorded['cleaned']['ids'], [1])
+        self.assertEqual(recorded['raw']['sizes'], [len('Текст статьи 1.'.encode('utf-8')),
+                                                    len('Текст статьи 2.'.encode('utf-8'))])
+        self.assertEqual(len(recorded['raw']['sha1'][1]), 40)
+
+        with mock.patch.object(pipeline, 'index_dataset') as index_dataset:
+            corpus_manager = CorpusManager(self.corpus_path, use_manifest=True)
+        index_dataset.assert_not_called()
+        self.assertEqual(corpus_manager.get_articles()[2].text, 'Текст статьи 2.')
+        self.assertEqual(corpus_manager.get_index()[1]['cleaned'].sha1,
+                         recorded['cleaned']['sha1'][0])
+        self.assertEqual(corpus_manager.get_index()[2]['meta'].path,
+                         str(self.corpus_path / '2_meta.json'))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_only_changed_files_are_hashed_again(self) -> None:
+        """
+        Ensure a changed folder is rescanned and recorded hashes of unchanged files are reused.
+        """
+        CorpusManager(self.corpus_path, use_manifest=True)
+        (self.corpus_path / '3_raw.txt').write_text('Текст статьи 3.', encoding='utf-8')
+        (self.corpus_path / '3_meta.json').write_text('{"id": 3}', encoding='utf-8')
+
+        with mock.patch.object(pipeline.hashlib, 'sha1', wraps=pipeline.hashlib.sha1) as sha1:
+            corpus_manager = CorpusManager(self.corpus_path, use_manifest=True)
+        self.assertEqual(sha1.call_count, 2)
+        self.assertEqual(sorted(corpus_manager.get_articles()), [1, 2, 3])
+
+        (self.corpus_path / '1_cleaned.txt').write_text('другой текст', encoding='utf-8')
+        with mock.patch.object(pipeline.hashlib, 'sha1', wraps=pipeline.hashlib.sha1) as sha1:
+            corpus_manager.update_manifest()
+        self.assertEqual(sha1.call_count, 1)
+        self.assertEqual(corpus_manager.get_index()[1]['cleaned'].size,
+                         len('другой текст'.encode('utf-8')))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusManifestTest class.
+        """
+        self.manifests_patch.stop()
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,77 @@
+"""
+Tests for the single-scan dataset index.
+"""
+import shutil
+import unittest
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from lab_6_pipeline.pipeline import (CorpusManager, EmptyDirectoryError, InconsistentDatasetError,
+                                     index_dataset)
+
+
+class DatasetIndexTest(unittest.TestCase):
+    """
+    Tests for finding dataset files with one directory scan.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for DatasetIndexTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        for name, content in (('1_raw.txt', 'Текст.'), ('1_meta.json', '{"id": 1}'),
+                              ('1_cleaned.txt', 'текст'), ('1_udpipe_conllu.conllu', '# 1'),
+                              ('2_raw.txt', 'Текст 2.'), ('2_meta.json', '{"id": 2}'),
+                              ('None.txt', 'x'), ('abc_raw.txt', 'x'), ('1_raw.json', 'x')):
+            (TEST_PATH / name).write_text(content, encoding='utf-8')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_files_are_indexed_by_id_and_kind(self) -> None:
+        """
+        Ensure dataset files are grouped by article and other files are skipped.
+        """
+        index = index_dataset(TEST_PATH)
+        self.assertEqual(sorted(index), [1, 2])
+        self.assertEqual(sorted(index[1]), ['cleaned', 'meta', 'raw', 'udpipe_conllu'])
+        self.assertEqual(index[1]['raw'].path, str(TEST_PATH / '1_raw.txt'))
+        self.assertEqual(index[2]['raw'].size, len('Текст 2.'.encode('utf-8')))
+        self.assertEqual(CorpusManager(TEST_PATH).get_articles()[2].text, 'Текст 2.')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_inconsistent_datasets_are_rejected(self) -> None:
+        """
+        Ensure gaps in ids, empty files and empty folders are still rejected.
+        """
+        (TEST_PATH / '4_raw.txt').write_text('Текст 4.', encoding='utf-8')
+        (TEST_PATH / '4_meta.json').write_text('{"id": 4}', encoding='utf-8')
+        with self.assertRaises(InconsistentDatasetError):
+            CorpusManager(TEST_PATH)
+
+        (TEST_PATH / '4_raw.txt').rename(TEST_PATH / '3_raw.txt')
+        (TEST_PATH / '4_meta.json').rename(TEST_PATH / '3_meta.json')
+        (TEST_PATH / '2_meta.json').write_text('', encoding='utf-8')
+        with self.assertRaises(InconsistentDatasetError):
+            CorpusManager(TEST_PATH)
+
+        shutil.rmtree(TEST_PATH)
+        TEST_PATH.mkdir()
+        with self.assertRaises(EmptyDirectoryError):
+            index_dataset(TEST_PATH)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for DatasetIndexTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
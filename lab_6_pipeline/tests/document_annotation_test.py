@@ -0,0 +1,76 @@
+"""
+Tests for annotating whole articles segmented by the analyzer.
+"""
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.article import article
+from lab_6_pipeline.pipeline import (CorpusManager, split_into_chunks, TextProcessingPipeline,
+                                     UDPipeAnalyzer)
+from lab_6_pipeline.tests.udpipe_batching_test import make_model
+
+
+class DocumentAnnotationTest(unittest.TestCase):
+    """
+    Tests for passing articles to the analyzer in large pieces.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for DocumentAnnotationTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        (TEST_PATH / '1_raw.txt').write_text(
+            'Учёные изучили новый материал. Он оказался прочным.\n\n'
+            'Результаты опубликованы в журнале. Работа продолжится.\n', encoding='utf-8')
+        (TEST_PATH / '1_meta.json').write_text('{"id": 1}', encoding='utf-8')
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_5_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_text_is_split_into_pieces_of_whole_paragraphs(self) -> None:
+        """
+        Ensure paragraphs are grouped up to the chunk size and never cut.
+        """
+        text = 'Первый абзац.\nВторой абзац.\n\n  \nОчень длинный третий абзац текста.\nЧетвёртый.'
+        self.assertEqual(split_into_chunks(text, 30),
+                         ['Первый абзац.\n\nВторой абзац.', 'Очень длинный третий абзац текста.',
+                          'Четвёртый.'])
+        self.assertEqual(split_into_chunks(text, 1000), ['\n\n'.join(
+            ['Первый абзац.', 'Второй абзац.', 'Очень длинный третий абзац текста.',
+             'Четвёртый.'])])
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_5_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_analyzer_segments_whole_article(self) -> None:
+        """
+        Ensure a whole article is analyzed in one call and segmented by the analyzer.
+        """
+        model = make_model()
+        with mock.patch.object(UDPipeAnalyzer, '_bootstrap', return_value=model):
+            analyzer = UDPipeAnalyzer()
+        corpus_manager = CorpusManager(TEST_PATH)
+        with mock.patch.object(model, 'pipe', wraps=model.pipe) as pipe:
+            TextProcessingPipeline(corpus_manager, analyzer, chunk_size=10000).run()
+        self.assertEqual(len(pipe.call_args.args[0]), 1)
+
+        conllu = (TEST_PATH / '1_udpipe_conllu.conllu').read_text(encoding='utf-8')
+        self.assertEqual([line for line in conllu.splitlines() if line.startswith('# sent_id')],
+                         [f'# sent_id = {sent_id}' for sent_id in range(1, 5)])
+        self.assertIn('Результаты опубликованы в журнале.', conllu)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for DocumentAnnotationTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
@@ -0,0 +1,89 @@
+"""
+Tests for lazy loading of articles by CorpusManager.
+"""
+import json
+import shutil
+import unittest
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.article.article import Article
+from core_utils.article.io import ArticleTextCache, LazyArticle
+from lab_6_pipeline.pipeline import CorpusManager
+
+
+class LazyCorpusManagerTest(unittest.TestCase):
+    """
+    Tests for articles read on first access.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for LazyCorpusManagerTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        for article_id in (1, 2, 3):
+            (TEST_PATH / f'{article_id}_raw.txt').write_text(f'Текст статьи {article_id}.',
+                                                             encoding='utf-8')
+            with open(TEST_PATH / f'{article_id}_meta.json', 'w', encoding='utf-8') as meta_file:
+                json.dump({'id': article_id, 'url': f'https://www.nkj.ru/news/{article_id}/',
+                           'title': f'Статья {article_id}', 'date': None, 'author': ['Иванов'],
+                           'topics': [], 'pos_frequencies': {}}, meta_file)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_text_and_meta_are_read_on_first_access(self) -> None:
+        """
+        Ensure lazy articles are Articles whose files are read when they are first needed.
+        """
+        articles = CorpusManager(TEST_PATH, lazy=True).get_articles()
+        self.assertEqual(sorted(articles), [1, 2, 3])
+        self.assertTrue(all(isinstance(article, Article) for article in articles.values()))
+
+        (TEST_PATH / '1_raw.txt').write_text('Изменённый текст.', encoding='utf-8')
+        self.assertEqual(articles[1].text, 'Изменённый текст.')
+        self.assertNotIn('title', vars(articles[2]))
+        self.assertEqual(articles[2].title, 'Статья 2')
+        self.assertEqual(articles[2].get_meta()['url'], 'https://www.nkj.ru/news/2/')
+        self.assertEqual(articles[3].get_cleaned_text(), 'текст статьи 3')
+
+        articles[3].text = 'Другой текст.'
+        self.assertEqual(articles[3].get_raw_text(), 'Другой текст.')
+        with self.assertRaises(AttributeError):
+            getattr(articles[3], 'unknown')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_cache_keeps_only_recently_used_texts(self) -> None:
+        """
+        Ensure cached texts are bounded and the least recently used one is evicted.
+        """
+        cache = ArticleTextCache(max_size=2)
+        articles = [LazyArticle(article_id, TEST_PATH / f'{article_id}_raw.txt', cache=cache)
+                    for article_id in (1, 2, 3)]
+        self.assertEqual(articles[0].text, 'Текст статьи 1.')
+        self.assertEqual(articles[1].text, 'Текст статьи 2.')
+        self.assertEqual(articles[0].text, 'Текст статьи 1.')
+        self.assertEqual(articles[2].text, 'Текст статьи 3.')
+        self.assertEqual(len(cache), 2)
+
+        (TEST_PATH / '1_raw.txt').write_text('Изменённый текст.', encoding='utf-8')
+        (TEST_PATH / '2_raw.txt').write_text('Изменённый текст.', encoding='utf-8')
+        self.assertEqual(articles[0].text, 'Текст статьи 1.')
+        self.assertEqual(articles[1].text, 'Изменённый текст.')
+        self.assertEqual(articles[0].title, '')
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for LazyCorpusManagerTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
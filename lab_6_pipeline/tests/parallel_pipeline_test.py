@@ -0,0 +1,130 @@
+"""
+Tests for running TextProcessingPipeline in worker processes.
+"""
+import os
+import shutil
+import unittest
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.pipeline import StanzaDocument
+from lab_6_pipeline.pipeline import CorpusManager, TextProcessingPipeline
+
+
+class CountingAnalyzer:
+    """
+    Analyzer that marks sentences with the process and the number of its bootstraps.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the CountingAnalyzer class.
+        """
+        self.bootstraps = 0
+        self._analyzer = self._bootstrap()
+
+    def __getstate__(self) -> dict:
+        """
+        Get analyzer state for sending it to another process.
+
+        Returns:
+            dict: Picklable state
+        """
+        return {'bootstraps': self.bootstraps}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore analyzer received from another process.
+
+        Args:
+            state (dict): Picklable state
+        """
+        self.__dict__.update(state)
+        self._analyzer = self._bootstrap()
+
+    def _bootstrap(self) -> str:
+        """
+        Count bootstraps.
+
+        Returns:
+            str: Model stand-in
+        """
+        self.bootstraps += 1
+        return 'model'
+
+    def analyze(self, texts: list[str]) -> list[StanzaDocument | str]:
+        """
+        Mark sentences.
+
+        Args:
+            texts (list[str]): Sentences
+
+        Returns:
+            list[StanzaDocument | str]: Marked sentences
+        """
+        return [f'{os.getpid()} {self.bootstraps} {text}\n' for text in texts]
+
+    def to_conllu(self, article_to_save: Article) -> None:
+        """
+        Write marked sentences.
+
+        Args:
+            article_to_save (Article): Article to save
+        """
+        article_to_save.get_file_path(ArtifactType.UDPIPE_CONLLU).write_text(
+            ''.join(article_to_save.get_conllu_info()), encoding='utf-8')
+
+
+class ParallelPipelineTest(unittest.TestCase):
+    """
+    Tests for analyzing articles in worker processes.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ParallelPipelineTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        for article_id in range(1, 9):
+            (TEST_PATH / f'{article_id}_raw.txt').write_text(
+                f'Первое предложение статьи {article_id}. Второе предложение статьи {article_id}.',
+                encoding='utf-8')
+            (TEST_PATH / f'{article_id}_meta.json').write_text(f'{{"id": {article_id}}}',
+                                                               encoding='utf-8')
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_admin_data_processing
+    @pytest.mark.lab_6_pipeline
+    def test_workers_analyze_articles_with_their_own_analyzers(self) -> None:
+        """
+        Ensure every article is analyzed in a worker that bootstrapped its analyzer once.
+        """
+        for ordered in (True, False):
+            corpus_manager = CorpusManager(TEST_PATH, lazy=True, cache_size=2)
+            TextProcessingPipeline(corpus_manager, CountingAnalyzer(), workers=2,
+                                   ordered=ordered).run()
+            processes = set()
+            for article_id in range(1, 9):
+                lines = (TEST_PATH / f'{article_id}_udpipe_conllu.conllu').read_text(
+                    encoding='utf-8').splitlines()
+                self.assertEqual([line.split(' ', 2)[2] for line in lines],
+                                 [f'Первое предложение статьи {article_id}.',
+                                  f'Второе предложение статьи {article_id}.'])
+                self.assertEqual({line.split(' ')[1] for line in lines}, {'2'})
+                processes.update(line.split(' ')[0] for line in lines)
+                self.assertTrue((TEST_PATH / f'{article_id}_cleaned.txt').exists())
+            self.assertNotIn(str(os.getpid()), processes)
+            self.assertLessEqual(len(processes), 2)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ParallelPipelineTest class.
+        """
+        shutil.rmtree(TEST_PATH, ignore_errors=True)
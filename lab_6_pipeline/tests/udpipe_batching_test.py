@@ -0,0 +1,66 @@
+"""
+Tests for batched analysis in UDPipeAnalyzer.
+"""
+import unittest
+from unittest import mock
+
+import pytest
+import spacy
+
+from lab_6_pipeline.pipeline import UDPipeAnalyzer
+
+
+def make_model() -> spacy.Language:
+    """
+    Make a lightweight stand-in for the UDPipe pipeline with the same CoNLL-U formatter.
+
+    Returns:
+        spacy.Language: Pipeline
+    """
+    model = spacy.blank('ru')
+    model.add_pipe('sentencizer')
+    model.add_pipe('conll_formatter', last=True,
+                   config={'conversion_maps': {'XPOS': {'': '_'}}, 'include_headers': True})
+    return model
+
+
+class UDPipeBatchingTest(unittest.TestCase):
+    """
+    Tests for analyzing texts in batches.
+    """
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_5_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_batched_analysis_matches_analysis_of_single_texts(self) -> None:
+        """
+        Ensure texts analyzed in batches get the same markup as texts analyzed one by one.
+        """
+        texts = ['Мама мыла раму.', 'Папа читал газету.', 'Кот спал на окне.']
+        model = make_model()
+        with mock.patch.object(UDPipeAnalyzer, '_bootstrap', return_value=model):
+            analyzer = UDPipeAnalyzer(batch_size=2)
+        with mock.patch.object(model, 'pipe', wraps=model.pipe) as pipe:
+            documents = analyzer.analyze(texts)
+        pipe.assert_called_once_with(texts, batch_size=2, n_process=1)
+        self.assertEqual(documents, [model(text)._.conll_str for text in texts])
+        self.assertIn('# text = Папа читал газету.', documents[1])
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_5_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_lazy_analyzer_loads_model_on_first_analysis_only(self) -> None:
+        """
+        Ensure a lazy analyzer loads the model when texts are first analyzed, but not before.
+        """
+        model = make_model()
+        with mock.patch.object(UDPipeAnalyzer, '_bootstrap', return_value=model) as bootstrap:
+            analyzer = UDPipeAnalyzer(lazy=True)
+            bootstrap.assert_not_called()
+            analyzer.analyze(['Мама мыла раму.'])
+            analyzer.analyze(['Папа читал газету.'])
+        bootstrap.assert_called_once_with()